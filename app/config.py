@@ -35,6 +35,12 @@ class Settings:
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./data/assistant.db")
 
+    # 로컬 데이터 디렉터리 (종목 목록 등 캐시 파일)
+    DATA_DIR: str = os.getenv("DATA_DIR", "./data")
+
+    # 미국 종목 목록 가져오기 파일 (NASDAQ Trader 목록 또는 symbol,name CSV)
+    US_TICKER_IMPORT_FILE: str = os.getenv("US_TICKER_IMPORT_FILE", "")
+
     # App
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-this")
     DEBUG: bool = os.getenv("DEBUG", "True").lower() == "true"
@@ -47,6 +53,83 @@ class Settings:
     )
     SESSION_MAX_AGE: int = int(os.getenv("SESSION_MAX_AGE", "86400"))  # 24시간
 
+    # Finance - 시세 캐시 (초 단위)
+    QUOTE_CACHE_TTL: int = int(os.getenv("QUOTE_CACHE_TTL", "60"))  # 장중
+    QUOTE_CACHE_CLOSED_TTL: int = int(os.getenv("QUOTE_CACHE_CLOSED_TTL", "1800"))  # 장 마감 후
+    QUOTE_CACHE_MAX_SIZE: int = int(os.getenv("QUOTE_CACHE_MAX_SIZE", "512"))
+
+    # Finance - 시세 조회 스레드 풀 (공용 풀 크기 / 제공자별 전용 풀 크기 = 동시 호출 수)
+    MARKET_DATA_MAX_WORKERS: int = int(os.getenv("MARKET_DATA_MAX_WORKERS", "8"))
+    MARKET_DATA_YAHOO_CONCURRENCY: int = int(os.getenv("MARKET_DATA_YAHOO_CONCURRENCY", "4"))
+    MARKET_DATA_KRX_CONCURRENCY: int = int(os.getenv("MARKET_DATA_KRX_CONCURRENCY", "2"))
+    MARKET_DATA_REQUEST_TIMEOUT: float = float(os.getenv("MARKET_DATA_REQUEST_TIMEOUT", "10"))  # yfinance 요청 제한 시간
+
+    # Finance - 증시 리포트 관심 종목 조회 (최대 종목 수 0이면 제한 없음)
+    FINANCE_REPORT_MAX_SYMBOLS: int = int(os.getenv("FINANCE_REPORT_MAX_SYMBOLS", "100"))
+    FINANCE_REPORT_CONCURRENCY: int = int(os.getenv("FINANCE_REPORT_CONCURRENCY", "8"))
+    FINANCE_REPORT_SYMBOL_TIMEOUT: float = float(os.getenv("FINANCE_REPORT_SYMBOL_TIMEOUT", "20"))
+
+    # Finance - 가격 알림 다이제스트 (finance 설정 config_json의 alert_digest로 사용자별 변경 가능)
+    FINANCE_ALERT_DIGEST: bool = os.getenv("FINANCE_ALERT_DIGEST", "false").lower() == "true"
+    FINANCE_ALERT_DIGEST_WINDOW_MINUTES: int = int(os.getenv("FINANCE_ALERT_DIGEST_WINDOW_MINUTES", "0"))
+    FINANCE_ALERT_DIGEST_MAX_LENGTH: int = int(os.getenv("FINANCE_ALERT_DIGEST_MAX_LENGTH", "3500"))
+
+    # Finance - 임시 휴장일 (쉼표로 구분한 YYYY-MM-DD, 공휴일/명절은 거래 캘린더에 내장)
+    KRX_EXTRA_HOLIDAYS: str = os.getenv("KRX_EXTRA_HOLIDAYS", "")
+    NYSE_EXTRA_HOLIDAYS: str = os.getenv("NYSE_EXTRA_HOLIDAYS", "")
+
+    # Finance - 가격 알림 체크 주기 (분: 변동성 미확인 종목 기본 / 최소(개장·폐장 부근 포함) / 최대, 개장·폐장 부근 구간 길이)
+    # 체크 Job은 최소 주기로 실행되고, 장이 열린 시장의 종목 중 다음 조회 시각이 된 종목만 조회
+    FINANCE_ALERT_CHECK_INTERVAL_MINUTES: int = int(os.getenv("FINANCE_ALERT_CHECK_INTERVAL_MINUTES", "5"))
+    FINANCE_ALERT_CHECK_FAST_INTERVAL_MINUTES: int = int(os.getenv("FINANCE_ALERT_CHECK_FAST_INTERVAL_MINUTES", "1"))
+    FINANCE_ALERT_CHECK_MAX_INTERVAL_MINUTES: int = int(os.getenv("FINANCE_ALERT_CHECK_MAX_INTERVAL_MINUTES", "30"))
+    FINANCE_ALERT_CHECK_FAST_WINDOW_MINUTES: int = int(os.getenv("FINANCE_ALERT_CHECK_FAST_WINDOW_MINUTES", "30"))
+    # 종목별 조회 주기: 임계가까지 거리가 최근 변동성의 몇 배(표준편차)일 때까지 조회를 미룰지
+    FINANCE_ALERT_CHECK_SAFETY_FACTOR: float = float(os.getenv("FINANCE_ALERT_CHECK_SAFETY_FACTOR", "3"))
+
+    # Finance - 실시간 시세 스트림 (SOURCE: websocket / replay, 비어 있으면 주기 체크만 사용)
+    # URL: websocket이면 ws(s):// 주소, replay면 JSON Lines 시세 파일 경로
+    QUOTE_STREAM_SOURCE: str = os.getenv("QUOTE_STREAM_SOURCE", "").lower()
+    QUOTE_STREAM_URL: str = os.getenv("QUOTE_STREAM_URL", "")
+    # 마지막 수신 후 이 시간(초)이 지나면 스트림 중단으로 보고 주기 체크로 대체
+    QUOTE_STREAM_STALE_SECONDS: int = int(os.getenv("QUOTE_STREAM_STALE_SECONDS", "60"))
+    # 구독 종목 변경 확인 주기 / 재연결 최대 대기 시간 (초)
+    QUOTE_STREAM_RESUBSCRIBE_SECONDS: int = int(os.getenv("QUOTE_STREAM_RESUBSCRIBE_SECONDS", "30"))
+    QUOTE_STREAM_MAX_BACKOFF_SECONDS: int = int(os.getenv("QUOTE_STREAM_MAX_BACKOFF_SECONDS", "60"))
+
+    # Notification - 채널별 발송 제한 시간 (초)
+    NOTIFICATION_CHANNEL_TIMEOUT: float = float(os.getenv("NOTIFICATION_CHANNEL_TIMEOUT", "15"))
+
+    # Notification - 채널별 발송 속도 제한 (토큰 버킷: 초당 발송 수 / 최대 연속 발송 수)
+    TELEGRAM_RATE_PER_SECOND: float = float(os.getenv("TELEGRAM_RATE_PER_SECOND", "25"))
+    TELEGRAM_RATE_BURST: float = float(os.getenv("TELEGRAM_RATE_BURST", "25"))
+    TELEGRAM_CHAT_RATE_PER_SECOND: float = float(os.getenv("TELEGRAM_CHAT_RATE_PER_SECOND", "1"))
+    TELEGRAM_CHAT_RATE_BURST: float = float(os.getenv("TELEGRAM_CHAT_RATE_BURST", "3"))
+    KAKAO_RATE_PER_SECOND: float = float(os.getenv("KAKAO_RATE_PER_SECOND", "5"))
+    KAKAO_RATE_BURST: float = float(os.getenv("KAKAO_RATE_BURST", "5"))
+    KAKAO_CHAT_RATE_PER_SECOND: float = float(os.getenv("KAKAO_CHAT_RATE_PER_SECOND", "1"))
+    KAKAO_CHAT_RATE_BURST: float = float(os.getenv("KAKAO_CHAT_RATE_BURST", "3"))
+    # 429 응답의 retry_after가 이 값(초) 이하이면 대기 후 1회 재발송, 초과 시 실패 처리
+    RATE_LIMIT_MAX_RETRY_AFTER: float = float(os.getenv("RATE_LIMIT_MAX_RETRY_AFTER", "10"))
+
+    # Notification - 발송 대기열 (재시도 지연: 초 단위, 기준값 x 2^(시도-1), 최대값 제한)
+    OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "6"))
+    OUTBOX_RETRY_BASE_SECONDS: float = float(os.getenv("OUTBOX_RETRY_BASE_SECONDS", "60"))
+    OUTBOX_RETRY_MAX_SECONDS: float = float(os.getenv("OUTBOX_RETRY_MAX_SECONDS", "3600"))
+    OUTBOX_BATCH_SIZE: int = int(os.getenv("OUTBOX_BATCH_SIZE", "50"))
+
+    # Kakao - 액세스 토큰 사전 갱신 (만료 전 여유 시간 / 만료 확인 주기: 분)
+    KAKAO_TOKEN_REFRESH_MARGIN_MINUTES: int = int(os.getenv("KAKAO_TOKEN_REFRESH_MARGIN_MINUTES", "60"))
+    KAKAO_TOKEN_CHECK_INTERVAL_MINUTES: int = int(os.getenv("KAKAO_TOKEN_CHECK_INTERVAL_MINUTES", "30"))
+
+    # Google - 액세스 토큰 만료 전 갱신 여유 시간 (초)
+    GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS: int = int(os.getenv("GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS", "300"))
+
+    # Calendar - 일정 캐시 (재동기화 주기: 초 / 전체 동기화 기간: 오늘 기준 이전·이후 일수)
+    CALENDAR_CACHE_MAX_AGE_SECONDS: int = int(os.getenv("CALENDAR_CACHE_MAX_AGE_SECONDS", "300"))
+    CALENDAR_SYNC_DAYS_BEHIND: int = int(os.getenv("CALENDAR_SYNC_DAYS_BEHIND", "7"))
+    CALENDAR_SYNC_DAYS_AHEAD: int = int(os.getenv("CALENDAR_SYNC_DAYS_AHEAD", "30"))
+
     # API URLs
     KAKAO_AUTH_URL: str = "https://kauth.kakao.com/oauth/authorize"
     KAKAO_TOKEN_URL: str = "https://kauth.kakao.com/oauth/token"
@@ -3,10 +3,23 @@ CRUD 유틸리티 함수
 데이터베이스 작업을 위한 공통 함수 모음
 """
 
-from datetime import datetime, timezone
-from typing import Optional, List
+from datetime import date, datetime, timezone
+from typing import Optional, List, Tuple
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
-from app.models import User, Setting, Reminder, Log, Watchlist, PriceAlert
+from app.models import (
+    User,
+    Setting,
+    Reminder,
+    Log,
+    Watchlist,
+    PriceAlert,
+    PriceHistory,
+    PriceHistoryCoverage,
+    NotificationOutbox,
+    CalendarEvent,
+    CalendarSyncState,
+)
 
 
 # ============================================================
@@ -36,7 +49,11 @@ def get_or_create_user(db: Session) -> User:
 
 
 def update_user_kakao_tokens(
-    db: Session, user_id: int, access_token: str, refresh_token: str
+    db: Session,
+    user_id: int,
+    access_token: str,
+    refresh_token: str,
+    token_expiry: Optional[datetime] = None,
 ) -> User:
     """
     카카오 토큰 업데이트
@@ -45,12 +62,34 @@ def update_user_kakao_tokens(
     if user:
         user.kakao_access_token = access_token
         user.kakao_refresh_token = refresh_token
+        user.kakao_token_expiry = token_expiry
         user.updated_at = datetime.now()
         db.commit()
         db.refresh(user)
     return user
 
 
+def get_users_with_expiring_kakao_token(db: Session, before: datetime) -> List[User]:
+    """
+    카카오 액세스 토큰 만료가 임박한 사용자 목록 조회
+
+    Args:
+        db: 데이터베이스 세션
+        before: 이 시각 이전에 만료되는 토큰 (만료 시각을 모르는 토큰 포함)
+
+    Returns:
+        list[User]: Refresh Token이 있는 갱신 대상 사용자 목록
+    """
+    return (
+        db.query(User)
+        .filter(
+            User.kakao_refresh_token.isnot(None),
+            or_(User.kakao_token_expiry.is_(None), User.kakao_token_expiry <= before),
+        )
+        .all()
+    )
+
+
 def update_user_google_tokens(
     db: Session,
     user_id: int,
@@ -532,6 +571,33 @@ def get_price_alert(db: Session, alert_id: int) -> Optional[PriceAlert]:
     return db.query(PriceAlert).filter(PriceAlert.alert_id == alert_id).first()
 
 
+def get_active_alerts_with_watchlists(
+    db: Session, user_id: int
+) -> List[Tuple[PriceAlert, Watchlist]]:
+    """
+    체크 대상 가격 알림과 관심 종목 함께 조회 (활성, 미발동)
+
+    Args:
+        db: 데이터베이스 세션
+        user_id: 사용자 ID
+
+    Returns:
+        List[Tuple[PriceAlert, Watchlist]]: (가격 알림, 관심 종목) 목록
+        (관심 종목이 삭제된 알림은 제외)
+    """
+    return (
+        db.query(PriceAlert, Watchlist)
+        .join(Watchlist, PriceAlert.watchlist_id == Watchlist.watchlist_id)
+        .filter(
+            PriceAlert.user_id == user_id,
+            PriceAlert.is_active == True,
+            PriceAlert.is_triggered == False,
+        )
+        .order_by(PriceAlert.created_at.desc())
+        .all()
+    )
+
+
 def get_alerts_by_watchlist(db: Session, watchlist_id: int) -> List[PriceAlert]:
     """
     특정 관심 종목의 가격 알림 목록 조회
@@ -654,3 +720,443 @@ def delete_price_alert(db: Session, alert_id: int) -> bool:
         db.commit()
         return True
     return False
+
+
+# ============================================================
+# PriceHistory CRUD
+# ============================================================
+
+
+def get_price_history(
+    db: Session, ticker: str, market: str, start_date: Optional[date] = None
+) -> List[PriceHistory]:
+    """
+    종목의 일봉 데이터 조회 (날짜 오름차순)
+
+    Args:
+        db: 데이터베이스 세션
+        ticker: 종목 티커
+        market: 시장 (US / KR)
+        start_date: 조회 시작일 (None이면 전체)
+
+    Returns:
+        List[PriceHistory]: 일봉 목록
+    """
+    query = db.query(PriceHistory).filter(
+        PriceHistory.ticker == ticker, PriceHistory.market == market
+    )
+    if start_date is not None:
+        query = query.filter(PriceHistory.date >= start_date)
+    return query.order_by(PriceHistory.date.asc()).all()
+
+
+def get_price_history_range(db: Session, ticker: str, market: str) -> tuple:
+    """
+    종목의 저장된 일봉 기간 조회
+
+    Args:
+        db: 데이터베이스 세션
+        ticker: 종목 티커
+        market: 시장 (US / KR)
+
+    Returns:
+        tuple: (첫 일자, 마지막 일자) - 저장된 데이터가 없으면 (None, None)
+    """
+    return (
+        db.query(func.min(PriceHistory.date), func.max(PriceHistory.date))
+        .filter(PriceHistory.ticker == ticker, PriceHistory.market == market)
+        .one()
+    )
+
+
+def get_price_history_coverage(
+    db: Session, ticker: str, market: str
+) -> Optional[PriceHistoryCoverage]:
+    """
+    종목의 일봉 저장 범위 조회
+
+    Args:
+        db: 데이터베이스 세션
+        ticker: 종목 티커
+        market: 시장 (US / KR)
+
+    Returns:
+        Optional[PriceHistoryCoverage]: 저장 범위 또는 None (다운로드 이력 없음)
+    """
+    return (
+        db.query(PriceHistoryCoverage)
+        .filter(PriceHistoryCoverage.ticker == ticker, PriceHistoryCoverage.market == market)
+        .first()
+    )
+
+
+def save_price_history_coverage(
+    db: Session,
+    ticker: str,
+    market: str,
+    last_fetched_at: datetime,
+    covered_from: Optional[date] = None,
+) -> Optional[PriceHistoryCoverage]:
+    """
+    종목의 일봉 저장 범위 저장
+
+    Args:
+        db: 데이터베이스 세션
+        ticker: 종목 티커
+        market: 시장 (US / KR)
+        last_fetched_at: 다운로드 시각 (시장 현지 시간)
+        covered_from: 전체 다운로드 시작일 (None이면 기존 값 유지)
+
+    Returns:
+        Optional[PriceHistoryCoverage]: 저장된 범위 또는 None (저장 실패 / 시작일 미확인)
+    """
+    try:
+        coverage = get_price_history_coverage(db, ticker, market)
+        if coverage is None:
+            if covered_from is None:
+                return None
+            coverage = PriceHistoryCoverage(ticker=ticker, market=market, covered_from=covered_from)
+            db.add(coverage)
+        elif covered_from is not None:
+            coverage.covered_from = covered_from
+        coverage.last_fetched_at = last_fetched_at
+        db.commit()
+        return coverage
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 일봉 저장 범위 저장 실패 ({ticker}): {e}")
+        return None
+
+
+def upsert_price_history(
+    db: Session, ticker: str, market: str, bars: List[dict], replace_all: bool = False
+) -> int:
+    """
+    일봉 데이터 저장
+    전달된 일봉의 첫 일자 이후 기존 데이터를 교체 (장중 미완성 일봉 갱신)
+
+    Args:
+        db: 데이터베이스 세션
+        ticker: 종목 티커
+        market: 시장 (US / KR)
+        bars: [{"date": date, "open": float, "high": float, "low": float,
+                "close": float, "volume": float}, ...]
+        replace_all: 종목의 기존 일봉 전체 교체 (수정주가 기준 변경 시)
+
+    Returns:
+        int: 저장된 일봉 개수
+    """
+    if not bars:
+        return 0
+
+    try:
+        query = db.query(PriceHistory).filter(
+            PriceHistory.ticker == ticker, PriceHistory.market == market
+        )
+        if not replace_all:
+            query = query.filter(PriceHistory.date >= min(bar["date"] for bar in bars))
+        query.delete(synchronize_session="fetch")
+
+        db.add_all(
+            [PriceHistory(ticker=ticker, market=market, **bar) for bar in bars]
+        )
+        db.commit()
+        return len(bars)
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 일봉 데이터 저장 실패 ({ticker}): {e}")
+        return 0
+
+
+# ============================================================
+# NotificationOutbox CRUD
+# ============================================================
+
+
+def create_outbox_messages(
+    db: Session,
+    user_id: int,
+    channels: List[str],
+    category: str,
+    message: str,
+    max_attempts: int = 5,
+) -> List[NotificationOutbox]:
+    """
+    채널별 알림 발송 대기열 등록
+
+    Args:
+        db: 데이터베이스 세션
+        user_id: 사용자 ID
+        channels: 발송 채널 목록
+        category: 알림 카테고리
+        message: 발송할 메시지
+        max_attempts: 최대 발송 시도 횟수
+
+    Returns:
+        List[NotificationOutbox]: 등록된 대기열 항목 목록
+    """
+    items = [
+        NotificationOutbox(
+            user_id=user_id,
+            channel=channel,
+            category=category,
+            message=message,
+            status="PENDING",
+            attempts=0,
+            max_attempts=max_attempts,
+        )
+        for channel in channels
+    ]
+    db.add_all(items)
+    db.commit()
+    for item in items:
+        db.refresh(item)
+    return items
+
+
+def claim_due_outbox_messages(
+    db: Session,
+    now: datetime,
+    limit: int = 50,
+    outbox_ids: Optional[List[int]] = None,
+) -> List[NotificationOutbox]:
+    """
+    발송 시간이 된 대기열 항목을 SENDING 상태로 변경 후 반환
+
+    Args:
+        db: 데이터베이스 세션
+        now: 기준 시간 (한국 시간, naive)
+        limit: 최대 조회 개수
+        outbox_ids: 특정 항목만 조회할 경우 ID 목록
+
+    Returns:
+        List[NotificationOutbox]: 발송할 대기열 항목 목록
+    """
+    query = db.query(NotificationOutbox).filter(
+        NotificationOutbox.status == "PENDING",
+        NotificationOutbox.next_attempt_at <= now,
+    )
+    if outbox_ids is not None:
+        query = query.filter(NotificationOutbox.outbox_id.in_(outbox_ids))
+
+    items = (
+        query.order_by(NotificationOutbox.next_attempt_at.asc(), NotificationOutbox.outbox_id.asc())
+        .limit(limit)
+        .all()
+    )
+    for item in items:
+        item.status = "SENDING"
+    db.commit()
+    return items
+
+
+def mark_outbox_sent(db: Session, item: NotificationOutbox, sent_at: datetime) -> NotificationOutbox:
+    """
+    대기열 항목 발송 완료 처리
+
+    Args:
+        db: 데이터베이스 세션
+        item: 대기열 항목
+        sent_at: 발송 시간 (한국 시간, naive)
+
+    Returns:
+        NotificationOutbox: 업데이트된 항목
+    """
+    item.status = "SENT"
+    item.attempts += 1
+    item.sent_at = sent_at
+    item.last_error = None
+    db.commit()
+    return item
+
+
+def mark_outbox_failed(
+    db: Session,
+    item: NotificationOutbox,
+    error: str,
+    next_attempt_at: Optional[datetime],
+) -> NotificationOutbox:
+    """
+    대기열 항목 발송 실패 처리
+
+    Args:
+        db: 데이터베이스 세션
+        item: 대기열 항목
+        error: 실패 사유
+        next_attempt_at: 다음 시도 시간 (None이면 DEAD 처리)
+
+    Returns:
+        NotificationOutbox: 업데이트된 항목
+    """
+    item.attempts += 1
+    item.last_error = error
+    if next_attempt_at is None:
+        item.status = "DEAD"
+    else:
+        item.status = "PENDING"
+        item.next_attempt_at = next_attempt_at
+    db.commit()
+    return item
+
+
+def reset_sending_outbox_messages(db: Session) -> int:
+    """
+    SENDING 상태로 남은 항목을 PENDING으로 복구 (발송 중 재시작 대응)
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        int: 복구된 항목 수
+    """
+    count = (
+        db.query(NotificationOutbox)
+        .filter(NotificationOutbox.status == "SENDING")
+        .update({NotificationOutbox.status: "PENDING"}, synchronize_session=False)
+    )
+    db.commit()
+    return count
+
+
+def get_outbox_status_counts(db: Session) -> dict:
+    """
+    대기열 상태별 항목 수 조회
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        dict: {"PENDING": int, "SENDING": int, "SENT": int, "DEAD": int}
+    """
+    counts = {"PENDING": 0, "SENDING": 0, "SENT": 0, "DEAD": 0}
+    rows = (
+        db.query(NotificationOutbox.status, func.count(NotificationOutbox.outbox_id))
+        .group_by(NotificationOutbox.status)
+        .all()
+    )
+    for status, count in rows:
+        counts[status] = count
+    return counts
+
+
+# ============================================================
+# Calendar Cache CRUD
+# ============================================================
+
+
+def get_calendar_sync_state(
+    db: Session, user_id: int, calendar_id: str
+) -> Optional[CalendarSyncState]:
+    """
+    캘린더 동기화 상태 조회
+
+    Args:
+        db: 데이터베이스 세션
+        user_id: 사용자 ID
+        calendar_id: 구글 캘린더 ID
+
+    Returns:
+        Optional[CalendarSyncState]: 동기화 상태 또는 None (동기화 이력 없음)
+    """
+    return (
+        db.query(CalendarSyncState)
+        .filter(
+            CalendarSyncState.user_id == user_id,
+            CalendarSyncState.calendar_id == calendar_id,
+        )
+        .first()
+    )
+
+
+def save_calendar_sync(
+    db: Session,
+    user_id: int,
+    calendar_id: str,
+    events: List[dict],
+    deleted_event_ids: List[str],
+    sync_token: Optional[str],
+    synced_at: datetime,
+    window: Optional[tuple] = None,
+) -> CalendarSyncState:
+    """
+    캘린더 동기화 결과 저장 (일정 변경분과 동기화 상태를 한 트랜잭션으로 반영)
+
+    Args:
+        db: 데이터베이스 세션
+        user_id: 사용자 ID
+        calendar_id: 구글 캘린더 ID
+        events: 추가/변경된 일정 [{"event_id": str, "start_at": datetime,
+                "end_at": datetime, "event_json": str}, ...]
+        deleted_event_ids: 삭제(취소)된 일정 ID 목록
+        sync_token: 다음 증분 동기화 토큰
+        synced_at: 동기화 시간
+        window: 전체 동기화 시 (조회 시작, 조회 종료) - 지정하면 기존 캐시를 모두 교체
+
+    Returns:
+        CalendarSyncState: 저장된 동기화 상태
+    """
+    try:
+        query = db.query(CalendarEvent).filter(
+            CalendarEvent.user_id == user_id, CalendarEvent.calendar_id == calendar_id
+        )
+        if window is not None:
+            query.delete(synchronize_session="fetch")
+        else:
+            changed_ids = deleted_event_ids + [event["event_id"] for event in events]
+            if changed_ids:
+                query.filter(CalendarEvent.event_id.in_(changed_ids)).delete(
+                    synchronize_session=False
+                )
+
+        db.add_all(
+            [CalendarEvent(user_id=user_id, calendar_id=calendar_id, **event) for event in events]
+        )
+
+        state = get_calendar_sync_state(db, user_id, calendar_id)
+        if state is None:
+            state = CalendarSyncState(user_id=user_id, calendar_id=calendar_id)
+            db.add(state)
+        if window is not None:
+            state.window_start, state.window_end = window
+        state.sync_token = sync_token
+        state.synced_at = synced_at
+
+        db.commit()
+        db.refresh(state)
+        return state
+    except Exception:
+        db.rollback()
+        raise
+
+
+def get_cached_calendar_events(
+    db: Session,
+    user_id: int,
+    calendar_id: str,
+    time_min: datetime,
+    time_max: datetime,
+) -> List[CalendarEvent]:
+    """
+    기간과 겹치는 캐시 일정 조회 (시작 시간 오름차순)
+
+    Args:
+        db: 데이터베이스 세션
+        user_id: 사용자 ID
+        calendar_id: 구글 캘린더 ID
+        time_min: 조회 시작 시간 (한국 시간)
+        time_max: 조회 종료 시간 (한국 시간)
+
+    Returns:
+        List[CalendarEvent]: 일정 목록
+    """
+    return (
+        db.query(CalendarEvent)
+        .filter(
+            CalendarEvent.user_id == user_id,
+            CalendarEvent.calendar_id == calendar_id,
+            CalendarEvent.start_at < time_max,
+            or_(CalendarEvent.end_at > time_min, CalendarEvent.start_at >= time_min),
+        )
+        .order_by(CalendarEvent.start_at.asc())
+        .all()
+    )
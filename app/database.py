@@ -47,7 +47,10 @@ def init_db():
     모든 테이블을 생성
     """
     # 모든 모델을 임포트해야 Base.metadata에 등록됨
-    from app.models import user, setting, reminder, log, watchlist, price_alert
+    from app.models import (
+        user, setting, reminder, log, watchlist, price_alert, price_history, price_history_coverage,
+        notification_outbox, calendar_event, calendar_sync_state,
+    )
 
     # 테이블 생성
     Base.metadata.create_all(bind=engine)
@@ -88,6 +91,21 @@ def run_migrations():
         else:
             print("✓ price_alerts.reference_price 컬럼 이미 존재")
 
+        # 마이그레이션 2: users에 kakao_token_expiry 컬럼 추가
+        cursor.execute("PRAGMA table_info(users)")
+        columns = [column[1] for column in cursor.fetchall()]
+
+        if "kakao_token_expiry" not in columns:
+            print("🔄 마이그레이션 실행: users.kakao_token_expiry 컬럼 추가")
+            cursor.execute("""
+                ALTER TABLE users
+                ADD COLUMN kakao_token_expiry DATETIME
+            """)
+            conn.commit()
+            print("✅ 마이그레이션 완료: kakao_token_expiry 컬럼 추가됨")
+        else:
+            print("✓ users.kakao_token_expiry 컬럼 이미 존재")
+
         conn.close()
 
     except Exception as e:
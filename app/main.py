@@ -13,6 +13,10 @@ from app.middleware import AuthMiddleware
 from app.routers import auth, scheduler, reminders, pages, settings as settings_router, logs, weather, finance, calendar
 from app.services.scheduler import scheduler_service
 from app.services.bots.memo_bot import memo_bot
+from app.services.market import market_data_executor, quote_stream
+from app.services.bots.finance_bot import start_price_alert_stream
+from app.services.http_client import http_clients
+from app.services.notification import notification_outbox
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -100,6 +104,22 @@ async def startup_event():
     except Exception as e:
         print(f"⚠️  Finance Job 등록 실패: {e}")
 
+    # 실시간 시세 스트림 시작 (설정된 경우, 가격 알림 주기 체크는 대체 수단으로 유지)
+    start_price_alert_stream()
+
+    # 알림 발송 대기열 복구 및 재시도 Job 등록
+    notification_outbox.recover()
+    try:
+        scheduler_service.setup_outbox_job()
+    except Exception as e:
+        print(f"⚠️  알림 대기열 Job 등록 실패: {e}")
+
+    # 카카오 토큰 사전 갱신 Job 등록
+    try:
+        scheduler_service.setup_kakao_token_job()
+    except Exception as e:
+        print(f"⚠️  카카오 토큰 갱신 Job 등록 실패: {e}")
+
     # 미발송 메모 Job 복원
     restored_count = memo_bot.restore_pending_reminders()
     if restored_count > 0:
@@ -124,5 +144,14 @@ async def shutdown_event():
     """
     print("👋 My Assistant 종료")
 
+    # 실시간 시세 스트림 종료
+    quote_stream.stop()
+
+    # 공유 HTTP 클라이언트 종료 (스케줄러 루프의 클라이언트 포함, 스케줄러 종료 전에 실행)
+    await http_clients.aclose()
+
     # 스케줄러 종료
     scheduler_service.shutdown()
+
+    # 시세 조회 스레드 풀 종료
+    market_data_executor.shutdown()
@@ -9,5 +9,22 @@ from app.models.reminder import Reminder
 from app.models.log import Log
 from app.models.watchlist import Watchlist
 from app.models.price_alert import PriceAlert
+from app.models.price_history import PriceHistory
+from app.models.price_history_coverage import PriceHistoryCoverage
+from app.models.notification_outbox import NotificationOutbox
+from app.models.calendar_event import CalendarEvent
+from app.models.calendar_sync_state import CalendarSyncState
 
-__all__ = ["User", "Setting", "Reminder", "Log", "Watchlist", "PriceAlert"]
+__all__ = [
+    "User",
+    "Setting",
+    "Reminder",
+    "Log",
+    "Watchlist",
+    "PriceAlert",
+    "PriceHistory",
+    "PriceHistoryCoverage",
+    "NotificationOutbox",
+    "CalendarEvent",
+    "CalendarSyncState",
+]
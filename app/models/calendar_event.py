@@ -0,0 +1,37 @@
+"""
+CalendarEvent 모델
+구글 캘린더 일정을 로컬에 캐시하는 테이블
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint, Index
+from app.database import Base
+
+
+class CalendarEvent(Base):
+    """
+    캘린더 일정 캐시 테이블
+    캘린더별 동기화 토큰(syncToken)으로 변경분만 반영하며, 원본 일정 JSON을 그대로 보관
+    """
+
+    __tablename__ = "calendar_events"
+    __table_args__ = (
+        UniqueConstraint("user_id", "calendar_id", "event_id", name="uq_calendar_events_event"),
+        Index("ix_calendar_events_calendar_start", "user_id", "calendar_id", "start_at"),
+    )
+
+    calendar_event_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
+
+    # 구글 캘린더 식별자
+    calendar_id = Column(String, nullable=False)
+    event_id = Column(String, nullable=False)
+
+    # 일정 기간 (한국 시간, 종일 일정은 해당 날짜 00:00 ~ 종료일 00:00)
+    start_at = Column(DateTime, nullable=False)
+    end_at = Column(DateTime, nullable=False)
+
+    # 구글 API 응답 원본 (events.list의 item)
+    event_json = Column(String, nullable=False)
+
+    def __repr__(self):
+        return f"<CalendarEvent(calendar_id={self.calendar_id}, event_id={self.event_id})>"
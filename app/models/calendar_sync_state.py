@@ -0,0 +1,36 @@
+"""
+CalendarSyncState 모델
+캘린더별 증분 동기화 상태(syncToken)를 보관하는 테이블
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from app.database import Base
+
+
+class CalendarSyncState(Base):
+    """
+    캘린더 동기화 상태 테이블
+    전체 동기화 기간과 다음 증분 동기화에 사용할 syncToken 저장
+    """
+
+    __tablename__ = "calendar_sync_states"
+    __table_args__ = (
+        UniqueConstraint("user_id", "calendar_id", name="uq_calendar_sync_states_calendar"),
+    )
+
+    sync_state_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
+    calendar_id = Column(String, nullable=False)
+
+    # 다음 증분 동기화 토큰 (410 응답 시 전체 재동기화)
+    sync_token = Column(String, nullable=True)
+
+    # 전체 동기화 시 조회한 기간 (한국 시간, 이 기간 밖의 일정은 캐시되지 않음)
+    window_start = Column(DateTime, nullable=False)
+    window_end = Column(DateTime, nullable=False)
+
+    # 마지막 동기화 시간 (한국 시간)
+    synced_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<CalendarSyncState(calendar_id={self.calendar_id}, synced_at={self.synced_at})>"
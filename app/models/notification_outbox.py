@@ -0,0 +1,55 @@
+"""
+NotificationOutbox 모델
+발송 대기/재시도 중인 알림 메시지를 보관하는 테이블
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from app.database import Base
+
+
+class NotificationOutbox(Base):
+    """
+    알림 발송 대기열 테이블
+    채널별로 한 행씩 저장하며, 실패 시 지수 백오프로 재시도하고 최대 시도 횟수 초과 시 DEAD 처리
+    """
+
+    __tablename__ = "notification_outbox"
+    __table_args__ = (
+        Index("ix_notification_outbox_status_next", "status", "next_attempt_at"),
+    )
+
+    outbox_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
+
+    # 발송 정보
+    channel = Column(String(20), nullable=False)  # kakao / telegram
+    category = Column(String(20), nullable=False)  # memo / finance / ...
+    message = Column(String, nullable=False)
+
+    # 상태 (PENDING / SENDING / SENT / DEAD)
+    status = Column(String(20), nullable=False, default="PENDING")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    last_error = Column(String, nullable=True)
+
+    # 다음 발송 시도 시간 (한국 시간, naive datetime)
+    next_attempt_at = Column(
+        DateTime(timezone=False),
+        nullable=False,
+        default=lambda: datetime.now(ZoneInfo("Asia/Seoul")).replace(tzinfo=None),
+    )
+
+    # 메타데이터
+    created_at = Column(
+        DateTime(timezone=False),
+        default=lambda: datetime.now(ZoneInfo("Asia/Seoul")).replace(tzinfo=None),
+    )
+    sent_at = Column(DateTime(timezone=False), nullable=True)
+
+    def __repr__(self):
+        return (
+            f"<NotificationOutbox(id={self.outbox_id}, channel={self.channel}, "
+            f"status={self.status}, attempts={self.attempts})>"
+        )
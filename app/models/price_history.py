@@ -0,0 +1,37 @@
+"""
+PriceHistory 모델
+종목별 일봉(OHLCV) 데이터를 보관하는 테이블
+"""
+
+from sqlalchemy import Column, Integer, String, Float, Date, UniqueConstraint, Index
+from app.database import Base
+
+
+class PriceHistory(Base):
+    """
+    일봉 시세 테이블
+    Yahoo Finance / PyKRX에서 조회한 일봉을 누적 저장 (신규 일봉만 추가 조회)
+    """
+
+    __tablename__ = "price_history"
+    __table_args__ = (
+        UniqueConstraint("ticker", "market", "date", name="uq_price_history_symbol_date"),
+        Index("ix_price_history_symbol_date", "ticker", "market", "date"),
+    )
+
+    history_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+
+    # 종목 정보
+    ticker = Column(String(20), nullable=False)
+    market = Column(String(10), nullable=False)  # US / KR
+
+    # 일봉 데이터 (시장 현지 날짜 기준)
+    date = Column(Date, nullable=False)
+    open = Column(Float, nullable=True)
+    high = Column(Float, nullable=True)
+    low = Column(Float, nullable=True)
+    close = Column(Float, nullable=False)
+    volume = Column(Float, nullable=True)
+
+    def __repr__(self):
+        return f"<PriceHistory(ticker={self.ticker}, market={self.market}, date={self.date})>"
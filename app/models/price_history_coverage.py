@@ -0,0 +1,35 @@
+"""
+PriceHistoryCoverage 모델
+종목별 일봉 저장 범위와 마지막 다운로드 시각을 보관하는 테이블
+"""
+
+from sqlalchemy import Column, Integer, String, Date, DateTime, UniqueConstraint
+from app.database import Base
+
+
+class PriceHistoryCoverage(Base):
+    """
+    일봉 저장 범위 테이블
+    전체 다운로드를 요청한 시작일(상장 이후 종목은 첫 일봉보다 이를 수 있음)과
+    마지막 일봉을 받은 시각을 저장하여 불필요한 재다운로드와 미완성 일봉 고착을 방지
+    """
+
+    __tablename__ = "price_history_coverage"
+    __table_args__ = (
+        UniqueConstraint("ticker", "market", name="uq_price_history_coverage_symbol"),
+    )
+
+    coverage_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+
+    # 종목 정보
+    ticker = Column(String(20), nullable=False)
+    market = Column(String(10), nullable=False)  # US / KR
+
+    # 이 날짜 이후 제공자가 가진 일봉은 모두 저장됨 (시장 현지 날짜)
+    covered_from = Column(Date, nullable=False)
+
+    # 마지막 다운로드 시각 (시장 현지 시간, 폐장 전이면 마지막 일봉은 미완성)
+    last_fetched_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<PriceHistoryCoverage(ticker={self.ticker}, market={self.market}, covered_from={self.covered_from})>"
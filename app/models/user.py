@@ -21,6 +21,7 @@ class User(Base):
     # Kakao OAuth 토큰
     kakao_access_token = Column(String, nullable=True)
     kakao_refresh_token = Column(String, nullable=True)
+    kakao_token_expiry = Column(DateTime, nullable=True)
 
     # Google OAuth 토큰
     google_access_token = Column(String, nullable=True)
@@ -11,7 +11,9 @@ from pydantic import BaseModel
 
 from app.database import get_db
 from app.services.auth.kakao_auth import kakao_auth_service
+from app.services.auth.kakao_token_manager import kakao_token_manager
 from app.services.auth.google_auth import google_auth_service
+from app.services.auth.google_credentials_manager import google_credentials_manager
 from app.services.auth.session_auth import (
     verify_admin_credentials,
     create_session,
@@ -85,9 +87,16 @@ async def kakao_callback(code: str = Query(...), db: Session = Depends(get_db)):
         except Exception as e:
             print(f"⚠️  사용자 정보 조회 실패: {e}")
 
-        # DB에 토큰 저장
+        # DB에 토큰 저장 (만료 시각 포함) 및 캐시된 이전 토큰 제거
         user = get_or_create_user(db)
-        update_user_kakao_tokens(db, user.user_id, access_token, refresh_token)
+        update_user_kakao_tokens(
+            db,
+            user.user_id,
+            access_token,
+            refresh_token,
+            kakao_token_manager.expiry_from(token_data),
+        )
+        kakao_token_manager.invalidate(user.user_id)
 
         # 로그 기록
         create_log(db, "auth", "SUCCESS", f"카카오 로그인 성공 (user_id: {user.user_id})")
@@ -141,7 +150,9 @@ async def kakao_disconnect(db: Session = Depends(get_db)):
         # DB에서 카카오 토큰 제거
         user.kakao_access_token = None
         user.kakao_refresh_token = None
+        user.kakao_token_expiry = None
         db.commit()
+        kakao_token_manager.invalidate(user.user_id)
 
         # 로그 기록
         create_log(
@@ -177,16 +188,8 @@ async def kakao_refresh_token(db: Session = Depends(get_db)):
         if not user.kakao_refresh_token:
             raise HTTPException(status_code=400, detail="Refresh Token이 없습니다")
 
-        # 토큰 갱신
-        token_data = await kakao_auth_service.refresh_access_token(
-            user.kakao_refresh_token
-        )
-
-        new_access_token = token_data.get("access_token")
-        new_refresh_token = token_data.get("refresh_token", user.kakao_refresh_token)
-
-        # DB 업데이트
-        update_user_kakao_tokens(db, user.user_id, new_access_token, new_refresh_token)
+        # 토큰 갱신 (DB 저장 및 발송용 캐시 교체)
+        await kakao_token_manager.refresh(user.user_id)
 
         # 로그 기록
         create_log(db, "auth", "SUCCESS", f"카카오 토큰 갱신 성공 (user_id: {user.user_id})")
@@ -220,9 +223,8 @@ async def kakao_test_message(db: Session = Depends(get_db)):
         # 테스트 메시지 발송
         message = "🎉 My Assistant 테스트 메시지입니다!\n카카오 인증이 정상적으로 완료되었습니다."
 
-        result = await kakao_auth_service.send_message_to_me(
-            user.kakao_access_token, message
-        )
+        access_token = await kakao_token_manager.get_access_token(user)
+        result = await kakao_auth_service.send_message_to_me(access_token, message)
 
         # 로그 기록
         create_log(db, "memo", "SUCCESS", f"테스트 메시지 발송 성공 (user_id: {user.user_id})")
@@ -287,6 +289,7 @@ async def google_callback(code: str = Query(...), db: Session = Depends(get_db))
         update_user_google_tokens(
             db, user.user_id, access_token, refresh_token, token_expiry
         )
+        google_credentials_manager.invalidate(user.user_id)
 
         # 로그 기록
         create_log(db, "auth", "SUCCESS", f"구글 로그인 성공 (user_id: {user.user_id})")
@@ -347,6 +350,7 @@ async def google_disconnect(db: Session = Depends(get_db)):
         user.google_refresh_token = None
         user.google_token_expiry = None
         db.commit()
+        google_credentials_manager.invalidate(user.user_id)
 
         # 로그 기록
         create_log(
@@ -382,28 +386,11 @@ async def google_test_calendar(db: Session = Depends(get_db)):
         if not user.google_access_token or not user.google_refresh_token:
             raise HTTPException(status_code=400, detail="구글 로그인이 필요합니다")
 
-        # Credentials 생성
-        credentials = google_auth_service.create_credentials(
-            user.google_access_token,
-            user.google_refresh_token,
-            user.google_token_expiry,
-        )
-
-        # 토큰 만료 확인 및 갱신
-        if credentials.expired and credentials.refresh_token:
-            try:
-                credentials = google_auth_service.refresh_credentials(credentials)
-
-                # 갱신된 토큰 저장
-                update_user_google_tokens(
-                    db,
-                    user.user_id,
-                    credentials.token,
-                    credentials.refresh_token,
-                    credentials.expiry,
-                )
-            except Exception as e:
-                raise HTTPException(status_code=401, detail=f"토큰 갱신 실패: {str(e)}")
+        # Credentials 조회 (캐시, 만료 임박 시 갱신)
+        try:
+            credentials = await google_credentials_manager.get_credentials_async(db, user)
+        except Exception as e:
+            raise HTTPException(status_code=401, detail=f"토큰 갱신 실패: {str(e)}")
 
         # 오늘 일정 조회
         events = google_auth_service.get_calendar_events(credentials)
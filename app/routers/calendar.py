@@ -15,6 +15,7 @@ from app.database import get_db
 from app.crud import get_or_create_user, get_setting_by_category, get_logs, create_setting, update_setting
 from app.services.bots.calendar_bot import calendar_bot
 from app.services.auth.google_auth import google_auth_service
+from app.services.auth.google_credentials_manager import google_credentials_manager
 from app.services.scheduler import scheduler_service
 
 
@@ -115,27 +116,9 @@ async def get_calendar_preview(db: Session = Depends(get_db)):
                 detail="Google 계정 연동이 필요합니다"
             )
 
-        # Google Credentials 생성
+        # Google Credentials 조회 (캐시, 만료 임박 시 갱신)
         try:
-            credentials = google_auth_service.create_credentials(
-                access_token=user.google_access_token,
-                refresh_token=user.google_refresh_token,
-                token_expiry=user.google_token_expiry,
-            )
-
-            # 토큰 만료 시 갱신
-            if credentials.expired and credentials.refresh_token:
-                credentials = google_auth_service.refresh_credentials(credentials)
-                # 갱신된 토큰 DB 저장
-                from app.crud import update_user_google_tokens
-
-                update_user_google_tokens(
-                    db,
-                    user.user_id,
-                    credentials.token,
-                    credentials.refresh_token,
-                    credentials.expiry,
-                )
+            credentials = await google_credentials_manager.get_credentials_async(db, user)
 
         except Exception as e:
             raise HTTPException(
@@ -143,8 +126,8 @@ async def get_calendar_preview(db: Session = Depends(get_db)):
                 detail=f"Google 인증 실패: {str(e)}"
             )
 
-        # 일정 조회
-        events = calendar_bot.get_today_events(credentials)
+        # 일정 조회 (로컬 일정 캐시, 변경분만 동기화)
+        events = calendar_bot.get_today_events(credentials, user_id=user.user_id)
 
         if events is None:
             raise HTTPException(
@@ -247,27 +230,9 @@ async def get_calendar_list(db: Session = Depends(get_db)):
                 detail="Google 계정 연동이 필요합니다"
             )
 
-        # Google Credentials 생성
+        # Google Credentials 조회 (캐시, 만료 임박 시 갱신)
         try:
-            credentials = google_auth_service.create_credentials(
-                access_token=user.google_access_token,
-                refresh_token=user.google_refresh_token,
-                token_expiry=user.google_token_expiry,
-            )
-
-            # 토큰 만료 시 갱신
-            if credentials.expired and credentials.refresh_token:
-                credentials = google_auth_service.refresh_credentials(credentials)
-                # 갱신된 토큰 DB 저장
-                from app.crud import update_user_google_tokens
-
-                update_user_google_tokens(
-                    db,
-                    user.user_id,
-                    credentials.token,
-                    credentials.refresh_token,
-                    credentials.expiry,
-                )
+            credentials = await google_credentials_manager.get_credentials_async(db, user)
 
         except Exception as e:
             raise HTTPException(
@@ -4,7 +4,7 @@ Finance API 라우터
 """
 
 from typing import Optional, Any, Dict, List
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
@@ -31,6 +31,7 @@ from app.crud import (
     delete_price_alert,
 )
 from app.services.bots.finance_bot import finance_bot
+from app.services.market import alert_index, quote_cache, us_ticker_directory
 from app.services.scheduler import scheduler_service
 
 
@@ -177,7 +178,7 @@ async def get_us_market_preview():
     """
     try:
         # 증시 데이터 조회
-        market_data = finance_bot.get_us_market_data()
+        market_data = await finance_bot.get_us_market_data_async()
 
         if not market_data:
             raise HTTPException(
@@ -215,7 +216,7 @@ async def get_kr_market_preview():
     """
     try:
         # 증시 데이터 조회
-        market_data = finance_bot.get_kr_market_data()
+        market_data = await finance_bot.get_kr_market_data_async()
 
         if not market_data:
             raise HTTPException(
@@ -383,7 +384,7 @@ async def add_watchlist(
         user = get_or_create_user(db)
 
         # 티커 유효성 검증
-        if not finance_bot.validate_ticker(request.ticker, request.market):
+        if not await finance_bot.validate_ticker_async(request.ticker, request.market):
             raise HTTPException(
                 status_code=400, detail=f"유효하지 않은 티커입니다: {request.ticker}"
             )
@@ -394,7 +395,7 @@ async def add_watchlist(
             raise HTTPException(status_code=400, detail="이미 등록된 종목입니다")
 
         # 종목 정보 조회
-        stock_info = finance_bot.get_stock_quote(request.ticker, request.market)
+        stock_info = await finance_bot.get_stock_quote_async(request.ticker, request.market)
         if not stock_info:
             raise HTTPException(
                 status_code=500, detail="종목 정보를 가져올 수 없습니다"
@@ -457,6 +458,7 @@ async def update_user_watchlist(
             name=request.name,
             is_active=request.is_active,
         )
+        alert_index.update_watchlist(updated)
 
         return JSONResponse(
             content={
@@ -500,6 +502,7 @@ async def delete_user_watchlist(watchlist_id: int, db: Session = Depends(get_db)
         success = delete_watchlist(db, watchlist_id)
 
         if success:
+            alert_index.remove_watchlist(watchlist_id)
             return JSONResponse(
                 content={"message": "관심 종목이 삭제되었습니다"},
                 status_code=200,
@@ -579,7 +582,7 @@ async def search_stocks(q: str, market: str = "US"):
         if not q or len(q) < 1:
             raise HTTPException(status_code=400, detail="검색어를 입력해주세요")
 
-        results = finance_bot.search_ticker(q, market)
+        results = await finance_bot.search_ticker_async(q, market)
 
         return JSONResponse(
             content={
@@ -594,6 +597,40 @@ async def search_stocks(q: str, market: str = "US"):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/directory/us/import")
+async def import_us_directory(file: UploadFile = File(...)):
+    """
+    미국 종목 목록 가져오기
+
+    Args:
+        file: NASDAQ Trader 종목 목록(nasdaqlisted.txt 등) 또는 symbol,name CSV 파일
+
+    Returns:
+        가져온 종목 수
+    """
+    try:
+        content = (await file.read()).decode("utf-8-sig")
+        count = us_ticker_directory.import_text(content, source=file.filename)
+
+        if count == 0:
+            raise HTTPException(status_code=400, detail="종목 목록을 읽을 수 없습니다")
+
+        return JSONResponse(
+            content={
+                "success": True,
+                "count": count,
+                "imported_at": us_ticker_directory.imported_at,
+            }
+        )
+
+    except HTTPException:
+        raise
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="UTF-8 텍스트 파일만 지원합니다")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/quote/{ticker}")
 async def get_stock_quote_api(ticker: str, market: str = "US"):
     """
@@ -607,24 +644,16 @@ async def get_stock_quote_api(ticker: str, market: str = "US"):
         종목 시세 정보 (실시간 가격, 변동률, 52주 범위 등)
     """
     try:
-        # 기본 시세 조회
-        quote = finance_bot.get_stock_quote(ticker, market)
-        if not quote:
+        # 시세, 기간별 변동률, 52주 범위 일괄 조회 (1년치 일봉 1회 조회)
+        snapshot = await finance_bot.get_symbol_snapshot_async(ticker, market)
+        if not snapshot:
             raise HTTPException(
                 status_code=404, detail=f"종목을 찾을 수 없습니다: {ticker}"
             )
 
-        # 기간별 변동률 조회
-        period_changes = finance_bot.calculate_period_changes(ticker, market)
-
-        # 52주 범위 조회
-        week_52_range = finance_bot.get_52week_range(ticker, market)
-
         # JSON 직렬화 가능하도록 데이터 정제
         sanitized_data = sanitize_for_json({
-            "quote": quote,
-            "period_changes": period_changes,
-            "week_52_range": week_52_range,
+            **snapshot,
             "timestamp": datetime.now().isoformat(),
         })
 
@@ -639,6 +668,17 @@ async def get_stock_quote_api(ticker: str, market: str = "US"):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/cache/stats")
+async def get_quote_cache_stats():
+    """
+    시세 캐시 통계 조회
+
+    Returns:
+        캐시 항목 수, 적중/미적중 횟수, 적중률, TTL 설정
+    """
+    return JSONResponse(content=quote_cache.get_stats())
+
+
 # ========================================
 # 가격 알림 API
 # ========================================
@@ -742,7 +782,7 @@ async def create_alert_api(
         reference_price = None
         if request.alert_type == "PERCENT_CHANGE":
             # 현재가 조회
-            quote = finance_bot.get_stock_quote(watchlist.ticker, watchlist.market)
+            quote = await finance_bot.get_stock_quote_async(watchlist.ticker, watchlist.market)
             if quote and quote.get("price"):
                 reference_price = quote.get("price")
                 print(f"✅ 기준가 설정: {watchlist.ticker} = {reference_price}")
@@ -761,6 +801,7 @@ async def create_alert_api(
             target_percent=request.target_percent,
             reference_price=reference_price,
         )
+        alert_index.add(alert, watchlist)
 
         return JSONResponse(
             content={
@@ -821,6 +862,7 @@ async def delete_alert_api(alert_id: int, db: Session = Depends(get_db)):
         success = delete_price_alert(db, alert_id)
         if not success:
             raise HTTPException(status_code=500, detail="가격 알림 삭제에 실패했습니다")
+        alert_index.remove(alert_id)
 
         return JSONResponse(
             content={"message": "가격 알림이 삭제되었습니다", "alert_id": alert_id}
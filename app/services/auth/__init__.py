@@ -5,5 +5,12 @@ OAuth 인증 서비스를 임포트
 
 from app.services.auth.kakao_auth import kakao_auth_service
 from app.services.auth.google_auth import google_auth_service
+from app.services.auth.kakao_token_manager import kakao_token_manager
+from app.services.auth.google_credentials_manager import google_credentials_manager
 
-__all__ = ["kakao_auth_service", "google_auth_service"]
+__all__ = [
+    "kakao_auth_service",
+    "google_auth_service",
+    "kakao_token_manager",
+    "google_credentials_manager",
+]
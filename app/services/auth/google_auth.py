@@ -3,17 +3,37 @@
 구글 로그인 및 Calendar API 연동
 """
 
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from app.config import settings
 
 
+class CalendarSyncTokenExpiredError(Exception):
+    """캘린더 동기화 토큰 만료 (HTTP 410, 전체 재동기화 필요)"""
+
+
 class GoogleAuthService:
     """구글 인증 및 캘린더 서비스"""
 
+    # 스레드별로 유지할 API 서비스 객체 수
+    SERVICE_CACHE_SIZE = 8
+    # 배치 요청 1회에 담을 수 있는 최대 요청 수 (Calendar API 제한)
+    BATCH_MAX_REQUESTS = 50
+    # 일정 목록 페이지 크기 (API 최대 2500)
+    EVENTS_PAGE_SIZE = 250
+    # 일정 조회 시 요청할 필드 (메시지 포맷팅/캐시에 필요한 항목만)
+    EVENT_FIELDS = (
+        "id,status,summary,description,location,hangoutLink,"
+        "start,end,attendees(email,displayName)"
+    )
+
     def __init__(self):
         self.client_id = settings.GOOGLE_CLIENT_ID
         self.client_secret = settings.GOOGLE_CLIENT_SECRET
@@ -26,6 +46,48 @@ class GoogleAuthService:
             "https://www.googleapis.com/auth/userinfo.email",
         ]
 
+        # 스레드별 API 서비스 객체 캐시 (httplib2 기반 서비스 객체는 스레드 간 공유 불가)
+        self._services = threading.local()
+
+    def get_service(self, api: str, version: str, credentials: Credentials):
+        """
+        API 서비스 객체 조회 (같은 Credentials 객체면 재사용)
+
+        라이브러리에 포함된 정적 discovery 문서로 생성하여 네트워크 조회 없이 빌드하고,
+        생성된 서비스 객체는 Credentials 객체 단위로 캐시하여 discovery 문서 파싱을 생략
+
+        Args:
+            api: API 이름 (calendar, oauth2 등)
+            version: API 버전
+            credentials: 구글 인증 정보
+
+        Returns:
+            Resource: API 서비스 객체
+        """
+        cache = getattr(self._services, "cache", None)
+        if cache is None:
+            cache = self._services.cache = OrderedDict()
+
+        key = (api, version, id(credentials))
+        entry = cache.get(key)
+        # id가 재사용된 다른 Credentials 객체가 아닌지 확인
+        if entry is not None and entry[0] is credentials:
+            cache.move_to_end(key)
+            return entry[1]
+
+        service = build(
+            api,
+            version,
+            credentials=credentials,
+            static_discovery=True,
+            cache_discovery=False,
+        )
+        cache[key] = (credentials, service)
+        cache.move_to_end(key)
+        while len(cache) > self.SERVICE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return service
+
     def create_flow(self) -> Flow:
         """
         OAuth Flow 생성
@@ -138,21 +200,114 @@ class GoogleAuthService:
         except Exception as e:
             raise Exception(f"구글 토큰 갱신 실패: {str(e)}")
 
+    @staticmethod
+    def _to_rfc3339(value: datetime) -> str:
+        """API 조회 시간 형식 변환 (timezone 없는 시간은 기존과 같이 UTC 표기)"""
+        if value.tzinfo is not None:
+            return value.isoformat()
+        return value.isoformat() + "Z"
+
+    @staticmethod
+    def _today_range() -> Tuple[datetime, datetime]:
+        """기본 조회 기간 (오늘 00:00 ~ 23:59)"""
+        now = datetime.now()
+        return (
+            now.replace(hour=0, minute=0, second=0, microsecond=0),
+            now.replace(hour=23, minute=59, second=59, microsecond=999999),
+        )
+
+    def iter_event_pages(
+        self,
+        credentials: Credentials,
+        calendar_id: str = "primary",
+        page_token: Optional[str] = None,
+        page_fields: str = "nextPageToken",
+        **params,
+    ) -> Iterator[Dict]:
+        """
+        일정 목록 페이지 단위 조회 (다음 페이지는 소비할 때 요청)
+
+        Args:
+            credentials: 구글 인증 정보
+            calendar_id: 구글 캘린더 ID
+            page_token: 이어서 조회할 페이지 토큰
+            page_fields: 페이지 단위 응답 필드 (items 외)
+            **params: events.list 조회 조건 (timeMin, timeMax, syncToken 등)
+
+        Yields:
+            Dict: 페이지 응답 (items와 page_fields에 지정한 필드만 포함)
+        """
+        service = self.get_service("calendar", "v3", credentials)
+        fields = f"{page_fields},items({self.EVENT_FIELDS})"
+
+        while True:
+            page = (
+                service.events()
+                .list(
+                    calendarId=calendar_id,
+                    pageToken=page_token,
+                    maxResults=self.EVENTS_PAGE_SIZE,
+                    fields=fields,
+                    **params,
+                )
+                .execute()
+            )
+            yield page
+
+            page_token = page.get("nextPageToken")
+            if not page_token:
+                return
+
+    def iter_calendar_events(
+        self,
+        credentials: Credentials,
+        calendar_id: str = "primary",
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        page_token: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """
+        기간 내 일정 순차 조회 (다음 페이지는 앞 페이지 일정을 모두 소비한 뒤 요청)
+
+        Args:
+            credentials: 구글 인증 정보
+            calendar_id: 구글 캘린더 ID
+            time_min: 조회 시작 시간 (기본: 오늘 00:00)
+            time_max: 조회 종료 시간 (기본: 오늘 23:59)
+            page_token: 이어서 조회할 페이지 토큰
+
+        Yields:
+            Dict: 일정 (시작 시간 순)
+        """
+        default_min, default_max = self._today_range()
+        pages = self.iter_event_pages(
+            credentials,
+            calendar_id,
+            page_token=page_token,
+            timeMin=self._to_rfc3339(time_min or default_min),
+            timeMax=self._to_rfc3339(time_max or default_max),
+            singleEvents=True,
+            orderBy="startTime",
+        )
+        for page in pages:
+            yield from page.get("items", [])
+
     def get_calendar_events(
         self,
         credentials: Credentials,
         time_min: Optional[datetime] = None,
         time_max: Optional[datetime] = None,
-        max_results: int = 10,
+        max_results: Optional[int] = None,
     ) -> List[Dict]:
         """
-        구글 캘린더 일정 조회
+        구글 캘린더 일정 조회 (Primary 캘린더)
+        모든 페이지를 조회하여 리스트로 반환 (페이지 단위 순회는 iter_calendar_events 사용)
 
         Args:
             credentials: 구글 인증 정보
             time_min: 조회 시작 시간 (기본: 오늘 00:00)
             time_max: 조회 종료 시간 (기본: 오늘 23:59)
-            max_results: 최대 조회 개수
+            max_results: 최대 조회 개수 (기본: 제한 없음, 지정 시 필요한 페이지까지만 조회)
 
         Returns:
             List[Dict]: 일정 리스트
@@ -161,38 +316,167 @@ class GoogleAuthService:
             Exception: 일정 조회 실패 시
         """
         try:
-            # Calendar API 서비스 생성
-            service = build("calendar", "v3", credentials=credentials)
+            events = self.iter_calendar_events(credentials, "primary", time_min, time_max)
+            return list(islice(events, max_results))
 
-            # 시간 범위 설정 (기본: 오늘)
-            if not time_min:
-                time_min = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            if not time_max:
-                time_max = datetime.now().replace(hour=23, minute=59, second=59, microsecond=999999)
+        except Exception as e:
+            raise Exception(f"캘린더 일정 조회 실패: {str(e)}")
 
-            # ISO 8601 형식으로 변환
-            time_min_str = time_min.isoformat() + "Z"
-            time_max_str = time_max.isoformat() + "Z"
+    def sync_calendar_events(
+        self,
+        credentials: Credentials,
+        calendar_id: str,
+        sync_token: Optional[str] = None,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        캘린더 일정 동기화 조회 (모든 페이지)
 
-            # 일정 조회
-            events_result = (
-                service.events()
-                .list(
-                    calendarId="primary",
-                    timeMin=time_min_str,
-                    timeMax=time_max_str,
-                    maxResults=max_results,
-                    singleEvents=True,
-                    orderBy="startTime",
-                )
-                .execute()
+        sync_token이 있으면 마지막 동기화 이후 변경분만 조회 (삭제된 일정은 status=cancelled)
+        없으면 time_min ~ time_max 기간 전체 조회 (전체 동기화)
+
+        Args:
+            credentials: 구글 인증 정보
+            calendar_id: 구글 캘린더 ID
+            sync_token: 이전 동기화에서 받은 nextSyncToken
+            time_min: 전체 동기화 조회 시작 시간 (timezone 포함)
+            time_max: 전체 동기화 조회 종료 시간 (timezone 포함)
+
+        Returns:
+            Tuple[List[Dict], Optional[str]]: (일정 목록, 다음 동기화 토큰)
+
+        Raises:
+            CalendarSyncTokenExpiredError: 동기화 토큰 만료 시 (410)
+            Exception: 일정 조회 실패 시
+        """
+        params = self._sync_params(sync_token, time_min, time_max)
+
+        events: List[Dict] = []
+        next_sync_token = None
+        try:
+            pages = self.iter_event_pages(
+                credentials,
+                calendar_id,
+                page_fields="nextPageToken,nextSyncToken",
+                **params,
             )
+            for page in pages:
+                events.extend(page.get("items", []))
+                next_sync_token = page.get("nextSyncToken")
+            return events, next_sync_token
 
-            events = events_result.get("items", [])
-            return events
+        except HttpError as e:
+            raise self._sync_error(calendar_id, e)
 
-        except Exception as e:
-            raise Exception(f"캘린더 일정 조회 실패: {str(e)}")
+    def sync_multiple_calendars(
+        self,
+        credentials: Credentials,
+        requests: Dict[str, Dict],
+    ) -> Dict[str, Union[Tuple[List[Dict], Optional[str]], Exception]]:
+        """
+        여러 캘린더 일정 동기화 조회
+        캘린더별 첫 페이지는 배치 요청으로 묶어 한 번의 HTTP 왕복으로 조회하고,
+        다음 페이지가 있는 캘린더만 이어서 조회
+
+        Args:
+            credentials: 구글 인증 정보
+            requests: 캘린더 ID별 조회 조건 (sync_calendar_events의 sync_token / time_min / time_max)
+
+        Returns:
+            Dict: 캘린더 ID별 (일정 목록, 다음 동기화 토큰) 또는 조회 실패 예외
+            (동기화 토큰 만료 시 CalendarSyncTokenExpiredError)
+        """
+        service = self.get_service("calendar", "v3", credentials)
+        calendar_ids = list(requests)
+        params = {
+            calendar_id: self._sync_params(**requests[calendar_id]) for calendar_id in calendar_ids
+        }
+
+        results: Dict[str, Union[Tuple[List[Dict], Optional[str]], Exception]] = {}
+        next_pages: Dict[str, str] = {}
+
+        def handle_response(request_id, response, exception):
+            calendar_id = calendar_ids[int(request_id)]
+            if exception is not None:
+                results[calendar_id] = (
+                    self._sync_error(calendar_id, exception)
+                    if isinstance(exception, HttpError)
+                    else exception
+                )
+                return
+            results[calendar_id] = (response.get("items", []), response.get("nextSyncToken"))
+            if response.get("nextPageToken"):
+                next_pages[calendar_id] = response["nextPageToken"]
+
+        # 캘린더 ID에 특수문자가 있을 수 있으므로 요청 ID는 목록 인덱스 사용
+        for start in range(0, len(calendar_ids), self.BATCH_MAX_REQUESTS):
+            batch = service.new_batch_http_request(callback=handle_response)
+            for index in range(start, min(start + self.BATCH_MAX_REQUESTS, len(calendar_ids))):
+                calendar_id = calendar_ids[index]
+                batch.add(
+                    service.events().list(
+                        calendarId=calendar_id,
+                        maxResults=self.EVENTS_PAGE_SIZE,
+                        fields=f"nextPageToken,nextSyncToken,items({self.EVENT_FIELDS})",
+                        **params[calendar_id],
+                    ),
+                    request_id=str(index),
+                )
+
+            try:
+                batch.execute()
+            except Exception as e:
+                # 배치 요청 자체 실패 시 해당 묶음의 캘린더는 모두 실패 처리
+                print(f"캘린더 배치 동기화 실패 ({start + 1}번째부터): {e}")
+                for calendar_id in calendar_ids[start:start + self.BATCH_MAX_REQUESTS]:
+                    results.setdefault(calendar_id, e)
+
+        # 변경분이 많은 캘린더는 남은 페이지를 이어서 조회
+        for calendar_id, page_token in next_pages.items():
+            events, next_sync_token = results[calendar_id]
+            try:
+                pages = self.iter_event_pages(
+                    credentials,
+                    calendar_id,
+                    page_token=page_token,
+                    page_fields="nextPageToken,nextSyncToken",
+                    **params[calendar_id],
+                )
+                for page in pages:
+                    events.extend(page.get("items", []))
+                    next_sync_token = page.get("nextSyncToken")
+                results[calendar_id] = (events, next_sync_token)
+            except HttpError as e:
+                results[calendar_id] = self._sync_error(calendar_id, e)
+            except Exception as e:
+                results[calendar_id] = e
+
+        return results
+
+    def _sync_params(
+        self,
+        sync_token: Optional[str] = None,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+    ) -> Dict:
+        """동기화 조회 조건 (syncToken 사용 시 timeMin/timeMax/orderBy는 지정할 수 없음)"""
+        params = {"singleEvents": True}
+        if sync_token:
+            params["syncToken"] = sync_token
+        else:
+            if time_min:
+                params["timeMin"] = self._to_rfc3339(time_min)
+            if time_max:
+                params["timeMax"] = self._to_rfc3339(time_max)
+        return params
+
+    @staticmethod
+    def _sync_error(calendar_id: str, error: HttpError) -> Exception:
+        """동기화 HTTP 오류 변환 (410은 동기화 토큰 만료)"""
+        if error.resp.status == 410:
+            return CalendarSyncTokenExpiredError(f"캘린더 동기화 토큰 만료: {calendar_id}")
+        return Exception(f"캘린더 동기화 실패: {str(error)}")
 
     def get_user_info(self, credentials: Credentials) -> Dict:
         """
@@ -208,9 +492,7 @@ class GoogleAuthService:
             Exception: 사용자 정보 조회 실패 시
         """
         try:
-            from googleapiclient.discovery import build
-
-            service = build("oauth2", "v2", credentials=credentials)
+            service = self.get_service("oauth2", "v2", credentials)
             user_info = service.userinfo().get().execute()
             return user_info
         except Exception as e:
@@ -237,8 +519,8 @@ class GoogleAuthService:
             Exception: 캘린더 목록 조회 실패 시
         """
         try:
-            # Calendar API 서비스 생성
-            service = build("calendar", "v3", credentials=credentials)
+            # Calendar API 서비스 조회 (캐시)
+            service = self.get_service("calendar", "v3", credentials)
 
             # 캘린더 목록 조회
             calendar_list_result = service.calendarList().list().execute()
@@ -269,17 +551,17 @@ class GoogleAuthService:
         calendar_ids: List[str],
         time_min: Optional[datetime] = None,
         time_max: Optional[datetime] = None,
-        max_results: int = 10,
     ) -> Dict[str, List[Dict]]:
         """
         여러 캘린더의 일정 조회
+        캘린더별 첫 페이지는 배치 요청으로 묶어 한 번의 HTTP 왕복으로 조회하고,
+        다음 페이지가 있는 캘린더만 이어서 조회
 
         Args:
             credentials: 구글 인증 정보
             calendar_ids: 조회할 캘린더 ID 리스트
             time_min: 조회 시작 시간 (기본: 오늘 00:00)
             time_max: 조회 종료 시간 (기본: 오늘 23:59)
-            max_results: 캘린더당 최대 조회 개수
 
         Returns:
             Dict[str, List[Dict]]: 캘린더 ID별 일정 리스트
@@ -292,40 +574,60 @@ class GoogleAuthService:
             Exception: 일정 조회 실패 시
         """
         try:
-            # Calendar API 서비스 생성
-            service = build("calendar", "v3", credentials=credentials)
+            # Calendar API 서비스 조회 (캐시)
+            service = self.get_service("calendar", "v3", credentials)
 
             # 시간 범위 설정 (기본: 오늘)
-            if not time_min:
-                time_min = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            if not time_max:
-                time_max = datetime.now().replace(hour=23, minute=59, second=59, microsecond=999999)
-
-            # ISO 8601 형식으로 변환
-            time_min_str = time_min.isoformat() + "Z"
-            time_max_str = time_max.isoformat() + "Z"
-
-            # 각 캘린더별로 일정 조회
-            results = {}
-            for calendar_id in calendar_ids:
-                try:
-                    events_result = (
-                        service.events()
-                        .list(
-                            calendarId=calendar_id,
-                            timeMin=time_min_str,
-                            timeMax=time_max_str,
-                            maxResults=max_results,
+            default_min, default_max = self._today_range()
+            time_min = time_min or default_min
+            time_max = time_max or default_max
+
+            # 개별 캘린더 조회 실패 시 빈 리스트 (다른 캘린더 결과는 유지)
+            results = {calendar_id: [] for calendar_id in calendar_ids}
+            next_pages: Dict[str, str] = {}
+
+            def handle_response(request_id, response, exception):
+                calendar_id = calendar_ids[int(request_id)]
+                if exception is not None:
+                    print(f"캘린더 {calendar_id} 조회 실패: {exception}")
+                    return
+                results[calendar_id] = response.get("items", [])
+                if response.get("nextPageToken"):
+                    next_pages[calendar_id] = response["nextPageToken"]
+
+            # 캘린더 ID에 특수문자가 있을 수 있으므로 요청 ID는 목록 인덱스 사용
+            for start in range(0, len(calendar_ids), self.BATCH_MAX_REQUESTS):
+                batch = service.new_batch_http_request(callback=handle_response)
+                for index in range(start, min(start + self.BATCH_MAX_REQUESTS, len(calendar_ids))):
+                    batch.add(
+                        service.events().list(
+                            calendarId=calendar_ids[index],
+                            timeMin=self._to_rfc3339(time_min),
+                            timeMax=self._to_rfc3339(time_max),
+                            maxResults=self.EVENTS_PAGE_SIZE,
+                            fields=f"nextPageToken,items({self.EVENT_FIELDS})",
                             singleEvents=True,
                             orderBy="startTime",
+                        ),
+                        request_id=str(index),
+                    )
+
+                try:
+                    batch.execute()
+                except Exception as e:
+                    # 배치 요청 자체 실패 시 해당 묶음의 캘린더만 빈 리스트로 유지
+                    print(f"캘린더 배치 조회 실패 ({start + 1}번째부터): {e}")
+
+            # 일정이 많은 캘린더는 남은 페이지를 이어서 조회
+            for calendar_id, page_token in next_pages.items():
+                try:
+                    results[calendar_id].extend(
+                        self.iter_calendar_events(
+                            credentials, calendar_id, time_min, time_max, page_token=page_token
                         )
-                        .execute()
                     )
-                    results[calendar_id] = events_result.get("items", [])
                 except Exception as e:
-                    # 개별 캘린더 조회 실패 시 빈 리스트 (다른 캘린더는 계속 조회)
-                    print(f"캘린더 {calendar_id} 조회 실패: {e}")
-                    results[calendar_id] = []
+                    print(f"캘린더 {calendar_id} 다음 페이지 조회 실패: {e}")
 
             return results
 
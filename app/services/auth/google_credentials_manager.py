@@ -0,0 +1,130 @@
+"""
+구글 Credentials 관리 모듈
+사용자별 Credentials 객체를 메모리에 유지하고, 만료 임박 시 한 번만 갱신 (single-flight)
+"""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+from google.oauth2.credentials import Credentials
+from app.config import settings
+from app.crud import update_user_google_tokens
+from app.models import User
+from app.services.auth.google_auth import google_auth_service
+
+
+class GoogleCredentialsManager:
+    """
+    구글 Credentials 관리
+
+    - get_credentials(): 캐시된 Credentials 반환 (없으면 DB 토큰으로 생성, 만료 임박 시 갱신)
+    - get_credentials_async(): 비동기 핸들러용 (갱신이 필요하면 잠금 대기와 갱신 요청을 별도 스레드에서 실행)
+    - 갱신은 사용자별 잠금 안에서 수행하여 동시 요청이 있어도 토큰 갱신은 1회만 실행
+    - 토큰이 실제로 바뀐 경우에만 DB 저장
+    """
+
+    def __init__(self):
+        self.auth = google_auth_service
+        self.refresh_margin = timedelta(seconds=settings.GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS)
+        self._credentials: Dict[int, Credentials] = {}
+        self._locks: Dict[int, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def _lock_for(self, user_id: int) -> threading.Lock:
+        """사용자별 갱신 잠금"""
+        with self._locks_lock:
+            return self._locks.setdefault(user_id, threading.Lock())
+
+    def _needs_refresh(self, credentials: Credentials) -> bool:
+        """만료 또는 만료 임박 여부 (Credentials.expiry는 naive UTC)"""
+        if not credentials.refresh_token:
+            return False
+        if credentials.expiry is None:
+            return not credentials.token
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return credentials.expiry - self.refresh_margin <= now
+
+    def invalidate(self, user_id: int):
+        """
+        캐시 무효화 (로그인/연동 해제 등 DB 토큰이 직접 변경된 경우)
+
+        Args:
+            user_id: 사용자 ID
+        """
+        with self._lock_for(user_id):
+            self._credentials.pop(user_id, None)
+
+    def get_credentials(self, db, user: User) -> Credentials:
+        """
+        사용자 Credentials 조회
+
+        Args:
+            db: 데이터베이스 세션 (갱신된 토큰 저장용)
+            user: 사용자 객체 (google_access_token, google_refresh_token 필요)
+
+        Returns:
+            Credentials: 유효한 구글 인증 정보 객체
+
+        Raises:
+            Exception: 토큰 갱신 실패 시
+        """
+        with self._lock_for(user.user_id):
+            credentials = self._credentials.get(user.user_id)
+            if credentials is None:
+                credentials = self.auth.create_credentials(
+                    access_token=user.google_access_token,
+                    refresh_token=user.google_refresh_token,
+                    token_expiry=user.google_token_expiry,
+                )
+                self._credentials[user.user_id] = credentials
+
+            # 잠금 안에서 다시 확인하므로 먼저 갱신한 요청이 있으면 그 결과를 그대로 사용
+            if self._needs_refresh(credentials):
+                previous_token = credentials.token
+                try:
+                    credentials = self.auth.refresh_credentials(credentials)
+                except Exception:
+                    # 갱신 중 상태가 바뀌었을 수 있으므로 다음 요청은 DB 토큰으로 다시 생성
+                    self._credentials.pop(user.user_id, None)
+                    raise
+
+                self._credentials[user.user_id] = credentials
+                if credentials.token != previous_token:
+                    update_user_google_tokens(
+                        db,
+                        user.user_id,
+                        credentials.token,
+                        credentials.refresh_token,
+                        credentials.expiry,
+                    )
+                    print(f"🔑 구글 토큰 갱신 완료 (user_id: {user.user_id})")
+
+            return credentials
+
+    async def get_credentials_async(self, db, user: User) -> Credentials:
+        """
+        사용자 Credentials 조회 (비동기 버전)
+
+        캐시된 Credentials가 유효하면 잠금 없이 바로 반환하고,
+        그 외에는 get_credentials를 별도 스레드에서 실행하여 이벤트 루프 차단 방지
+
+        Args:
+            db: 데이터베이스 세션 (갱신된 토큰 저장용)
+            user: 사용자 객체 (google_access_token, google_refresh_token 필요)
+
+        Returns:
+            Credentials: 유효한 구글 인증 정보 객체
+
+        Raises:
+            Exception: 토큰 갱신 실패 시
+        """
+        credentials = self._credentials.get(user.user_id)
+        if credentials is not None and not self._needs_refresh(credentials):
+            return credentials
+
+        return await asyncio.to_thread(self.get_credentials, db, user)
+
+
+# 싱글톤 인스턴스
+google_credentials_manager = GoogleCredentialsManager()
@@ -4,9 +4,13 @@
 """
 
 import json
-import httpx
 from typing import Dict, Optional
 from app.config import settings
+from app.services.http_client import http_clients, get_retry_after, RateLimitedError
+
+
+class KakaoUnauthorizedError(Exception):
+    """카카오 액세스 토큰 만료 또는 무효 (HTTP 401)"""
 
 
 class KakaoAuthService:
@@ -54,19 +58,19 @@ class KakaoAuthService:
             "code": code,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.token_url,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
+        client = http_clients.get(self.token_url)
+        response = await client.post(
+            self.token_url,
+            data=data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
 
-            if response.status_code != 200:
-                raise Exception(
-                    f"카카오 토큰 발급 실패: {response.status_code} - {response.text}"
-                )
+        if response.status_code != 200:
+            raise Exception(
+                f"카카오 토큰 발급 실패: {response.status_code} - {response.text}"
+            )
 
-            return response.json()
+        return response.json()
 
     async def refresh_access_token(self, refresh_token: str) -> Dict:
         """
@@ -87,19 +91,19 @@ class KakaoAuthService:
             "refresh_token": refresh_token,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.token_url,
-                data=data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
+        client = http_clients.get(self.token_url)
+        response = await client.post(
+            self.token_url,
+            data=data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
 
-            if response.status_code != 200:
-                raise Exception(
-                    f"카카오 토큰 갱신 실패: {response.status_code} - {response.text}"
-                )
+        if response.status_code != 200:
+            raise Exception(
+                f"카카오 토큰 갱신 실패: {response.status_code} - {response.text}"
+            )
 
-            return response.json()
+        return response.json()
 
     async def send_message_to_me(
         self, access_token: str, message: str, link: Optional[Dict] = None
@@ -116,6 +120,8 @@ class KakaoAuthService:
             Dict: API 응답
 
         Raises:
+            KakaoUnauthorizedError: 액세스 토큰 만료/무효 시 (401)
+            RateLimitedError: 요청 한도 초과 시 (429)
             Exception: 메시지 발송 실패 시
         """
         url = f"{self.api_url}/v2/api/talk/memo/default/send"
@@ -135,15 +141,26 @@ class KakaoAuthService:
             "Content-Type": "application/x-www-form-urlencoded",
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, data=data, headers=headers)
+        client = http_clients.get(url)
+        response = await client.post(url, data=data, headers=headers)
 
-            if response.status_code != 200:
-                raise Exception(
-                    f"카카오 메시지 발송 실패: {response.status_code} - {response.text}"
-                )
+        if response.status_code == 401:
+            raise KakaoUnauthorizedError(
+                f"카카오 액세스 토큰 만료: {response.text}"
+            )
+
+        if response.status_code == 429:
+            raise RateLimitedError(
+                f"카카오 메시지 발송 한도 초과: {response.text}",
+                retry_after=get_retry_after(response),
+            )
 
-            return response.json()
+        if response.status_code != 200:
+            raise Exception(
+                f"카카오 메시지 발송 실패: {response.status_code} - {response.text}"
+            )
+
+        return response.json()
 
     async def get_user_info(self, access_token: str) -> Dict:
         """
@@ -165,15 +182,15 @@ class KakaoAuthService:
             "Content-Type": "application/x-www-form-urlencoded",
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
+        client = http_clients.get(url)
+        response = await client.get(url, headers=headers)
 
-            if response.status_code != 200:
-                raise Exception(
-                    f"카카오 사용자 정보 조회 실패: {response.status_code} - {response.text}"
-                )
+        if response.status_code != 200:
+            raise Exception(
+                f"카카오 사용자 정보 조회 실패: {response.status_code} - {response.text}"
+            )
 
-            return response.json()
+        return response.json()
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,218 @@
+"""
+카카오 액세스 토큰 관리 모듈
+만료 시각을 추적하여 만료 전에 토큰을 갱신하고, 발송마다 DB를 조회하지 않도록 메모리에 캐시
+"""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+from app.config import settings
+from app.database import SessionLocal
+from app.crud import (
+    create_log,
+    get_user,
+    get_users_with_expiring_kakao_token,
+    update_user_kakao_tokens,
+)
+from app.models import User
+from app.services.auth.kakao_auth import kakao_auth_service
+
+# 다른 이벤트 루프가 갱신 중일 때 잠금 재확인 간격 (초)
+REFRESH_LOCK_POLL_SECONDS = 0.05
+
+
+class KakaoTokenManager:
+    """
+    카카오 액세스 토큰 관리
+
+    - get_access_token(): 캐시된 토큰 반환 (만료 임박 시 갱신)
+    - refresh(): Refresh Token으로 갱신 후 DB 저장 및 캐시 교체
+      (사용자별 1회만 동시 실행, FastAPI 루프와 스케줄러 루프 사이에서도 공유)
+    - refresh_expiring(): 만료 임박 토큰 일괄 갱신 (스케줄러에서 주기 실행)
+    """
+
+    def __init__(self):
+        self.auth = kakao_auth_service
+        self.refresh_margin = timedelta(minutes=settings.KAKAO_TOKEN_REFRESH_MARGIN_MINUTES)
+        # user_id -> (access_token, 만료 시각)
+        self._cache: Dict[int, Tuple[str, Optional[datetime]]] = {}
+        self._cache_lock = threading.Lock()
+        # 사용자별 갱신 잠금 (이벤트 루프 간 공유를 위해 threading.Lock 사용)
+        self._refresh_locks: Dict[int, threading.Lock] = {}
+
+    def _is_expiring(self, expiry: Optional[datetime]) -> bool:
+        """만료 임박 여부 (만료 시각을 모르면 임박하지 않은 것으로 간주, 401 응답 시 갱신)"""
+        return expiry is not None and expiry - self.refresh_margin <= datetime.now()
+
+    @asynccontextmanager
+    async def _refresh_lock(self, user_id: int):
+        """
+        사용자별 갱신 잠금 (모든 이벤트 루프 공유)
+
+        루프를 막지 않도록 대기 중에는 비차단 획득을 반복 (취소되어도 잠금이 남지 않음)
+        """
+        with self._cache_lock:
+            lock = self._refresh_locks.setdefault(user_id, threading.Lock())
+        while not lock.acquire(blocking=False):
+            await asyncio.sleep(REFRESH_LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            lock.release()
+
+    def _cached(self, user_id: int) -> Optional[Tuple[str, Optional[datetime]]]:
+        with self._cache_lock:
+            return self._cache.get(user_id)
+
+    def _store(self, user_id: int, access_token: str, expiry: Optional[datetime]):
+        with self._cache_lock:
+            self._cache[user_id] = (access_token, expiry)
+
+    def invalidate(self, user_id: Optional[int] = None):
+        """
+        캐시 무효화 (로그인/연동 해제 등 DB 토큰이 직접 변경된 경우)
+
+        Args:
+            user_id: 사용자 ID (None이면 전체)
+        """
+        with self._cache_lock:
+            if user_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(user_id, None)
+
+    async def get_access_token(self, user: User) -> Optional[str]:
+        """
+        발송에 사용할 액세스 토큰 조회
+
+        Args:
+            user: 사용자 객체
+
+        Returns:
+            str: 액세스 토큰 (연동되지 않은 경우 None)
+        """
+        cached = self._cached(user.user_id)
+        if cached is None:
+            if not user.kakao_access_token:
+                return None
+            cached = (user.kakao_access_token, user.kakao_token_expiry)
+            self._store(user.user_id, *cached)
+
+        access_token, expiry = cached
+        if self._is_expiring(expiry):
+            try:
+                return await self.refresh(user.user_id, stale_token=access_token)
+            except Exception as e:
+                # 갱신 실패 시 기존 토큰으로 발송 시도 (아직 만료 전일 수 있음)
+                print(f"⚠️  카카오 토큰 갱신 실패, 기존 토큰 사용: {e}")
+        return access_token
+
+    async def refresh(self, user_id: int, stale_token: Optional[str] = None) -> str:
+        """
+        Refresh Token으로 액세스 토큰 갱신
+
+        같은 사용자의 갱신 요청이 동시에 들어오면 (다른 이벤트 루프 포함) 하나만 갱신하고,
+        잠금을 얻은 뒤 저장된 토큰이 이미 교체되었으면 Refresh Token을 다시 쓰지 않고 재사용
+
+        Args:
+            user_id: 사용자 ID
+            stale_token: 만료된 것으로 확인된 토큰 (캐시/DB 토큰이 이와 다르면 이미 갱신된 것,
+                         None이면 항상 갱신)
+
+        Returns:
+            str: 새 액세스 토큰
+
+        Raises:
+            Exception: Refresh Token이 없거나 갱신 실패 시
+        """
+        async with self._refresh_lock(user_id):
+            cached = self._cached(user_id)
+            if (
+                cached is not None
+                and stale_token is not None
+                and cached[0] != stale_token
+                and not self._is_expiring(cached[1])
+            ):
+                return cached[0]
+
+            db = SessionLocal()
+            try:
+                user = get_user(db, user_id)
+                if not user or not user.kakao_refresh_token:
+                    raise Exception("카카오 Refresh Token이 없습니다")
+
+                # 다른 프로세스/캐시 무효화 등으로 DB 토큰만 이미 교체된 경우
+                if (
+                    stale_token is not None
+                    and user.kakao_access_token
+                    and user.kakao_access_token != stale_token
+                    and not self._is_expiring(user.kakao_token_expiry)
+                ):
+                    self._store(user_id, user.kakao_access_token, user.kakao_token_expiry)
+                    return user.kakao_access_token
+
+                token_data = await self.auth.refresh_access_token(user.kakao_refresh_token)
+                access_token = token_data["access_token"]
+                refresh_token = token_data.get("refresh_token", user.kakao_refresh_token)
+                expiry = self.expiry_from(token_data)
+
+                update_user_kakao_tokens(db, user_id, access_token, refresh_token, expiry)
+                self._store(user_id, access_token, expiry)
+                print(f"🔑 카카오 토큰 갱신 완료 (user_id: {user_id})")
+                return access_token
+
+            except Exception as e:
+                create_log(db, "auth", "FAIL", f"카카오 토큰 자동 갱신 실패: {str(e)}")
+                raise
+
+            finally:
+                db.close()
+
+    @staticmethod
+    def expiry_from(token_data: Dict) -> Optional[datetime]:
+        """토큰 응답의 expires_in(초)으로 만료 시각 계산"""
+        expires_in = token_data.get("expires_in")
+        if expires_in is None:
+            return None
+        return datetime.now() + timedelta(seconds=int(expires_in))
+
+    async def refresh_expiring(self) -> int:
+        """
+        만료 임박 토큰 일괄 갱신
+
+        Returns:
+            int: 갱신 성공 건수
+        """
+        db = SessionLocal()
+        try:
+            users = get_users_with_expiring_kakao_token(db, datetime.now() + self.refresh_margin)
+            # 조회 시점 토큰을 함께 넘겨 그 사이 다른 루프에서 갱신했으면 생략
+            expiring = [(user.user_id, user.kakao_access_token) for user in users]
+        finally:
+            db.close()
+
+        refreshed = 0
+        for user_id, access_token in expiring:
+            try:
+                await self.refresh(user_id, stale_token=access_token)
+                refreshed += 1
+            except Exception as e:
+                print(f"❌ 카카오 토큰 사전 갱신 실패 (user_id: {user_id}): {e}")
+        return refreshed
+
+
+# 싱글톤 인스턴스
+kakao_token_manager = KakaoTokenManager()
+
+
+# 스케줄러에서 호출할 함수
+def refresh_kakao_tokens_sync():
+    """동기 방식으로 만료 임박 카카오 토큰 갱신"""
+    from app.services.scheduler import scheduler_service
+
+    try:
+        scheduler_service.run_coroutine(kakao_token_manager.refresh_expiring())
+    except Exception as e:
+        print(f"❌ 카카오 토큰 갱신 실행 오류: {e}")
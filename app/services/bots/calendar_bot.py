@@ -5,11 +5,13 @@ Google Calendar API를 사용한 일정 조회 및 알림
 
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 import json
 from app.database import SessionLocal
 from app.crud import get_or_create_user, create_log, is_setting_active, get_setting_by_category
 from app.services.auth.google_auth import google_auth_service
+from app.services.auth.google_credentials_manager import google_credentials_manager
+from app.services.calendar_cache import calendar_cache
 from app.services.notification import notification_service
 
 
@@ -19,17 +21,21 @@ class CalendarBot:
     def __init__(self):
         pass
 
-    def get_today_events(self, credentials) -> Optional[List[Dict]]:
+    def get_today_events(self, credentials, user_id: Optional[int] = None) -> Optional[List[Dict]]:
         """
-        오늘의 일정 조회
+        오늘의 일정 조회 (Primary 캘린더)
 
         Args:
             credentials: 구글 인증 정보
+            user_id: 사용자 ID (지정 시 로컬 일정 캐시에서 조회)
 
         Returns:
             List[Dict]: 일정 리스트 또는 None
         """
         try:
+            if user_id is not None:
+                return calendar_cache.get_today_events(credentials, user_id, ["primary"])["primary"]
+
             events = google_auth_service.get_calendar_events(credentials)
             return events
         except Exception as e:
@@ -40,7 +46,8 @@ class CalendarBot:
         self,
         credentials,
         calendar_ids: List[str],
-        calendar_names: Optional[Dict[str, str]] = None
+        calendar_names: Optional[Dict[str, str]] = None,
+        user_id: Optional[int] = None,
     ) -> Optional[Dict[str, List[Dict]]]:
         """
         여러 캘린더의 오늘 일정 조회
@@ -49,11 +56,17 @@ class CalendarBot:
             credentials: 구글 인증 정보
             calendar_ids: 조회할 캘린더 ID 리스트
             calendar_names: 캘린더 ID -> 이름 매핑 (선택)
+            user_id: 사용자 ID (지정 시 로컬 일정 캐시에서 조회)
 
         Returns:
             Dict[str, List[Dict]]: 캘린더 ID별 일정 리스트 또는 None
         """
         try:
+            if user_id is not None:
+                # 조회 실패한 캘린더는 빈 리스트 (다른 캘린더는 계속 표시)
+                cached = calendar_cache.get_today_events(credentials, user_id, calendar_ids)
+                return {calendar_id: events or [] for calendar_id, events in cached.items()}
+
             events_by_calendar = google_auth_service.get_multiple_calendars_events(
                 credentials,
                 calendar_ids
@@ -63,12 +76,12 @@ class CalendarBot:
             print(f"다중 캘린더 일정 조회 실패: {e}")
             return None
 
-    def format_calendar_message(self, events: List[Dict]) -> str:
+    def format_calendar_message(self, events: Iterable[Dict]) -> str:
         """
         일정 데이터를 메시지 형식으로 포맷팅
 
         Args:
-            events: 구글 캘린더 일정 리스트
+            events: 구글 캘린더 일정 (리스트 등 한 번만 순회 가능한 목록도 가능)
 
         Returns:
             str: 포맷팅된 메시지
@@ -82,11 +95,7 @@ class CalendarBot:
 
 """
 
-            if not events:
-                message += "오늘 예정된 일정이 없습니다."
-                return message
-
-            # 종일 일정과 시간 지정 일정 분리
+            # 종일 일정과 시간 지정 일정 분리 (일정 목록은 한 번만 순회)
             all_day_events = []
             timed_events = []
 
@@ -129,6 +138,10 @@ class CalendarBot:
                         "hangout_link": hangout_link
                     })
 
+            if not all_day_events and not timed_events:
+                message += "오늘 예정된 일정이 없습니다."
+                return message
+
             # 종일 일정 출력
             if all_day_events:
                 message += "[ 종일 일정 ]\n"
@@ -312,27 +325,9 @@ class CalendarBot:
                 print("구글 로그인이 필요합니다")
                 return
 
-            # 구글 Credentials 생성
+            # 구글 Credentials 조회 (캐시, 만료 임박 시 갱신)
             try:
-                credentials = google_auth_service.create_credentials(
-                    access_token=user.google_access_token,
-                    refresh_token=user.google_refresh_token,
-                    token_expiry=user.google_token_expiry,
-                )
-
-                # 토큰 만료 시 갱신
-                if credentials.expired and credentials.refresh_token:
-                    credentials = google_auth_service.refresh_credentials(credentials)
-                    # 갱신된 토큰 DB 저장
-                    from app.crud import update_user_google_tokens
-
-                    update_user_google_tokens(
-                        db,
-                        user.user_id,
-                        credentials.token,
-                        credentials.refresh_token,
-                        credentials.expiry,
-                    )
+                credentials = await google_credentials_manager.get_credentials_async(db, user)
 
             except Exception as e:
                 create_log(db, "calendar", "FAIL", f"구글 인증 실패: {str(e)}")
@@ -353,7 +348,7 @@ class CalendarBot:
             # 선택된 캘린더가 없으면 Primary만 사용
             event_count = 0
             if not selected_calendars:
-                events = self.get_today_events(credentials)
+                events = self.get_today_events(credentials, user_id=user.user_id)
                 if events is None:
                     create_log(db, "calendar", "FAIL", "일정 조회 실패")
                     return
@@ -369,7 +364,8 @@ class CalendarBot:
 
                 events_by_calendar = self.get_multiple_calendars_today_events(
                     credentials,
-                    calendar_ids
+                    calendar_ids,
+                    user_id=user.user_id,
                 )
 
                 if events_by_calendar is None:
@@ -432,9 +428,9 @@ def send_calendar_notification_sync():
     동기 방식으로 캘린더 알림 발송
     스케줄러에서 비동기 함수를 호출하기 위한 래퍼
     """
-    import asyncio
+    from app.services.scheduler import scheduler_service
 
     try:
-        asyncio.run(calendar_bot.send_calendar_notification())
+        scheduler_service.run_coroutine(calendar_bot.send_calendar_notification())
     except Exception as e:
         print(f"캘린더 알림 실행 오류: {e}")
@@ -3,22 +3,38 @@
 Yahoo Finance 및 PyKRX를 사용한 증시 정보 수집 및 알림
 """
 
+import asyncio
+import json
+import pandas as pd
 import yfinance as yf
 from pykrx import stock
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from app.config import settings
 from app.database import SessionLocal
 from app.crud import (
     get_or_create_user,
+    get_user,
     create_log,
     is_setting_active,
     get_watchlists,
-    get_watchlist,
-    get_price_alerts,
+    get_setting_by_category,
+    update_alert_reference_price,
     update_alert_triggered,
 )
-from app.services.notification import notification_service
+from app.services.notification import notification_service, notification_outbox
+from app.services.market import (
+    market_data_executor,
+    quote_cache,
+    alert_index,
+    poll_scheduler,
+    quote_stream,
+    trading_calendar,
+    history_store,
+    kr_ticker_directory,
+    us_ticker_directory,
+)
 
 
 class FinanceBot:
@@ -31,6 +47,10 @@ class FinanceBot:
             "^IXIC": "Nasdaq",
             "^DJI": "Dow Jones",
         }
+        # 다이제스트 대기 중인 발동 알림 (user_id -> alert_id -> 알림 정보)
+        self._alert_digest: Dict[int, Dict[int, Dict]] = {}
+        # 사용자별 다이제스트 묶음 시작 시각
+        self._alert_digest_started: Dict[int, datetime] = {}
 
     # ============================================================
     # 개별 종목 조회 기능
@@ -57,13 +77,23 @@ class FinanceBot:
             }
         """
         try:
+            # 캐시된 시세가 있으면 재사용
+            cached = quote_cache.get(ticker, market)
+            if cached is not None:
+                return cached
+
             if market == "US":
-                return self._get_us_stock_quote(ticker)
+                quote = self._get_us_stock_quote(ticker)
             elif market == "KR":
-                return self._get_kr_stock_quote(ticker)
+                quote = self._get_kr_stock_quote(ticker)
             else:
                 print(f"⚠️  지원하지 않는 시장: {market}")
                 return None
+
+            if quote:
+                quote_cache.set(ticker, market, quote)
+            return quote
+
         except Exception as e:
             print(f"❌ 종목 시세 조회 실패 ({ticker}): {e}")
             return None
@@ -79,26 +109,14 @@ class FinanceBot:
 
             # 종목 정보
             info = stock.info
-            current_price = hist["Close"].iloc[-1]
 
-            # 전일 대비 변동
-            if len(hist) >= 2:
-                previous_price = hist["Close"].iloc[-2]
-                change = current_price - previous_price
-                change_percent = (change / previous_price) * 100
-            else:
-                change = 0
-                change_percent = 0
-
-            return {
-                "ticker": ticker,
-                "name": info.get("longName", info.get("shortName", ticker)),
-                "price": current_price,
-                "change": change,
-                "change_percent": change_percent,
-                "volume": hist["Volume"].iloc[-1],
-                "market_cap": info.get("marketCap"),
-            }
+            return self._build_quote(
+                ticker,
+                info.get("longName", info.get("shortName", ticker)),
+                hist["Close"],
+                hist["Volume"],
+                market_cap=info.get("marketCap"),
+            )
 
         except Exception as e:
             print(f"❌ 미국 종목 조회 실패 ({ticker}): {e}")
@@ -122,28 +140,7 @@ class FinanceBot:
             if df.empty:
                 return None
 
-            # 최신 데이터
-            current_price = df["종가"].iloc[-1]
-            current_volume = df["거래량"].iloc[-1]
-
-            # 전일 대비 변동
-            if len(df) >= 2:
-                previous_price = df["종가"].iloc[-2]
-                change = current_price - previous_price
-                change_percent = (change / previous_price) * 100
-            else:
-                change = 0
-                change_percent = 0
-
-            return {
-                "ticker": ticker,
-                "name": name,
-                "price": current_price,
-                "change": change,
-                "change_percent": change_percent,
-                "volume": current_volume,
-                "market_cap": None,
-            }
+            return self._build_quote(ticker, name, df["종가"], df["거래량"])
 
         except Exception as e:
             print(f"❌ 한국 종목 조회 실패 ({ticker}): {e}")
@@ -151,86 +148,328 @@ class FinanceBot:
             print(traceback.format_exc())
             return None
 
-    def calculate_period_changes(self, ticker: str, market: str = "US") -> Optional[Dict]:
+    def get_stock_quotes(
+        self, symbols: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Dict]:
         """
-        종목의 일/주/월 변동률 계산
+        여러 종목 시세 일괄 조회
+        (ticker, market) 단위로 중복을 제거한 뒤 시장별로 한 번에 조회
+
+        Args:
+            symbols: (ticker, market) 튜플 목록
+
+        Returns:
+            Dict: (ticker, market) -> 종목 시세 정보 (조회 실패 종목은 제외)
+        """
+        quotes = {}
+        missing_symbols = []
+
+        # 캐시된 시세 우선 사용
+        for symbol in dict.fromkeys(symbols):
+            cached = quote_cache.get(*symbol)
+            if cached is not None:
+                quotes[symbol] = cached
+            else:
+                missing_symbols.append(symbol)
+
+        us_tickers = [ticker for ticker, market in missing_symbols if market == "US"]
+        kr_tickers = [ticker for ticker, market in missing_symbols if market == "KR"]
+
+        fetched = {}
+        if us_tickers:
+            for ticker, quote in self._get_us_stock_quotes_batch(us_tickers).items():
+                fetched[(ticker, "US")] = quote
+
+        if kr_tickers:
+            for ticker, quote in self._get_kr_stock_quotes_batch(kr_tickers).items():
+                fetched[(ticker, "KR")] = quote
+
+        for (ticker, market), quote in fetched.items():
+            # 일괄 조회는 종목명을 제공하지 않으므로 이전에 조회한 종목명 유지
+            previous = quote_cache.peek(ticker, market)
+            if previous and quote.get("name") == ticker:
+                quote["name"] = previous.get("name", ticker)
+                quote["market_cap"] = previous.get("market_cap")
+
+            quote_cache.set(ticker, market, quote)
+            quotes[(ticker, market)] = quote
+
+        return quotes
+
+    def _get_us_stock_quotes_batch(self, tickers: List[str]) -> Dict[str, Dict]:
+        """미국 종목 시세 일괄 조회 (yf.download 1회)"""
+        results = {}
+
+        try:
+            # 종목별 휴장일 차이로 인한 결측치 대응을 위해 5일치 조회
+            data = yf.download(
+                tickers,
+                period="5d",
+                group_by="ticker",
+                auto_adjust=True,
+                progress=False,
+                threads=True,
+            )
+
+            if data is None or data.empty:
+                return results
+
+            for ticker in tickers:
+                try:
+                    if isinstance(data.columns, pd.MultiIndex):
+                        if ticker not in data.columns.get_level_values(0):
+                            continue
+                        hist = data[ticker]
+                    else:
+                        hist = data
+
+                    hist = hist.dropna(subset=["Close"])
+                    if hist.empty:
+                        continue
+
+                    results[ticker] = self._build_quote(
+                        ticker, ticker, hist["Close"], hist["Volume"]
+                    )
+
+                except Exception as e:
+                    print(f"⚠️  미국 종목 일괄 조회 결과 처리 실패 ({ticker}): {e}")
+
+        except Exception as e:
+            print(f"❌ 미국 종목 일괄 조회 실패: {e}")
+
+        return results
+
+    def _get_kr_stock_quotes_batch(self, tickers: List[str]) -> Dict[str, Dict]:
+        """
+        한국 종목 시세 일괄 조회
+        전종목 OHLCV를 한 번에 조회하고, 누락된 종목(ETF 등)만 개별 조회
+        """
+        results = {}
+        missing = list(tickers)
+
+        try:
+            today = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y%m%d")
+            # 휴장일이면 직전 영업일 데이터 사용
+            df = stock.get_market_ohlcv_by_ticker(today, market="ALL", alternative=True)
+
+            if df is not None and not df.empty:
+                missing = []
+                for ticker in tickers:
+                    if ticker not in df.index:
+                        missing.append(ticker)
+                        continue
+
+                    row = df.loc[ticker]
+                    current_price = row["종가"]
+                    change_percent = row["등락률"]
+                    previous_price = current_price / (1 + change_percent / 100)
+
+                    results[ticker] = {
+                        "ticker": ticker,
+                        "name": stock.get_market_ticker_name(ticker),
+                        "price": current_price,
+                        "change": current_price - previous_price,
+                        "change_percent": change_percent,
+                        "volume": row["거래량"],
+                        "market_cap": None,
+                    }
+
+        except Exception as e:
+            print(f"⚠️  한국 전종목 시세 조회 실패, 개별 조회로 대체: {e}")
+
+        for ticker in missing:
+            quote = self._get_kr_stock_quote(ticker)
+            if quote:
+                results[ticker] = quote
+
+        return results
+
+    def _build_quote(
+        self,
+        ticker: str,
+        name: str,
+        closes: pd.Series,
+        volumes: pd.Series,
+        market_cap: Optional[float] = None,
+    ) -> Dict:
+        """종가/거래량 시계열로 시세 정보 구성"""
+        current_price = closes.iloc[-1]
+
+        # 전일 대비 변동
+        if len(closes) >= 2:
+            previous_price = closes.iloc[-2]
+            change = current_price - previous_price
+            change_percent = (change / previous_price) * 100
+        else:
+            change = 0
+            change_percent = 0
+
+        return {
+            "ticker": ticker,
+            "name": name,
+            "price": current_price,
+            "change": change,
+            "change_percent": change_percent,
+            "volume": volumes.iloc[-1],
+            "market_cap": market_cap,
+        }
+
+    def get_symbol_snapshot(
+        self, ticker: str, market: str = "US", include_info: bool = True
+    ) -> Optional[Dict]:
+        """
+        종목 스냅샷 조회
+        1년치 OHLCV를 한 번만 조회하여 시세, 기간별 변동률, 52주 범위를 함께 계산
 
         Args:
             ticker: 종목 티커
             market: 시장 (US / KR)
+            include_info: 종목명/시가총액 조회 여부 (False면 종목명은 티커로 대체)
 
         Returns:
-            Dict: 기간별 변동률
+            Dict: 종목 스냅샷 또는 None
             {
-                "daily": float,
-                "weekly": float,
-                "monthly": float
+                "quote": Dict,
+                "period_changes": Dict,
+                "week_52_range": Dict
             }
         """
         try:
-            if market == "US":
-                stock_obj = yf.Ticker(ticker)
-                hist = stock_obj.history(period="2mo")
+            hist = self._fetch_history(ticker, market, days=365)
+            if hist is None or hist.empty:
+                return None
 
-                if hist.empty:
-                    return None
+            name = ticker
+            market_cap = None
+            if include_info:
+                if market == "US":
+                    info = yf.Ticker(ticker).info
+                    name = info.get("longName", info.get("shortName", ticker))
+                    market_cap = info.get("marketCap")
+                else:
+                    name = stock.get_market_ticker_name(ticker) or ticker
 
-                current_price = hist["Close"].iloc[-1]
+            quote = self._build_quote(
+                ticker, name, hist["Close"], hist["Volume"], market_cap=market_cap
+            )
 
-                # 일간 변동률
-                daily_change = 0
-                if len(hist) >= 2:
-                    daily_change = ((current_price - hist["Close"].iloc[-2]) / hist["Close"].iloc[-2]) * 100
+            # 종목명까지 확보한 시세는 캐시에 저장
+            if include_info:
+                quote_cache.set(ticker, market, quote)
 
-                # 주간 변동률 (5 거래일)
-                weekly_change = 0
-                if len(hist) >= 6:
-                    weekly_change = ((current_price - hist["Close"].iloc[-6]) / hist["Close"].iloc[-6]) * 100
+            return {
+                "quote": quote,
+                "period_changes": self._calc_period_changes(hist["Close"]),
+                "week_52_range": self._calc_52week_range(hist),
+            }
+
+        except Exception as e:
+            print(f"❌ 종목 스냅샷 조회 실패 ({ticker}): {e}")
+            return None
+
+    def _fetch_history(
+        self, ticker: str, market: str, days: int
+    ) -> Optional[pd.DataFrame]:
+        """
+        일봉 OHLCV 조회 (로컬 저장소 우선, 신규 일봉만 다운로드)
+        시장과 관계없이 Open/High/Low/Close/Volume 컬럼으로 통일하여 반환
+        """
+        if market not in ("US", "KR"):
+            print(f"⚠️  지원하지 않는 시장: {market}")
+            return None
 
-                # 월간 변동률 (21 거래일)
-                monthly_change = 0
-                if len(hist) >= 22:
-                    monthly_change = ((current_price - hist["Close"].iloc[-22]) / hist["Close"].iloc[-22]) * 100
+        return history_store.get_history(ticker, market, days, self._download_history)
+
+    def _download_history(
+        self, ticker: str, market: str, start_date: date
+    ) -> Optional[pd.DataFrame]:
+        """원격 일봉 다운로드 (start_date ~ 오늘)"""
+        if market == "US":
+            hist = yf.Ticker(ticker).history(
+                start=start_date.strftime("%Y-%m-%d"),
+                timeout=settings.MARKET_DATA_REQUEST_TIMEOUT,
+            )
+            if hist.empty:
+                return None
+            return hist[["Open", "High", "Low", "Close", "Volume"]]
+
+        elif market == "KR":
+            end_date = datetime.now(ZoneInfo("Asia/Seoul")).strftime("%Y%m%d")
 
-                return {
-                    "daily": daily_change,
-                    "weekly": weekly_change,
-                    "monthly": monthly_change,
+            df = stock.get_market_ohlcv_by_date(
+                start_date.strftime("%Y%m%d"), end_date, ticker
+            )
+            if df.empty:
+                return None
+            return df.rename(
+                columns={
+                    "시가": "Open",
+                    "고가": "High",
+                    "저가": "Low",
+                    "종가": "Close",
+                    "거래량": "Volume",
                 }
+            )[["Open", "High", "Low", "Close", "Volume"]]
 
-            elif market == "KR":
-                # 한국 종목
-                today = datetime.now(ZoneInfo("Asia/Seoul"))
-                start_date = (today - timedelta(days=60)).strftime("%Y%m%d")
-                end_date = today.strftime("%Y%m%d")
+        return None
 
-                df = stock.get_market_ohlcv_by_date(start_date, end_date, ticker)
+    def _calc_period_changes(self, closes: pd.Series) -> Dict:
+        """종가 시계열로 일/주/월 변동률 계산"""
+        current_price = closes.iloc[-1]
 
-                if df.empty:
-                    return None
+        def change_from(offset: int) -> float:
+            # offset 거래일 전 대비 변동률 (데이터 부족 시 0)
+            if len(closes) < offset + 1:
+                return 0
+            base_price = closes.iloc[-(offset + 1)]
+            return ((current_price - base_price) / base_price) * 100
 
-                current_price = df["종가"].iloc[-1]
+        return {
+            "daily": change_from(1),
+            "weekly": change_from(5),  # 5 거래일
+            "monthly": change_from(21),  # 21 거래일
+        }
 
-                # 일간 변동률
-                daily_change = 0
-                if len(df) >= 2:
-                    daily_change = ((current_price - df["종가"].iloc[-2]) / df["종가"].iloc[-2]) * 100
+    def _calc_52week_range(self, hist: pd.DataFrame) -> Dict:
+        """OHLCV로 52주 고점/저점 및 현재가 위치 계산"""
+        low_52week = hist["Low"].min()
+        high_52week = hist["High"].max()
+        current_price = hist["Close"].iloc[-1]
+
+        # 현재가 위치 계산 (0~100%)
+        position_percent = 0
+        if high_52week > low_52week:
+            position_percent = ((current_price - low_52week) / (high_52week - low_52week)) * 100
+
+        return {
+            "low": low_52week,
+            "high": high_52week,
+            "current": current_price,
+            "position_percent": position_percent,
+        }
 
-                # 주간 변동률 (5 거래일)
-                weekly_change = 0
-                if len(df) >= 6:
-                    weekly_change = ((current_price - df["종가"].iloc[-6]) / df["종가"].iloc[-6]) * 100
+    def calculate_period_changes(self, ticker: str, market: str = "US") -> Optional[Dict]:
+        """
+        종목의 일/주/월 변동률 계산
 
-                # 월간 변동률 (21 거래일)
-                monthly_change = 0
-                if len(df) >= 22:
-                    monthly_change = ((current_price - df["종가"].iloc[-22]) / df["종가"].iloc[-22]) * 100
+        Args:
+            ticker: 종목 티커
+            market: 시장 (US / KR)
 
-                return {
-                    "daily": daily_change,
-                    "weekly": weekly_change,
-                    "monthly": monthly_change,
-                }
+        Returns:
+            Dict: 기간별 변동률
+            {
+                "daily": float,
+                "weekly": float,
+                "monthly": float
+            }
+        """
+        try:
+            hist = self._fetch_history(ticker, market, days=60)
+            if hist is None or hist.empty:
+                return None
+
+            return self._calc_period_changes(hist["Close"])
 
         except Exception as e:
             print(f"❌ 변동률 계산 실패 ({ticker}): {e}")
@@ -254,55 +493,11 @@ class FinanceBot:
             }
         """
         try:
-            if market == "US":
-                stock_obj = yf.Ticker(ticker)
-                hist = stock_obj.history(period="1y")
-
-                if hist.empty:
-                    return None
-
-                low_52week = hist["Low"].min()
-                high_52week = hist["High"].max()
-                current_price = hist["Close"].iloc[-1]
-
-                # 현재가 위치 계산 (0~100%)
-                position_percent = 0
-                if high_52week > low_52week:
-                    position_percent = ((current_price - low_52week) / (high_52week - low_52week)) * 100
-
-                return {
-                    "low": low_52week,
-                    "high": high_52week,
-                    "current": current_price,
-                    "position_percent": position_percent,
-                }
-
-            elif market == "KR":
-                # 한국 종목
-                today = datetime.now(ZoneInfo("Asia/Seoul"))
-                start_date = (today - timedelta(days=365)).strftime("%Y%m%d")
-                end_date = today.strftime("%Y%m%d")
-
-                df = stock.get_market_ohlcv_by_date(start_date, end_date, ticker)
-
-                if df.empty:
-                    return None
-
-                low_52week = df["저가"].min()
-                high_52week = df["고가"].max()
-                current_price = df["종가"].iloc[-1]
-
-                # 현재가 위치 계산
-                position_percent = 0
-                if high_52week > low_52week:
-                    position_percent = ((current_price - low_52week) / (high_52week - low_52week)) * 100
+            hist = self._fetch_history(ticker, market, days=365)
+            if hist is None or hist.empty:
+                return None
 
-                return {
-                    "low": low_52week,
-                    "high": high_52week,
-                    "current": current_price,
-                    "position_percent": position_percent,
-                }
+            return self._calc_52week_range(hist)
 
         except Exception as e:
             print(f"❌ 52주 범위 조회 실패 ({ticker}): {e}")
@@ -358,27 +553,16 @@ class FinanceBot:
         """
         try:
             if market == "KR":
-                # 한국 시장 전체 종목 조회
-                tickers = stock.get_market_ticker_list(market="ALL")
-                results = []
-
-                for ticker_code in tickers:
-                    name = stock.get_market_ticker_name(ticker_code)
-                    # 티커 또는 종목명에 키워드 포함 시 추가
-                    if keyword.upper() in ticker_code or keyword in name:
-                        results.append({
-                            "ticker": ticker_code,
-                            "name": name,
-                            "market": "KR"
-                        })
-                        if len(results) >= 20:  # 최대 20개
-                            break
-
-                return results
+                # 거래일마다 1회 로드되는 로컬 종목 디렉터리에서 검색
+                return kr_ticker_directory.search(keyword, limit=20)
 
             else:
-                # 미국 시장은 yfinance에 검색 기능이 없으므로
-                # 티커 검증만 수행
+                # 가져온 미국 종목 목록에서 검색 (네트워크 조회 없음)
+                us_ticker_directory.ensure_loaded()
+                if len(us_ticker_directory) > 0:
+                    return us_ticker_directory.search(keyword, limit=20)
+
+                # 종목 목록을 가져오지 않은 경우 티커 검증만 수행
                 if self.validate_ticker(keyword.upper(), "US"):
                     stock_obj = yf.Ticker(keyword.upper())
                     info = stock_obj.info
@@ -638,6 +822,131 @@ class FinanceBot:
             print(f"❌ 메시지 포맷팅 실패: {e}")
             return "증시 정보를 가져올 수 없습니다."
 
+    # ============================================================
+    # 비동기 조회 (라우터/알림용, 전용 스레드 풀에서 실행)
+    # ============================================================
+
+    async def get_stock_quote_async(self, ticker: str, market: str = "US") -> Optional[Dict]:
+        """get_stock_quote 비동기 버전"""
+        return await market_data_executor.run(
+            market_data_executor.provider_for(market), self.get_stock_quote, ticker, market
+        )
+
+    async def get_stock_quotes_async(
+        self, symbols: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Dict]:
+        """get_stock_quotes 비동기 버전 (시장별로 나누어 동시 조회)"""
+        by_market: Dict[str, List[Tuple[str, str]]] = {}
+        for ticker, market in symbols:
+            by_market.setdefault(market, []).append((ticker, market))
+
+        results = await asyncio.gather(*[
+            market_data_executor.run(
+                market_data_executor.provider_for(market), self.get_stock_quotes, market_symbols
+            )
+            for market, market_symbols in by_market.items()
+        ])
+
+        quotes: Dict[Tuple[str, str], Dict] = {}
+        for result in results:
+            quotes.update(result)
+        return quotes
+
+    async def get_symbol_snapshot_async(
+        self,
+        ticker: str,
+        market: str = "US",
+        include_info: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Optional[Dict]:
+        """
+        get_symbol_snapshot 비동기 버전
+
+        timeout 지정 시 제한 시간 초과하면 asyncio.TimeoutError
+        (실행 중인 호출이 스레드를 계속 점유하면 해당 제공자에는 새 작업을 보내지 않음)
+        """
+        provider = market_data_executor.provider_for(market)
+        if timeout is None:
+            return await market_data_executor.run(
+                provider, self.get_symbol_snapshot, ticker, market, include_info
+            )
+        return await market_data_executor.run_with_timeout(
+            provider, timeout, self.get_symbol_snapshot, ticker, market, include_info
+        )
+
+    async def validate_ticker_async(self, ticker: str, market: str = "US") -> bool:
+        """validate_ticker 비동기 버전"""
+        return await market_data_executor.run(
+            market_data_executor.provider_for(market), self.validate_ticker, ticker, market
+        )
+
+    async def search_ticker_async(self, keyword: str, market: str = "US") -> Optional[List[Dict]]:
+        """search_ticker 비동기 버전"""
+        return await market_data_executor.run(
+            market_data_executor.provider_for(market), self.search_ticker, keyword, market
+        )
+
+    async def get_us_market_data_async(self) -> Optional[Dict]:
+        """get_us_market_data 비동기 버전"""
+        return await market_data_executor.run(
+            market_data_executor.provider_for("US"), self.get_us_market_data
+        )
+
+    async def get_kr_market_data_async(self) -> Optional[Dict]:
+        """get_kr_market_data 비동기 버전 (지수는 Yahoo Finance 조회)"""
+        return await market_data_executor.run(
+            market_data_executor.provider_for("US"), self.get_kr_market_data
+        )
+
+    async def _enrich_watchlists(self, watchlists: List, market: str) -> List[Dict]:
+        """
+        관심 종목 시세/기간별 변동률/52주 범위 동시 조회
+
+        동시 조회 수와 종목별 제한 시간은 설정값을 따르며,
+        제한 시간을 넘기거나 실패한 종목은 결과에서 제외 (순서는 관심 종목 순서 유지)
+
+        Args:
+            watchlists: 관심 종목 목록
+            market: 시장 (US / KR)
+
+        Returns:
+            List[Dict]: 메시지 포맷용 관심 종목 데이터
+        """
+        if settings.FINANCE_REPORT_MAX_SYMBOLS > 0:
+            watchlists = watchlists[: settings.FINANCE_REPORT_MAX_SYMBOLS]
+
+        semaphore = asyncio.Semaphore(settings.FINANCE_REPORT_CONCURRENCY)
+
+        async def enrich(watchlist) -> Optional[Dict]:
+            async with semaphore:
+                try:
+                    snapshot = await self.get_symbol_snapshot_async(
+                        watchlist.ticker,
+                        market,
+                        include_info=False,
+                        timeout=settings.FINANCE_REPORT_SYMBOL_TIMEOUT,
+                    )
+                except asyncio.TimeoutError:
+                    print(f"⚠️  관심 종목 조회 시간 초과 ({watchlist.ticker})")
+                    return None
+                except Exception as e:
+                    print(f"⚠️  관심 종목 조회 실패 ({watchlist.ticker}): {e}")
+                    return None
+
+            if not snapshot:
+                return None
+
+            return {
+                "ticker": watchlist.ticker,
+                "name": watchlist.name,
+                "quote": snapshot["quote"],
+                "period_changes": snapshot["period_changes"],
+                "week_52_range": snapshot["week_52_range"],
+            }
+
+        results = await asyncio.gather(*[enrich(watchlist) for watchlist in watchlists])
+        return [result for result in results if result]
+
     async def send_us_market_notification(self):
         """
         미국 증시 알림 발송
@@ -654,8 +963,14 @@ class FinanceBot:
                 create_log(db, "finance", "SKIP", "미국 증시 알림 비활성화 상태")
                 return
 
+            # 휴장일(주말, 공휴일)에는 발송하지 않음
+            if not self._is_trading_day("US"):
+                print("⏸️  미국 증시 휴장일, 알림 생략")
+                create_log(db, "finance", "SKIP", "미국 증시 휴장일")
+                return
+
             # 증시 데이터 조회
-            market_data = self.get_us_market_data()
+            market_data = await self.get_us_market_data_async()
 
             if not market_data:
                 create_log(db, "finance", "FAIL", "미국 증시 데이터 조회 실패")
@@ -667,32 +982,8 @@ class FinanceBot:
                 watchlists = get_watchlists(db, user.user_id, is_active=True)
                 us_watchlists = [w for w in watchlists if w.market == "US"]
 
-                for watchlist in us_watchlists[:10]:  # 최대 10개
-                    try:
-                        # 종목 시세 조회
-                        quote = self.get_stock_quote(watchlist.ticker, "US")
-                        if not quote:
-                            continue
-
-                        # 기간별 변동률 조회
-                        period_changes = self.calculate_period_changes(
-                            watchlist.ticker, "US"
-                        )
-
-                        # 52주 범위 조회
-                        week_52_range = self.get_52week_range(watchlist.ticker, "US")
-
-                        watchlist_data.append({
-                            "ticker": watchlist.ticker,
-                            "name": watchlist.name,
-                            "quote": quote,
-                            "period_changes": period_changes,
-                            "week_52_range": week_52_range,
-                        })
-
-                    except Exception as e:
-                        print(f"⚠️  관심 종목 조회 실패 ({watchlist.ticker}): {e}")
-                        continue
+                # 시세, 기간별 변동률, 52주 범위를 종목별로 동시 조회
+                watchlist_data = await self._enrich_watchlists(us_watchlists, "US")
 
             except Exception as e:
                 print(f"⚠️  관심 종목 목록 조회 실패: {e}")
@@ -752,8 +1043,14 @@ class FinanceBot:
                 create_log(db, "finance", "SKIP", "한국 증시 알림 비활성화 상태")
                 return
 
+            # 휴장일(주말, 공휴일)에는 발송하지 않음
+            if not self._is_trading_day("KR"):
+                print("⏸️  한국 증시 휴장일, 알림 생략")
+                create_log(db, "finance", "SKIP", "한국 증시 휴장일")
+                return
+
             # 증시 데이터 조회
-            market_data = self.get_kr_market_data()
+            market_data = await self.get_kr_market_data_async()
 
             if not market_data:
                 create_log(db, "finance", "FAIL", "한국 증시 데이터 조회 실패")
@@ -765,32 +1062,8 @@ class FinanceBot:
                 watchlists = get_watchlists(db, user.user_id, is_active=True)
                 kr_watchlists = [w for w in watchlists if w.market == "KR"]
 
-                for watchlist in kr_watchlists[:10]:  # 최대 10개
-                    try:
-                        # 종목 시세 조회
-                        quote = self.get_stock_quote(watchlist.ticker, "KR")
-                        if not quote:
-                            continue
-
-                        # 기간별 변동률 조회
-                        period_changes = self.calculate_period_changes(
-                            watchlist.ticker, "KR"
-                        )
-
-                        # 52주 범위 조회
-                        week_52_range = self.get_52week_range(watchlist.ticker, "KR")
-
-                        watchlist_data.append({
-                            "ticker": watchlist.ticker,
-                            "name": watchlist.name,
-                            "quote": quote,
-                            "period_changes": period_changes,
-                            "week_52_range": week_52_range,
-                        })
-
-                    except Exception as e:
-                        print(f"⚠️  관심 종목 조회 실패 ({watchlist.ticker}): {e}")
-                        continue
+                # 시세, 기간별 변동률, 52주 범위를 종목별로 동시 조회
+                watchlist_data = await self._enrich_watchlists(kr_watchlists, "KR")
 
             except Exception as e:
                 print(f"⚠️  관심 종목 목록 조회 실패: {e}")
@@ -834,195 +1107,400 @@ class FinanceBot:
         finally:
             db.close()
 
+    # ============================================================
+    # 가격 알림 발송 (개별 / 다이제스트)
+    # ============================================================
+
+    def _get_alert_digest_config(self, db, user) -> Tuple[bool, int]:
+        """
+        가격 알림 다이제스트 설정 조회
+        finance 설정의 config_json (alert_digest, alert_digest_window_minutes), 없으면 환경 설정값 사용
+
+        Returns:
+            Tuple[bool, int]: (다이제스트 사용 여부, 묶음 대기 시간(분))
+        """
+        enabled = settings.FINANCE_ALERT_DIGEST
+        window = settings.FINANCE_ALERT_DIGEST_WINDOW_MINUTES
+
+        setting = get_setting_by_category(db, user.user_id, "finance")
+        if setting and setting.config_json:
+            try:
+                config = json.loads(setting.config_json)
+                enabled = bool(config.get("alert_digest", enabled))
+                window = int(config.get("alert_digest_window_minutes", window))
+            except (ValueError, TypeError) as e:
+                print(f"⚠️  알림 다이제스트 설정 파싱 실패: {e}")
+
+        return enabled, max(window, 0)
+
+    @staticmethod
+    def format_alert_digest(messages: List[str], max_length: int) -> List[str]:
+        """
+        발동된 알림 메시지를 하나의 다이제스트로 병합 (최대 길이 초과 시 페이지 분할)
+
+        Args:
+            messages: 개별 알림 메시지 목록
+            max_length: 페이지당 최대 글자 수
+
+        Returns:
+            List[str]: 페이지별 메시지 목록
+        """
+        entries = [message.replace("[가격 알림] ", "▶ ", 1) for message in messages]
+
+        # 헤더 길이를 제외한 본문 길이 기준으로 항목을 순서대로 채움
+        header_room = len(f"[가격 알림] {len(entries)}건 발동 (99/99)\n\n")
+        body_limit = max(max_length - header_room, 1)
+
+        pages: List[List[str]] = []
+        length = 0
+        for entry in entries:
+            if pages and length + len(entry) + 2 <= body_limit:
+                pages[-1].append(entry)
+                length += len(entry) + 2
+            else:
+                pages.append([entry])
+                length = len(entry)
+
+        results = []
+        for index, page in enumerate(pages, start=1):
+            header = f"[가격 알림] {len(entries)}건 발동"
+            if len(pages) > 1:
+                header += f" ({index}/{len(pages)})"
+            results.append(header + "\n\n" + "\n\n".join(page))
+        return results
+
+    async def _send_alert_digest(
+        self,
+        db,
+        user,
+        triggered: List[Dict],
+        active_ids: set,
+        window_minutes: int,
+    ):
+        """
+        다이제스트 모드 가격 알림 발송
+
+        묶음 대기 시간 동안 발동된 알림을 모아 두었다가 시간이 지나면 한 번에 발송
+        (같은 알림이 다시 발동되면 최신 시세로 교체, 알림 상태는 발송 시점에 갱신되므로
+        발송 전 프로세스가 재시작되어도 다음 체크에서 다시 발동됨)
+
+        Args:
+            db: 데이터베이스 세션
+            user: 사용자 객체
+            triggered: 이번 체크에서 발동된 알림 목록
+            active_ids: 이번 체크에서 유효한 (활성, 미발동) 알림 ID 집합
+            window_minutes: 묶음 대기 시간 (분, 0이면 체크마다 즉시 발송)
+        """
+        now = datetime.now()
+        buffered = self._alert_digest.setdefault(user.user_id, {})
+
+        # 대기 중 삭제/비활성화된 알림 제외
+        for alert_id in [alert_id for alert_id in buffered if alert_id not in active_ids]:
+            del buffered[alert_id]
+
+        for entry in triggered:
+            buffered[entry["alert_id"]] = entry
+
+        if not buffered:
+            self._alert_digest_started.pop(user.user_id, None)
+            return
+
+        started_at = self._alert_digest_started.setdefault(user.user_id, now)
+        if now - started_at < timedelta(minutes=window_minutes):
+            print(f"🗂️  가격 알림 {len(buffered)}건 다이제스트 대기 중")
+            return
+
+        entries = list(buffered.values())
+        self._alert_digest.pop(user.user_id, None)
+        self._alert_digest_started.pop(user.user_id, None)
+
+        pages = self.format_alert_digest(
+            [entry["message"] for entry in entries], settings.FINANCE_ALERT_DIGEST_MAX_LENGTH
+        )
+        print(f"🗂️  가격 알림 다이제스트 발송: {len(entries)}건 → 메시지 {len(pages)}개")
+        await self._send_alert_pages(db, user, pages, entries)
+
+    async def _send_alert_pages(self, db, user, pages: List[str], entries: List[Dict]):
+        """
+        가격 알림 메시지 발송 및 알림 상태 갱신
+
+        Args:
+            db: 데이터베이스 세션
+            user: 사용자 객체
+            pages: 발송할 메시지 목록
+            entries: 메시지에 포함된 발동 알림 목록
+        """
+        # 연동된 채널 확인
+        if not notification_service.get_available_channels(user):
+            print("⚠️  알림 채널 연동이 필요합니다")
+            return
+
+        tickers = ", ".join(entry["ticker"] for entry in entries)
+        queued = False
+        for page in pages:
+            # 알림 발송 (발송 대기열 경유, 실패 채널은 자동 재시도)
+            result = await notification_outbox.send(db, user, page, "finance")
+
+            # 대기열에 등록되면 재시도로 발송이 보장되므로 알림 상태 갱신
+            if result.success or result.failed_channels:
+                queued = True
+                create_log(
+                    db,
+                    "finance",
+                    "SUCCESS" if result.success else "WARNING",
+                    f"가격 알림 발송 {'성공' if result.success else '실패, 재시도 예정'}: "
+                    f"{tickers} - {result.message}",
+                )
+                print(f"✅ 가격 알림 처리 완료: {tickers} ({result.message})")
+            else:
+                create_log(db, "finance", "FAIL", f"가격 알림 발송 실패: {result.message}")
+                print(f"❌ 가격 알림 발송 실패: {result.message}")
+
+        if not queued:
+            return
+
+        for entry in entries:
+            if entry["alert_type"] == "PERCENT_CHANGE":
+                # 변동률 알림: 기준가만 갱신 (계속 모니터링)
+                update_alert_reference_price(db, entry["alert_id"], entry["current_price"])
+                alert_index.update_reference(entry["alert_id"], entry["current_price"])
+                print(f"📌 기준가 갱신: {entry['ticker']} = {entry['current_price']}")
+            else:
+                # 목표가/손절가 알림: 발동됨으로 표시 (일회성)
+                update_alert_triggered(db, entry["alert_id"])
+                alert_index.remove(entry["alert_id"])
+
+    @staticmethod
+    def format_price_alert(alert, current_price: float) -> str:
+        """
+        발동된 가격 알림 메시지 생성
+
+        Args:
+            alert: 인덱스의 알림 정보 (IndexedAlert)
+            current_price: 현재가
+
+        Returns:
+            str: 알림 메시지
+        """
+        # 종목 표시 형식 (티커와 이름)
+        stock_display = f"{alert.ticker} ({alert.name})" if alert.name else alert.ticker
+
+        def money(value: float) -> str:
+            # 통화 단위 (시장별 구분)
+            return f"{value:,.0f}원" if alert.market == "KR" else f"${value:,.2f}"
+
+        if alert.alert_type == "TARGET_HIGH":
+            return (
+                f"[가격 알림] {stock_display}\n"
+                f"목표가 도달!\n"
+                f"현재가: {money(current_price)}\n"
+                f"목표가: {money(alert.target_price)}"
+            )
+
+        if alert.alert_type == "TARGET_LOW":
+            return (
+                f"[가격 알림] {stock_display}\n"
+                f"손절가 도달!\n"
+                f"현재가: {money(current_price)}\n"
+                f"손절가: {money(alert.target_price)}"
+            )
+
+        change_percent = alert.change_percent(current_price)
+        direction = "상승" if change_percent > 0 else "하락"
+        return (
+            f"[가격 알림] {stock_display}\n"
+            f"급격한 {direction}!\n"
+            f"기준가: {money(alert.reference_price)}\n"
+            f"현재가: {money(current_price)}\n"
+            f"변동률: {change_percent:+.2f}%"
+        )
+
+    def _initialize_references(
+        self, db, user_id: int, ticker: str, market: str, current_price: float
+    ):
+        """기준가가 없는 변동률 알림을 현재가로 초기화"""
+        for alert in alert_index.unreferenced(user_id, ticker, market):
+            update_alert_reference_price(db, alert.alert_id, current_price)
+            alert_index.update_reference(alert.alert_id, current_price)
+            print(f"📌 기준가 초기화: {ticker} = {current_price}")
+
+    def _triggered_entry(self, alert, current_price: float) -> Dict:
+        """발동된 알림 발송 정보 (메시지는 발동된 알림만 생성)"""
+        print(f"🚨 알림 발동: {alert.ticker} ({alert.alert_type})")
+        return {
+            "alert_id": alert.alert_id,
+            "alert_type": alert.alert_type,
+            "ticker": alert.ticker,
+            "current_price": current_price,
+            "message": self.format_price_alert(alert, current_price),
+        }
+
+    def _evaluate_symbol(
+        self, db, user_id: int, ticker: str, market: str, current_price: float
+    ) -> List[Dict]:
+        """
+        종목 하나의 현재가로 가격 알림 조건 체크 (실시간 시세용)
+        (종목별 정렬된 임계가 인덱스에서 현재가가 넘어선 알림만 이진 탐색으로 조회)
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+            ticker: 종목 티커
+            market: 시장 (US / KR)
+            current_price: 현재가
+
+        Returns:
+            List[Dict]: 발동된 알림 목록
+        """
+        self._initialize_references(db, user_id, ticker, market, current_price)
+        return [
+            self._triggered_entry(alert, current_price)
+            for alert in alert_index.crossed(user_id, ticker, market, current_price)
+        ]
+
+    async def _dispatch_alerts(self, db, user, triggered: List[Dict]):
+        """
+        발동된 가격 알림 발송 (다이제스트 모드면 사용자당 한 메시지로 병합)
+
+        Args:
+            db: 데이터베이스 세션
+            user: 사용자 객체
+            triggered: 발동된 알림 목록
+        """
+        digest_enabled, digest_window = self._get_alert_digest_config(db, user)
+        if digest_enabled:
+            active_ids = alert_index.alert_ids(user.user_id)
+            await self._send_alert_digest(db, user, triggered, active_ids, digest_window)
+        else:
+            for entry in triggered:
+                await self._send_alert_pages(db, user, [entry["message"]], [entry])
+
+    @staticmethod
+    def _is_trading_day(market: str) -> bool:
+        """시장 현지 날짜 기준 오늘이 거래일인지 여부"""
+        return trading_calendar.is_trading_day(market, trading_calendar.local_now(market).date())
+
+    def _due_symbols(
+        self, symbols: List[Tuple[str, str]], now: Optional[datetime] = None
+    ) -> List[Tuple[str, str]]:
+        """
+        이번에 시세를 조회할 종목 선택
+
+        - 장이 열린 시장의 종목만 대상 (휴장일, 장 시작 전/마감 후 제외)
+        - 종목별 다음 조회 시각(임계가까지 거리와 변동성으로 결정)이 된 종목만 조회
+        - 개장 직후·폐장 직전 구간은 모든 종목을 최소 주기로 조회 (시가/종가 급변 대응)
+
+        Args:
+            symbols: 알림이 등록된 (ticker, market) 목록
+            now: 기준 시간 (기본: 현재 시간)
+
+        Returns:
+            List[Tuple[str, str]]: 조회할 종목 목록
+        """
+        now = now or datetime.now(ZoneInfo("Asia/Seoul"))
+        fast_window = timedelta(minutes=settings.FINANCE_ALERT_CHECK_FAST_WINDOW_MINUTES)
+
+        sessions = {}
+        due = []
+        for symbol in symbols:
+            market = symbol[1]
+            if market not in sessions:
+                sessions[market] = trading_calendar.current_session(market, now)
+            session = sessions[market]
+            if session is None:
+                continue
+
+            near_edge = now - session[0] < fast_window or session[1] - now <= fast_window
+            max_wait = poll_scheduler.min_interval if near_edge else None
+            if poll_scheduler.is_due(symbol, now, max_wait=max_wait):
+                due.append(symbol)
+        return due
+
     async def check_price_alerts(self):
         """
         가격 알림 조건 체크 및 알림 발송
-        5분마다 실행되어 등록된 가격 알림의 조건을 확인하고 알림 발송
+        최소 주기로 실행되며, 장이 열린 시장의 종목 중 종목별 다음 조회 시각이 된 종목만 조회
+        조회한 현재가로 전체 알림 조건을 배열 연산 한 번에 평가하고, 발동된 알림만 메시지 생성
+        (실시간 시세 스트림이 동작 중이면 스트림에서 처리하므로 대기 중인 다이제스트만 발송)
         """
-        print("🔍 가격 알림 조건 체크 시작...")
+        streaming = quote_stream.is_healthy()
+        if streaming:
+            print("📡 실시간 시세 스트림 동작 중, 가격 알림 주기 체크 생략")
+        else:
+            print("🔍 가격 알림 조건 체크 시작...")
         db = SessionLocal()
 
         try:
             user = get_or_create_user(db)
 
-            # 활성화된 가격 알림 조회
-            alerts = get_price_alerts(db, user.user_id, is_active=True)
-            if not alerts:
+            # 체크 대상 (활성, 미발동) 알림 인덱스
+            alert_index.ensure_loaded(db, user.user_id)
+            if streaming:
+                if user.user_id in self._alert_digest:
+                    await self._dispatch_alerts(db, user, [])
+                return
+
+            symbols = alert_index.symbols(user.user_id)
+            if not symbols:
                 print("ℹ️  등록된 가격 알림이 없습니다")
+                # 다이제스트 대기 중인 알림이 삭제된 경우 정리
+                self._alert_digest.pop(user.user_id, None)
+                self._alert_digest_started.pop(user.user_id, None)
                 return
 
-            print(f"📋 체크할 가격 알림 {len(alerts)}개")
+            # 장이 열려 있고 다음 조회 시각이 된 종목만 조회
+            poll_scheduler.prune(symbols)
+            now = datetime.now(ZoneInfo("Asia/Seoul"))
+            total = len(symbols)
+            symbols = self._due_symbols(symbols, now)
+            if not symbols:
+                print("⏸️  조회 시각이 된 종목이 없어 시세 조회 생략")
+                if user.user_id in self._alert_digest:
+                    await self._dispatch_alerts(db, user, [])
+                return
 
-            # 각 알림 조건 체크
-            for alert in alerts:
-                try:
-                    # 이미 발동된 알림은 스킵
-                    if alert.is_triggered:
-                        continue
+            print(f"📋 가격 알림 체크: {len(symbols)}/{total}개 종목")
 
-                    # 관심 종목 정보 조회
-                    watchlist = get_watchlist(db, alert.watchlist_id)
-                    if not watchlist:
-                        print(f"⚠️  관심 종목을 찾을 수 없습니다: {alert.watchlist_id}")
-                        continue
+            # 종목별 시세 일괄 조회 (동일 종목은 한 번만 조회)
+            quotes = await self.get_stock_quotes_async(symbols)
+            print(f"📈 시세 조회 완료: {len(quotes)}개 종목")
 
-                    # 현재 시세 조회
-                    quote = self.get_stock_quote(watchlist.ticker, watchlist.market)
-                    if not quote:
-                        print(
-                            f"⚠️  시세 조회 실패: {watchlist.ticker} ({watchlist.market})"
-                        )
-                        continue
-
-                    current_price = quote.get("price")
+            # 종목별 현재가 정리 및 다음 조회 시각 결정
+            prices: Dict[Tuple[str, str], float] = {}
+            for ticker, market in symbols:
+                try:
+                    # 현재 시세 (일괄 조회 결과)
+                    quote = quotes.get((ticker, market))
+                    current_price = quote.get("price") if quote else None
                     if current_price is None:
+                        print(f"⚠️  시세 조회 실패: {ticker} ({market})")
+                        poll_scheduler.defer((ticker, market), now)
                         continue
 
-                    # 알림 조건 체크
-                    should_alert = False
-                    alert_message = ""
-
-                    if alert.alert_type == "TARGET_HIGH":
-                        # 목표가 도달 (상승)
-                        if current_price >= alert.target_price:
-                            should_alert = True
-                            # 종목 표시 형식 (티커와 이름)
-                            stock_display = f"{watchlist.ticker} ({watchlist.name})" if watchlist.name else watchlist.ticker
-                            # 통화 단위 (시장별 구분)
-                            if watchlist.market == "KR":
-                                alert_message = (
-                                    f"[가격 알림] {stock_display}\n"
-                                    f"목표가 도달!\n"
-                                    f"현재가: {current_price:,.0f}원\n"
-                                    f"목표가: {alert.target_price:,.0f}원"
-                                )
-                            else:
-                                alert_message = (
-                                    f"[가격 알림] {stock_display}\n"
-                                    f"목표가 도달!\n"
-                                    f"현재가: ${current_price:,.2f}\n"
-                                    f"목표가: ${alert.target_price:,.2f}"
-                                )
-
-                    elif alert.alert_type == "TARGET_LOW":
-                        # 목표가 도달 (하락)
-                        if current_price <= alert.target_price:
-                            should_alert = True
-                            # 종목 표시 형식 (티커와 이름)
-                            stock_display = f"{watchlist.ticker} ({watchlist.name})" if watchlist.name else watchlist.ticker
-                            # 통화 단위 (시장별 구분)
-                            if watchlist.market == "KR":
-                                alert_message = (
-                                    f"[가격 알림] {stock_display}\n"
-                                    f"손절가 도달!\n"
-                                    f"현재가: {current_price:,.0f}원\n"
-                                    f"손절가: {alert.target_price:,.0f}원"
-                                )
-                            else:
-                                alert_message = (
-                                    f"[가격 알림] {stock_display}\n"
-                                    f"손절가 도달!\n"
-                                    f"현재가: ${current_price:,.2f}\n"
-                                    f"손절가: ${alert.target_price:,.2f}"
-                                )
-
-                    elif alert.alert_type == "PERCENT_CHANGE":
-                        # 변동률 체크 (기준가 대비)
-                        # reference_price가 없으면 현재가로 초기화
-                        if alert.reference_price is None:
-                            from app.crud import update_alert_reference_price
-
-                            update_alert_reference_price(db, alert.alert_id, current_price)
-                            print(
-                                f"📌 기준가 초기화: {watchlist.ticker} = {current_price}"
-                            )
-                            continue
-
-                        # 기준가 대비 변동률 계산
-                        change_percent = (
-                            (current_price - alert.reference_price)
-                            / alert.reference_price
-                        ) * 100
-
-                        # 목표 변동률 달성 여부 체크
-                        if abs(change_percent) >= abs(alert.target_percent):
-                            direction = "상승" if change_percent > 0 else "하락"
-                            should_alert = True
-
-                            # 종목 표시 형식 (티커와 이름)
-                            stock_display = (
-                                f"{watchlist.ticker} ({watchlist.name})"
-                                if watchlist.name
-                                else watchlist.ticker
-                            )
-
-                            # 통화 단위 (시장별 구분)
-                            if watchlist.market == "KR":
-                                alert_message = (
-                                    f"[가격 알림] {stock_display}\n"
-                                    f"급격한 {direction}!\n"
-                                    f"기준가: {alert.reference_price:,.0f}원\n"
-                                    f"현재가: {current_price:,.0f}원\n"
-                                    f"변동률: {change_percent:+.2f}%"
-                                )
-                            else:
-                                alert_message = (
-                                    f"[가격 알림] {stock_display}\n"
-                                    f"급격한 {direction}!\n"
-                                    f"기준가: ${alert.reference_price:,.2f}\n"
-                                    f"현재가: ${current_price:,.2f}\n"
-                                    f"변동률: {change_percent:+.2f}%"
-                                )
-
-                    # 알림 발송
-                    if should_alert:
-                        print(f"🚨 알림 발동: {watchlist.ticker} ({alert.alert_type})")
-
-                        # 연동된 채널 확인
-                        available_channels = notification_service.get_available_channels(
-                            user
-                        )
-                        if not available_channels:
-                            print("⚠️  알림 채널 연동이 필요합니다")
-                            continue
+                    self._initialize_references(db, user.user_id, ticker, market, current_price)
+                    prices[(ticker, market)] = current_price
 
-                        # 알림 발송
-                        result = await notification_service.send(user, alert_message)
-
-                        if result.success:
-                            # 알림 타입별 상태 업데이트
-                            if alert.alert_type == "PERCENT_CHANGE":
-                                # 변동률 알림: 기준가만 갱신 (계속 모니터링)
-                                from app.crud import update_alert_reference_price
-
-                                update_alert_reference_price(db, alert.alert_id, current_price)
-                                print(
-                                    f"📌 기준가 갱신: {watchlist.ticker} = {current_price}"
-                                )
-                            else:
-                                # 목표가/손절가 알림: 발동됨으로 표시 (일회성)
-                                update_alert_triggered(db, alert.alert_id)
-
-                            create_log(
-                                db,
-                                "finance",
-                                "SUCCESS",
-                                f"가격 알림 발송 성공: {watchlist.ticker} ({alert.alert_type})",
-                            )
-                            print(f"✅ 가격 알림 발송 완료: {watchlist.ticker}")
-                        else:
-                            create_log(
-                                db,
-                                "finance",
-                                "FAIL",
-                                f"가격 알림 발송 실패: {result.message}",
-                            )
-                            print(f"❌ 가격 알림 발송 실패: {result.message}")
+                    # 가장 가까운 임계가까지 거리와 최근 변동성으로 다음 조회 시각 결정
+                    poll_scheduler.observe((ticker, market), current_price, now)
+                    next_check = poll_scheduler.schedule(
+                        (ticker, market),
+                        alert_index.nearest_distance(ticker, market, current_price),
+                        now,
+                    )
+                    print(f"⏱️  {ticker} 다음 조회: {next_check.strftime('%H:%M')}")
 
                 except Exception as e:
-                    print(f"⚠️  가격 알림 체크 중 오류 ({alert.alert_id}): {e}")
+                    print(f"⚠️  가격 알림 체크 중 오류 ({ticker}): {e}")
                     continue
 
+            # 전체 알림 조건을 현재가 벡터로 한 번에 평가 (발동된 알림은 모아서 발송)
+            triggered = [
+                self._triggered_entry(alert, prices[(alert.ticker, alert.market)])
+                for alert in alert_index.evaluate(user.user_id, prices)
+            ]
+
+            await self._dispatch_alerts(db, user, triggered)
+
         except Exception as e:
             create_log(db, "finance", "FAIL", f"가격 알림 체크 오류: {str(e)}")
             print(f"❌ 가격 알림 체크 오류: {e}")
@@ -1030,6 +1508,38 @@ class FinanceBot:
         finally:
             db.close()
 
+    async def handle_quote_tick(self, user_id: int, tick: Dict):
+        """
+        실시간 시세 수신 시 가격 알림 조건 체크
+        넘어선 임계가나 대기 중인 다이제스트가 없으면 DB 접근 없이 바로 반환
+
+        Args:
+            user_id: 사용자 ID
+            tick: 시세 (ticker, market, price)
+        """
+        ticker, market, current_price = tick["ticker"], tick["market"], tick["price"]
+        if (
+            not alert_index.crossed(user_id, ticker, market, current_price)
+            and not alert_index.unreferenced(user_id, ticker, market)
+            and user_id not in self._alert_digest
+        ):
+            return
+
+        db = SessionLocal()
+        try:
+            user = get_user(db, user_id)
+            if not user:
+                return
+            triggered = self._evaluate_symbol(db, user_id, ticker, market, current_price)
+            await self._dispatch_alerts(db, user, triggered)
+
+        except Exception as e:
+            create_log(db, "finance", "FAIL", f"실시간 가격 알림 처리 오류: {str(e)}")
+            print(f"❌ 실시간 가격 알림 처리 오류: {e}")
+
+        finally:
+            db.close()
+
 
 # 싱글톤 인스턴스
 finance_bot = FinanceBot()
@@ -1038,29 +1548,56 @@ finance_bot = FinanceBot()
 # 스케줄러에서 호출할 함수들
 def send_us_market_notification_sync():
     """동기 방식으로 미국 증시 알림 발송"""
-    import asyncio
+    from app.services.scheduler import scheduler_service
 
     try:
-        asyncio.run(finance_bot.send_us_market_notification())
+        scheduler_service.run_coroutine(finance_bot.send_us_market_notification())
     except Exception as e:
         print(f"❌ 미국 증시 알림 실행 오류: {e}")
 
 
 def send_kr_market_notification_sync():
     """동기 방식으로 한국 증시 알림 발송"""
-    import asyncio
+    from app.services.scheduler import scheduler_service
 
     try:
-        asyncio.run(finance_bot.send_kr_market_notification())
+        scheduler_service.run_coroutine(finance_bot.send_kr_market_notification())
     except Exception as e:
         print(f"❌ 한국 증시 알림 실행 오류: {e}")
 
 
 def check_price_alerts_sync():
     """동기 방식으로 가격 알림 조건 체크"""
-    import asyncio
+    from app.services.scheduler import scheduler_service
 
     try:
-        asyncio.run(finance_bot.check_price_alerts())
+        scheduler_service.run_coroutine(finance_bot.check_price_alerts())
     except Exception as e:
         print(f"❌ 가격 알림 체크 실행 오류: {e}")
+
+
+def start_price_alert_stream():
+    """실시간 시세 스트림으로 가격 알림 체크 시작 (시세 피드가 설정된 경우, 주기 체크는 대체 수단으로 유지)"""
+    from app.services.scheduler import scheduler_service
+
+    try:
+        source = quote_stream.source_from_settings()
+        loop = scheduler_service.event_loop.loop
+        if source is None or loop is None:
+            return
+
+        db = SessionLocal()
+        try:
+            user_id = get_or_create_user(db).user_id
+            alert_index.ensure_loaded(db, user_id)
+        finally:
+            db.close()
+
+        quote_stream.start(
+            loop,
+            source,
+            symbols=lambda: alert_index.symbols(user_id),
+            on_tick=lambda tick: finance_bot.handle_quote_tick(user_id, tick),
+        )
+    except Exception as e:
+        print(f"❌ 실시간 시세 스트림 시작 오류: {e}")
@@ -14,7 +14,7 @@ from app.crud import (
     update_reminder_sent_status,
     get_reminders,
 )
-from app.services.notification import notification_service
+from app.services.notification import notification_service, notification_outbox
 from app.services.scheduler import scheduler_service
 
 
@@ -92,14 +92,14 @@ class MemoBot:
             # 메시지 포맷팅 (예약된 시간을 포함)
             message = self.format_memo_message(reminder.message_content, reminder.target_datetime)
 
-            # 알림 발송 (연동된 모든 채널로 자동 발송)
+            # 알림 발송 (발송 대기열 등록 후 연동된 모든 채널로 발송, 실패 채널은 자동 재시도)
             try:
-                result = await notification_service.send(user, message)
+                result = await notification_outbox.send(db, user, message, "memo")
 
-                if result.success:
-                    # 발송 상태 업데이트
-                    update_reminder_sent_status(db, reminder_id, is_sent=True)
+                # 대기열에 등록되면 재시도로 발송이 보장되므로 발송 상태 업데이트
+                update_reminder_sent_status(db, reminder_id, is_sent=True)
 
+                if result.success:
                     # 성공 로그
                     create_log(
                         db,
@@ -109,9 +109,9 @@ class MemoBot:
                     )
                     print(f"✅ 메모 알림 발송 완료 - reminder_id: {reminder_id}")
                 else:
-                    # 실패 로그
-                    create_log(db, "memo", "FAIL", f"알림 발송 실패: {result.message} (reminder_id: {reminder_id})")
-                    print(f"❌ 알림 발송 실패: {result.message}")
+                    # 재시도 예정 로그
+                    create_log(db, "memo", "WARNING", f"알림 발송 실패: {result.message} (reminder_id: {reminder_id})")
+                    print(f"⚠️  알림 발송 실패, 재시도 예정: {result.message}")
 
             except Exception as e:
                 create_log(db, "memo", "FAIL", f"알림 발송 오류: {str(e)} (reminder_id: {reminder_id})")
@@ -227,9 +227,7 @@ def send_memo_notification_sync(reminder_id: int):
     동기 방식으로 메모 알림 발송
     스케줄러에서 비동기 함수를 호출하기 위한 래퍼
     """
-    import asyncio
-
     try:
-        asyncio.run(memo_bot.send_memo_notification(reminder_id))
+        scheduler_service.run_coroutine(memo_bot.send_memo_notification(reminder_id))
     except Exception as e:
         print(f"메모 알림 실행 오류: {e}")
@@ -3,7 +3,6 @@
 OpenWeatherMap API를 사용한 날씨 정보 수집 및 알림
 """
 
-import httpx
 from typing import Dict, Optional
 from datetime import datetime
 from zoneinfo import ZoneInfo
@@ -11,6 +10,7 @@ from app.config import settings
 from app.database import SessionLocal
 from app.crud import get_or_create_user, create_log, is_setting_active
 from app.services.notification import notification_service
+from app.services.http_client import http_clients
 
 
 class WeatherBot:
@@ -42,14 +42,14 @@ class WeatherBot:
                 "lang": lang,
             }
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url, params=params)
+            client = http_clients.get(url)
+            response = await client.get(url, params=params)
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    print(f"❌ 날씨 API 오류: {response.status_code} - {response.text}")
-                    return None
+            if response.status_code == 200:
+                return response.json()
+            else:
+                print(f"❌ 날씨 API 오류: {response.status_code} - {response.text}")
+                return None
 
         except Exception as e:
             print(f"❌ 날씨 조회 실패: {e}")
@@ -77,14 +77,14 @@ class WeatherBot:
                 "lang": lang,
             }
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url, params=params)
+            client = http_clients.get(url)
+            response = await client.get(url, params=params)
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    print(f"❌ 예보 API 오류: {response.status_code}")
-                    return None
+            if response.status_code == 200:
+                return response.json()
+            else:
+                print(f"❌ 예보 API 오류: {response.status_code}")
+                return None
 
         except Exception as e:
             print(f"❌ 예보 조회 실패: {e}")
@@ -223,9 +223,9 @@ def send_weather_notification_sync(city: str = "Seoul"):
     동기 방식으로 날씨 알림 발송
     스케줄러에서 비동기 함수를 호출하기 위한 래퍼
     """
-    import asyncio
+    from app.services.scheduler import scheduler_service
 
     try:
-        asyncio.run(weather_bot.send_weather_notification(city))
+        scheduler_service.run_coroutine(weather_bot.send_weather_notification(city))
     except Exception as e:
         print(f"❌ 날씨 알림 실행 오류: {e}")
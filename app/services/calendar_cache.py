@@ -0,0 +1,335 @@
+"""
+캘린더 일정 캐시 모듈
+구글 캘린더 일정을 로컬 DB(calendar_events)에 보관하고 syncToken으로 변경분만 동기화
+"""
+
+import json
+import threading
+from contextlib import ExitStack
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+from app.config import settings
+from app.database import SessionLocal
+from app.crud import get_calendar_sync_state, get_cached_calendar_events, save_calendar_sync
+from app.services.auth.google_auth import google_auth_service, CalendarSyncTokenExpiredError
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+class CalendarCache:
+    """
+    캘린더 일정 캐시
+
+    - 처음에는 (오늘 - DAYS_BEHIND) ~ (오늘 + DAYS_AHEAD) 기간을 전체 동기화
+    - 이후에는 syncToken으로 변경분만 동기화 (410 응답 시 전체 재동기화)
+    - 마지막 동기화가 MAX_AGE 이내면 API 호출 없이 캐시에서 조회
+    - 동기화가 필요한 캘린더가 여럿이면 배치 요청 한 번으로 함께 동기화
+    - 조회 기간이 전체 동기화 기간을 벗어나면 기간을 옮겨 전체 재동기화
+    """
+
+    def __init__(self):
+        self.auth = google_auth_service
+        self.max_age = timedelta(seconds=settings.CALENDAR_CACHE_MAX_AGE_SECONDS)
+        self.days_behind = settings.CALENDAR_SYNC_DAYS_BEHIND
+        self.days_ahead = settings.CALENDAR_SYNC_DAYS_AHEAD
+        # 캘린더별 동시 동기화 방지용 잠금
+        self._locks: Dict[Tuple[int, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    @staticmethod
+    def _now() -> datetime:
+        """현재 한국 시간 (naive)"""
+        return datetime.now(KST).replace(tzinfo=None)
+
+    def _lock_for(self, user_id: int, calendar_id: str) -> threading.Lock:
+        """캘린더별 잠금 객체 조회"""
+        with self._locks_guard:
+            return self._locks.setdefault((user_id, calendar_id), threading.Lock())
+
+    @staticmethod
+    def event_range(event: Dict) -> Optional[Tuple[datetime, datetime]]:
+        """
+        일정 기간 계산 (한국 시간 naive)
+
+        Args:
+            event: 구글 캘린더 일정
+
+        Returns:
+            Tuple[datetime, datetime]: (시작, 종료) 또는 None (시간 정보 없음)
+        """
+
+        def parse(value: Dict) -> Optional[datetime]:
+            if "dateTime" in value:
+                parsed = datetime.fromisoformat(value["dateTime"].replace("Z", "+00:00"))
+                if parsed.tzinfo is not None:
+                    parsed = parsed.astimezone(KST).replace(tzinfo=None)
+                return parsed
+            if "date" in value:
+                return datetime.combine(date.fromisoformat(value["date"]), time())
+            return None
+
+        start = parse(event.get("start", {}))
+        if start is None:
+            return None
+        end = parse(event.get("end", {})) or start
+        return start, end
+
+    @staticmethod
+    def _covers(state, time_min: datetime, time_max: datetime) -> bool:
+        """캐시가 조회 기간을 포함하는지 여부"""
+        return (
+            state is not None
+            and state.window_start <= time_min
+            and time_max <= state.window_end
+        )
+
+    def _needs_sync(self, state, time_min: datetime, time_max: datetime) -> bool:
+        """동기화 필요 여부"""
+        if not self._covers(state, time_min, time_max) or not state.sync_token:
+            return True
+        return self._now() - state.synced_at >= self.max_age
+
+    def sync(
+        self,
+        db,
+        credentials,
+        user_id: int,
+        calendar_id: str,
+        time_min: datetime,
+        time_max: datetime,
+    ) -> int:
+        """
+        캘린더 동기화 (증분 동기화 우선, 불가능하면 전체 동기화)
+
+        Args:
+            db: 데이터베이스 세션
+            credentials: 구글 인증 정보
+            user_id: 사용자 ID
+            calendar_id: 구글 캘린더 ID
+            time_min: 캐시에 포함되어야 하는 조회 시작 시간 (한국 시간)
+            time_max: 캐시에 포함되어야 하는 조회 종료 시간 (한국 시간)
+
+        Returns:
+            int: 반영된 일정 변경 수
+        """
+        state = get_calendar_sync_state(db, user_id, calendar_id)
+        request, window = self._sync_request(state, time_min, time_max)
+
+        try:
+            items, sync_token = self.auth.sync_calendar_events(credentials, calendar_id, **request)
+        except CalendarSyncTokenExpiredError:
+            if window is not None:
+                raise
+            print(f"🔄 캘린더 동기화 토큰 만료, 전체 재동기화: {calendar_id}")
+            request, window = self._sync_request(None, time_min, time_max)
+            items, sync_token = self.auth.sync_calendar_events(credentials, calendar_id, **request)
+
+        return self._save_sync(db, user_id, calendar_id, items, sync_token, window)
+
+    def sync_many(
+        self,
+        db,
+        credentials,
+        user_id: int,
+        calendar_ids: List[str],
+        time_min: datetime,
+        time_max: datetime,
+    ) -> Dict[str, Exception]:
+        """
+        여러 캘린더 동기화 (캘린더별 첫 페이지를 배치 요청 한 번으로 조회)
+
+        Args:
+            db: 데이터베이스 세션
+            credentials: 구글 인증 정보
+            user_id: 사용자 ID
+            calendar_ids: 동기화할 구글 캘린더 ID 목록
+            time_min: 캐시에 포함되어야 하는 조회 시작 시간 (한국 시간)
+            time_max: 캐시에 포함되어야 하는 조회 종료 시간 (한국 시간)
+
+        Returns:
+            Dict[str, Exception]: 동기화에 실패한 캘린더 ID별 예외
+        """
+        plans = {
+            calendar_id: self._sync_request(
+                get_calendar_sync_state(db, user_id, calendar_id), time_min, time_max
+            )
+            for calendar_id in calendar_ids
+        }
+        responses = self.auth.sync_multiple_calendars(
+            credentials, {calendar_id: plan[0] for calendar_id, plan in plans.items()}
+        )
+
+        # 동기화 토큰이 만료된 캘린더만 모아 전체 재동기화
+        expired = [
+            calendar_id
+            for calendar_id, response in responses.items()
+            if isinstance(response, CalendarSyncTokenExpiredError) and plans[calendar_id][1] is None
+        ]
+        if expired:
+            print(f"🔄 캘린더 동기화 토큰 만료, 전체 재동기화: {', '.join(expired)}")
+            for calendar_id in expired:
+                plans[calendar_id] = self._sync_request(None, time_min, time_max)
+            responses.update(
+                self.auth.sync_multiple_calendars(
+                    credentials, {calendar_id: plans[calendar_id][0] for calendar_id in expired}
+                )
+            )
+
+        errors: Dict[str, Exception] = {}
+        for calendar_id, (_, window) in plans.items():
+            response = responses.get(calendar_id)
+            if response is None or isinstance(response, Exception):
+                errors[calendar_id] = response or Exception("응답 없음")
+                continue
+            try:
+                self._save_sync(db, user_id, calendar_id, *response, window)
+            except Exception as e:
+                errors[calendar_id] = e
+        return errors
+
+    def _sync_request(
+        self, state, time_min: datetime, time_max: datetime
+    ) -> Tuple[Dict, Optional[Tuple[datetime, datetime]]]:
+        """
+        동기화 조회 조건 결정 (증분 동기화 가능하면 syncToken, 아니면 기간을 정해 전체 동기화)
+
+        Returns:
+            Tuple: (sync_calendar_events 조회 조건, 전체 동기화 기간 또는 None)
+        """
+        if self._covers(state, time_min, time_max) and state.sync_token:
+            return {"sync_token": state.sync_token}, None
+
+        today = datetime.combine(self._now().date(), time())
+        window = (
+            min(time_min, today - timedelta(days=self.days_behind)),
+            max(time_max, today + timedelta(days=self.days_ahead + 1)),
+        )
+        request = {
+            "time_min": window[0].replace(tzinfo=KST),
+            "time_max": window[1].replace(tzinfo=KST),
+        }
+        return request, window
+
+    def _save_sync(
+        self,
+        db,
+        user_id: int,
+        calendar_id: str,
+        items: List[Dict],
+        sync_token: Optional[str],
+        window: Optional[Tuple[datetime, datetime]],
+    ) -> int:
+        """동기화 결과 저장 (같은 일정이 여러 번 오면 마지막 변경만 반영)"""
+        changes: Dict[str, Optional[Dict]] = {}
+        for item in items:
+            event_range = self.event_range(item)
+            if item.get("status") == "cancelled" or event_range is None:
+                changes[item["id"]] = None
+                continue
+            changes[item["id"]] = {
+                "event_id": item["id"],
+                "start_at": event_range[0],
+                "end_at": event_range[1],
+                "event_json": json.dumps(item, ensure_ascii=False),
+            }
+
+        save_calendar_sync(
+            db,
+            user_id,
+            calendar_id,
+            events=[event for event in changes.values() if event is not None],
+            deleted_event_ids=[event_id for event_id, event in changes.items() if event is None],
+            sync_token=sync_token,
+            synced_at=self._now(),
+            window=window,
+        )
+        return len(changes)
+
+    def get_events(
+        self,
+        credentials,
+        user_id: int,
+        calendar_ids: List[str],
+        time_min: datetime,
+        time_max: datetime,
+    ) -> Dict[str, Optional[List[Dict]]]:
+        """
+        캘린더별 일정 조회 (필요 시 동기화 후 캐시에서 조회)
+
+        Args:
+            credentials: 구글 인증 정보
+            user_id: 사용자 ID
+            calendar_ids: 구글 캘린더 ID 목록
+            time_min: 조회 시작 시간 (한국 시간)
+            time_max: 조회 종료 시간 (한국 시간)
+
+        Returns:
+            Dict[str, Optional[List[Dict]]]: 캘린더 ID별 일정 목록
+            (동기화 실패 시 이전 캐시 사용, 캐시도 없으면 None)
+        """
+        results: Dict[str, Optional[List[Dict]]] = {}
+        db = SessionLocal()
+        try:
+            with ExitStack() as stack:
+                # 잠금 순서를 고정하여 교착 방지
+                for calendar_id in sorted(set(calendar_ids)):
+                    stack.enter_context(self._lock_for(user_id, calendar_id))
+
+                states = {
+                    calendar_id: get_calendar_sync_state(db, user_id, calendar_id)
+                    for calendar_id in calendar_ids
+                }
+                stale = [
+                    calendar_id
+                    for calendar_id, state in states.items()
+                    if self._needs_sync(state, time_min, time_max)
+                ]
+
+                errors: Dict[str, Exception] = {}
+                if len(stale) == 1:
+                    try:
+                        self.sync(db, credentials, user_id, stale[0], time_min, time_max)
+                    except Exception as e:
+                        errors[stale[0]] = e
+                elif stale:
+                    try:
+                        errors = self.sync_many(db, credentials, user_id, stale, time_min, time_max)
+                    except Exception as e:
+                        errors = {calendar_id: e for calendar_id in stale}
+
+                for calendar_id in calendar_ids:
+                    if calendar_id in errors:
+                        print(f"캘린더 {calendar_id} 동기화 실패: {errors[calendar_id]}")
+                        if not self._covers(states[calendar_id], time_min, time_max):
+                            results[calendar_id] = None
+                            continue
+
+                    rows = get_cached_calendar_events(db, user_id, calendar_id, time_min, time_max)
+                    results[calendar_id] = [json.loads(row.event_json) for row in rows]
+        finally:
+            db.close()
+        return results
+
+    def get_today_events(
+        self, credentials, user_id: int, calendar_ids: List[str]
+    ) -> Dict[str, Optional[List[Dict]]]:
+        """
+        캘린더별 오늘(한국 시간) 일정 조회
+
+        Args:
+            credentials: 구글 인증 정보
+            user_id: 사용자 ID
+            calendar_ids: 구글 캘린더 ID 목록
+
+        Returns:
+            Dict[str, Optional[List[Dict]]]: 캘린더 ID별 일정 목록
+        """
+        today = datetime.combine(self._now().date(), time())
+        return self.get_events(
+            credentials, user_id, calendar_ids, today, today + timedelta(days=1)
+        )
+
+
+# 싱글톤 인스턴스
+calendar_cache = CalendarCache()
@@ -0,0 +1,138 @@
+"""
+HTTP 클라이언트 관리 모듈
+외부 API 호스트별로 연결 풀을 유지하는 httpx.AsyncClient 공유
+"""
+
+import asyncio
+import importlib.util
+import threading
+import weakref
+from typing import Dict
+import httpx
+
+# h2 패키지가 설치된 경우에만 HTTP/2 사용 (ALPN 협상, 미지원 서버는 HTTP/1.1)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class RateLimitedError(Exception):
+    """외부 API 요청 한도 초과 (HTTP 429)"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def get_retry_after(response: httpx.Response, default: float = 1.0) -> float:
+    """
+    429 응답의 재시도 대기 시간 조회
+    Telegram 응답 본문의 parameters.retry_after, 없으면 Retry-After 헤더 사용
+
+    Args:
+        response: HTTP 응답
+        default: 값이 없을 때 기본 대기 시간 (초)
+
+    Returns:
+        float: 재시도 대기 시간 (초)
+    """
+    try:
+        retry_after = response.json().get("parameters", {}).get("retry_after")
+        if retry_after is not None:
+            return float(retry_after)
+    except (ValueError, AttributeError):
+        pass
+
+    try:
+        return float(response.headers.get("Retry-After", default))
+    except (TypeError, ValueError):
+        return default
+
+
+class HttpClientRegistry:
+    """
+    호스트별 공유 HTTP 클라이언트 관리
+
+    httpx.AsyncClient는 처음 사용한 이벤트 루프에 연결이 묶이므로
+    (이벤트 루프, 호스트) 단위로 클라이언트를 하나씩 유지
+    (FastAPI 루프와 스케줄러 공유 루프가 각자 연결 풀 사용)
+    """
+
+    def __init__(self):
+        self.timeout = httpx.Timeout(10.0, connect=5.0)
+        self.limits = httpx.Limits(
+            max_connections=20,
+            max_keepalive_connections=10,
+            keepalive_expiry=60.0,
+        )
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> httpx.AsyncClient:
+        """
+        URL 호스트에 해당하는 공유 클라이언트 조회 (없으면 생성)
+
+        Args:
+            url: 요청 URL 또는 기준 URL
+
+        Returns:
+            httpx.AsyncClient: 현재 이벤트 루프용 클라이언트
+        """
+        loop = asyncio.get_running_loop()
+        parsed = httpx.URL(url)
+        key = f"{parsed.scheme}://{parsed.host}"
+
+        with self._lock:
+            self._discard_closed_loops()
+            clients = self._clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    http2=HTTP2_AVAILABLE,
+                    timeout=self.timeout,
+                    limits=self.limits,
+                )
+                clients[key] = client
+            return client
+
+    def _discard_closed_loops(self):
+        """종료된 이벤트 루프의 클라이언트 제거 (연결은 루프와 함께 정리됨)"""
+        for loop in [loop for loop in self._clients.keys() if loop.is_closed()]:
+            del self._clients[loop]
+
+    async def aclose(self):
+        """
+        모든 공유 클라이언트 종료
+        현재 루프의 클라이언트는 직접 닫고, 다른 실행 중인 루프의 클라이언트는 해당 루프에서 닫음
+        """
+        current_loop = asyncio.get_running_loop()
+
+        with self._lock:
+            entries = list(self._clients.items())
+            self._clients = weakref.WeakKeyDictionary()
+
+        for loop, clients in entries:
+            if not clients:
+                continue
+
+            try:
+                if loop is current_loop:
+                    await self._close_clients(list(clients.values()))
+                elif loop.is_running():
+                    future = asyncio.run_coroutine_threadsafe(
+                        self._close_clients(list(clients.values())), loop
+                    )
+                    await asyncio.wait_for(asyncio.wrap_future(future), timeout=5)
+            except Exception as e:
+                print(f"⚠️  HTTP 클라이언트 종료 실패: {e}")
+
+        print("🔌 HTTP 클라이언트 종료")
+
+    @staticmethod
+    async def _close_clients(clients):
+        """클라이언트 목록 종료"""
+        await asyncio.gather(*[client.aclose() for client in clients], return_exceptions=True)
+
+
+# 싱글톤 인스턴스
+http_clients = HttpClientRegistry()
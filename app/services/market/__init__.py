@@ -0,0 +1,51 @@
+"""
+시장 데이터 서비스 패키지
+"""
+
+from app.services.market.trading_calendar import trading_calendar, TradingCalendar
+from app.services.market.quote_cache import quote_cache, QuoteCache
+from app.services.market.history_store import history_store, HistoryStore
+from app.services.market.executor import market_data_executor, MarketDataExecutor
+from app.services.market.alert_index import alert_index, AlertIndex
+from app.services.market.alert_evaluator import AlertMatrix
+from app.services.market.poll_scheduler import poll_scheduler, SymbolPollScheduler
+from app.services.market.quote_stream import (
+    quote_stream,
+    QuoteStream,
+    QuoteSource,
+    WebSocketQuoteSource,
+    ReplayQuoteSource,
+)
+from app.services.market.ticker_directory import (
+    kr_ticker_directory,
+    us_ticker_directory,
+    KRTickerDirectory,
+    USTickerDirectory,
+    TickerDirectory,
+)
+
+__all__ = [
+    "trading_calendar",
+    "TradingCalendar",
+    "quote_cache",
+    "QuoteCache",
+    "history_store",
+    "HistoryStore",
+    "market_data_executor",
+    "MarketDataExecutor",
+    "alert_index",
+    "AlertIndex",
+    "AlertMatrix",
+    "poll_scheduler",
+    "SymbolPollScheduler",
+    "quote_stream",
+    "QuoteStream",
+    "QuoteSource",
+    "WebSocketQuoteSource",
+    "ReplayQuoteSource",
+    "kr_ticker_directory",
+    "KRTickerDirectory",
+    "us_ticker_directory",
+    "USTickerDirectory",
+    "TickerDirectory",
+]
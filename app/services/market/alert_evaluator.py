@@ -0,0 +1,127 @@
+"""
+가격 알림 일괄 평가 모듈
+활성 알림을 NumPy 배열로 보관하고, 종목별 현재가 벡터로 모든 알림 조건을 한 번에 평가
+"""
+
+from typing import Dict, Iterable, List, Tuple
+import numpy as np
+
+Symbol = Tuple[str, str]
+
+# 알림 타입 코드 (삭제된 행은 INACTIVE)
+TYPE_CODES = {"TARGET_HIGH": 0, "TARGET_LOW": 1, "PERCENT_CHANGE": 2}
+INACTIVE = -1
+
+
+class AlertMatrix:
+    """
+    가격 알림 배열 (열 단위 저장)
+
+    - 행마다 종목 번호, 타입 코드, 목표가, 기준가, 목표 변동률(절댓값), 사용자 ID, 알림 ID 보관
+    - 삭제/기준가 변경은 해당 행만 수정, 추가는 다음 평가 시 전체 재구성
+    - 삭제된 행이 절반을 넘으면 다음 평가 시 재구성하여 배열 크기 유지
+    - 스레드 안전하지 않음 (AlertIndex 잠금 안에서 사용)
+    """
+
+    def __init__(self):
+        self._dirty = True
+        self._removed = 0
+        self._rows: Dict[int, int] = {}
+        self._symbols: Dict[Symbol, int] = {}
+        self.symbol_idx = np.empty(0, dtype=np.int32)
+        self.type_code = np.empty(0, dtype=np.int8)
+        self.target = np.empty(0, dtype=np.float64)
+        self.reference = np.empty(0, dtype=np.float64)
+        self.percent = np.empty(0, dtype=np.float64)
+        self.user_id = np.empty(0, dtype=np.int64)
+        self.alert_id = np.empty(0, dtype=np.int64)
+
+    def mark_dirty(self):
+        """알림 추가 시 호출 (다음 평가 시 재구성)"""
+        self._dirty = True
+
+    def remove(self, alert_id: int):
+        """알림 행 비활성화"""
+        row = self._rows.pop(alert_id, None)
+        if row is not None:
+            self.type_code[row] = INACTIVE
+            self._removed += 1
+
+    def set_reference(self, alert_id: int, reference_price: float) -> bool:
+        """
+        변동률 알림 기준가 변경
+
+        Returns:
+            bool: 배열에 반영 여부 (해당 행이 없으면 False, 재구성 필요)
+        """
+        row = self._rows.get(alert_id)
+        if row is None:
+            return False
+        self.reference[row] = np.nan if reference_price is None else reference_price
+        return True
+
+    def rebuild(self, alerts: Iterable):
+        """
+        알림 목록으로 배열 재구성
+
+        Args:
+            alerts: IndexedAlert 목록
+        """
+        alerts = [alert for alert in alerts if alert.alert_type in TYPE_CODES]
+        self._symbols = {}
+        for alert in alerts:
+            self._symbols.setdefault((alert.ticker, alert.market), len(self._symbols))
+
+        def column(values, dtype):
+            return np.fromiter(values, dtype=dtype, count=len(alerts))
+
+        def number(value):
+            return np.nan if value is None else value
+
+        self.symbol_idx = column((self._symbols[(a.ticker, a.market)] for a in alerts), np.int32)
+        self.type_code = column((TYPE_CODES[a.alert_type] for a in alerts), np.int8)
+        self.target = column((number(a.target_price) for a in alerts), np.float64)
+        self.reference = column((number(a.reference_price) for a in alerts), np.float64)
+        self.percent = np.abs(column((number(a.target_percent) for a in alerts), np.float64))
+        self.user_id = column((a.user_id for a in alerts), np.int64)
+        self.alert_id = column((a.alert_id for a in alerts), np.int64)
+
+        self._rows = {alert.alert_id: row for row, alert in enumerate(alerts)}
+        self._removed = 0
+        self._dirty = False
+
+    def needs_rebuild(self) -> bool:
+        return self._dirty or self._removed > len(self._rows)
+
+    def evaluate(self, user_id: int, prices: Dict[Symbol, float]) -> List[int]:
+        """
+        현재가 벡터로 모든 알림 조건 평가
+
+        Args:
+            user_id: 사용자 ID
+            prices: (ticker, market)별 현재가 (조회된 종목만)
+
+        Returns:
+            List[int]: 조건을 만족한 알림 ID 목록
+        """
+        price_by_symbol = np.full(len(self._symbols), np.nan)
+        for symbol, price in prices.items():
+            index = self._symbols.get(symbol)
+            if index is not None and price is not None:
+                price_by_symbol[index] = price
+
+        # 알림 행별 현재가 (조회되지 않은 종목은 NaN이므로 모든 비교가 False)
+        price = price_by_symbol[self.symbol_idx]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change_percent = (price - self.reference) / self.reference * 100
+            fired = (
+                ((self.type_code == 0) & (price >= self.target))
+                | ((self.type_code == 1) & (price <= self.target))
+                | (
+                    (self.type_code == 2)
+                    & (self.reference > 0)
+                    & (np.abs(change_percent) >= self.percent)
+                )
+            )
+        fired &= self.user_id == user_id
+        return self.alert_id[np.flatnonzero(fired)].tolist()
@@ -0,0 +1,374 @@
+"""
+가격 알림 인덱스 모듈
+종목별로 알림 임계가를 정렬해 두고, 새 시세가 넘어선 알림을 이진 탐색으로 찾음
+"""
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from app.crud import get_active_alerts_with_watchlists
+from app.services.market.alert_evaluator import AlertMatrix
+
+# 변동률 밴드 경계 여유 (부동소수점 오차로 경계값이 누락되지 않도록 후보를 넓게 잡고 정확히 재확인)
+BAND_TOLERANCE = 1e-9
+
+INF = float("inf")
+
+
+@dataclass
+class IndexedAlert:
+    """인덱스에 보관하는 알림 정보 (DB 세션과 무관하게 사용)"""
+
+    alert_id: int
+    user_id: int
+    watchlist_id: int
+    ticker: str
+    market: str
+    name: Optional[str]
+    alert_type: str
+    target_price: Optional[float]
+    target_percent: Optional[float]
+    reference_price: Optional[float]
+
+    def change_percent(self, price: float) -> float:
+        """기준가 대비 변동률 (%)"""
+        return (price - self.reference_price) / self.reference_price * 100
+
+
+class SymbolAlerts:
+    """
+    종목 하나의 알림 임계가 목록
+
+    - highs: TARGET_HIGH 목표가 오름차순 (시세 >= 목표가)
+    - lows: TARGET_LOW 손절가 오름차순 (시세 <= 손절가)
+    - band_highs / band_lows: PERCENT_CHANGE 기준가 ± 변동률 밴드의 상단/하단
+    - unreferenced: 기준가가 없는 PERCENT_CHANGE 알림 (첫 시세로 기준가 초기화)
+    """
+
+    def __init__(self):
+        self.highs: List[Tuple[float, int]] = []
+        self.lows: List[Tuple[float, int]] = []
+        self.band_highs: List[Tuple[float, int]] = []
+        self.band_lows: List[Tuple[float, int]] = []
+        self.unreferenced: Set[int] = set()
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.highs or self.lows or self.band_highs or self.band_lows or self.unreferenced
+        )
+
+    @staticmethod
+    def _remove(thresholds: List[Tuple[float, int]], key: Tuple[float, int]):
+        index = bisect_left(thresholds, key)
+        if index < len(thresholds) and thresholds[index] == key:
+            del thresholds[index]
+
+    @staticmethod
+    def _band(alert: IndexedAlert) -> Optional[Tuple[float, float]]:
+        """변동률 밴드 (하단, 상단), 기준가가 없거나 0 이하면 None"""
+        if alert.reference_price is None or alert.reference_price <= 0:
+            return None
+        width = alert.reference_price * abs(alert.target_percent or 0) / 100
+        return (
+            alert.reference_price - width + alert.reference_price * BAND_TOLERANCE,
+            alert.reference_price + width - alert.reference_price * BAND_TOLERANCE,
+        )
+
+    def add(self, alert: IndexedAlert):
+        if alert.alert_type == "TARGET_HIGH":
+            insort(self.highs, (alert.target_price, alert.alert_id))
+        elif alert.alert_type == "TARGET_LOW":
+            insort(self.lows, (alert.target_price, alert.alert_id))
+        elif alert.alert_type == "PERCENT_CHANGE":
+            band = self._band(alert)
+            if alert.reference_price is None:
+                self.unreferenced.add(alert.alert_id)
+            elif band is not None:
+                insort(self.band_lows, (band[0], alert.alert_id))
+                insort(self.band_highs, (band[1], alert.alert_id))
+
+    def remove(self, alert: IndexedAlert):
+        if alert.alert_type == "TARGET_HIGH":
+            self._remove(self.highs, (alert.target_price, alert.alert_id))
+        elif alert.alert_type == "TARGET_LOW":
+            self._remove(self.lows, (alert.target_price, alert.alert_id))
+        elif alert.alert_type == "PERCENT_CHANGE":
+            self.unreferenced.discard(alert.alert_id)
+            band = self._band(alert)
+            if band is not None:
+                self._remove(self.band_lows, (band[0], alert.alert_id))
+                self._remove(self.band_highs, (band[1], alert.alert_id))
+
+    def crossed(self, price: float) -> Tuple[List[int], Set[int]]:
+        """
+        시세가 넘어선 알림 ID 조회
+
+        Returns:
+            Tuple[List[int], Set[int]]: (목표가/손절가 도달 알림, 변동률 밴드 이탈 후보 알림)
+        """
+        targets = [alert_id for _, alert_id in self.highs[: bisect_right(self.highs, (price, INF))]]
+        targets += [alert_id for _, alert_id in self.lows[bisect_left(self.lows, (price, -INF)):]]
+
+        bands = {alert_id for _, alert_id in self.band_highs[: bisect_right(self.band_highs, (price, INF))]}
+        bands.update(
+            alert_id for _, alert_id in self.band_lows[bisect_left(self.band_lows, (price, -INF)):]
+        )
+        return targets, bands
+
+    def nearest_distance(self, price: float) -> Optional[float]:
+        """
+        가장 가까운 미발동 임계가까지 거리
+
+        Returns:
+            float: 현재가 대비 비율 (이미 넘어선 임계가나 기준가 없는 알림이 있으면 0, 임계가가 없으면 None)
+        """
+        if self.unreferenced:
+            return 0.0
+
+        distances = []
+        for above in (self.highs, self.band_highs):
+            index = bisect_right(above, (price, INF))
+            if index > 0:
+                return 0.0
+            if index < len(above):
+                distances.append(above[index][0] - price)
+        for below in (self.lows, self.band_lows):
+            index = bisect_left(below, (price, -INF))
+            if index < len(below):
+                return 0.0
+            if index > 0:
+                distances.append(price - below[index - 1][0])
+
+        if not distances or price <= 0:
+            return None
+        return min(distances) / price
+
+
+class AlertIndex:
+    """
+    가격 알림 인메모리 인덱스
+
+    - 사용자별 최초 체크 시 DB에서 활성 알림을 한 번에 읽어 (ticker, market)별로 구성
+    - 이후 알림 등록/삭제/발동/기준가 변경 시 해당 알림만 갱신
+    - 단일 종목 시세(실시간 스트림)는 crossed()의 이진 탐색으로,
+      여러 종목 시세(주기 체크)는 evaluate()의 NumPy 일괄 평가로 발동 알림 조회
+    - 스레드 안전: 스케줄러 스레드와 요청 처리에서 동시에 접근 가능
+    """
+
+    def __init__(self):
+        self._alerts: Dict[int, IndexedAlert] = {}
+        self._symbols: Dict[Tuple[str, str], SymbolAlerts] = {}
+        self._loaded_users: Set[int] = set()
+        self._matrix = AlertMatrix()
+        self._lock = threading.Lock()
+
+    def _add(self, alert: IndexedAlert):
+        self._remove(alert.alert_id)
+        self._alerts[alert.alert_id] = alert
+        self._symbols.setdefault((alert.ticker, alert.market), SymbolAlerts()).add(alert)
+        self._matrix.mark_dirty()
+
+    def _remove(self, alert_id: int) -> Optional[IndexedAlert]:
+        alert = self._alerts.pop(alert_id, None)
+        if alert is None:
+            return None
+        self._matrix.remove(alert_id)
+        key = (alert.ticker, alert.market)
+        symbol = self._symbols.get(key)
+        if symbol is not None:
+            symbol.remove(alert)
+            if not symbol:
+                del self._symbols[key]
+        return alert
+
+    @staticmethod
+    def _from_models(alert, watchlist) -> IndexedAlert:
+        return IndexedAlert(
+            alert_id=alert.alert_id,
+            user_id=alert.user_id,
+            watchlist_id=alert.watchlist_id,
+            ticker=watchlist.ticker,
+            market=watchlist.market,
+            name=watchlist.name,
+            alert_type=alert.alert_type,
+            target_price=alert.target_price,
+            target_percent=alert.target_percent,
+            reference_price=alert.reference_price,
+        )
+
+    def ensure_loaded(self, db, user_id: int):
+        """
+        사용자 알림 인덱스 구성 (이미 구성되어 있으면 생략)
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 ID
+        """
+        with self._lock:
+            if user_id in self._loaded_users:
+                return
+
+        rows = get_active_alerts_with_watchlists(db, user_id)
+
+        with self._lock:
+            if user_id in self._loaded_users:
+                return
+            for alert, watchlist in rows:
+                self._add(self._from_models(alert, watchlist))
+            self._loaded_users.add(user_id)
+        print(f"🗂️  가격 알림 인덱스 구성: {len(rows)}개")
+
+    def add(self, alert, watchlist):
+        """
+        알림 추가 (등록 직후 호출)
+
+        Args:
+            alert: PriceAlert 객체
+            watchlist: 알림 대상 Watchlist 객체
+        """
+        if not alert.is_active or alert.is_triggered:
+            return
+        with self._lock:
+            if alert.user_id in self._loaded_users:
+                self._add(self._from_models(alert, watchlist))
+
+    def remove(self, alert_id: int):
+        """알림 제거 (삭제/발동 시 호출)"""
+        with self._lock:
+            self._remove(alert_id)
+
+    def remove_watchlist(self, watchlist_id: int):
+        """관심 종목의 알림 전체 제거 (관심 종목 삭제 시 호출)"""
+        with self._lock:
+            for alert_id in [
+                alert.alert_id for alert in self._alerts.values() if alert.watchlist_id == watchlist_id
+            ]:
+                self._remove(alert_id)
+
+    def update_watchlist(self, watchlist):
+        """관심 종목 정보 변경 반영 (종목명 수정 시 호출)"""
+        with self._lock:
+            for alert in self._alerts.values():
+                if alert.watchlist_id == watchlist.watchlist_id:
+                    alert.name = watchlist.name
+
+    def update_reference(self, alert_id: int, reference_price: float):
+        """변동률 알림 기준가 변경 (밴드 재배치)"""
+        with self._lock:
+            alert = self._alerts.get(alert_id)
+            if alert is None:
+                return
+            symbol = self._symbols[(alert.ticker, alert.market)]
+            symbol.remove(alert)
+            alert.reference_price = reference_price
+            symbol.add(alert)
+            if not self._matrix.set_reference(alert_id, reference_price):
+                self._matrix.mark_dirty()
+
+    def invalidate(self, user_id: Optional[int] = None):
+        """
+        인덱스 무효화 (다음 체크 시 DB에서 다시 구성)
+
+        Args:
+            user_id: 사용자 ID (None이면 전체)
+        """
+        with self._lock:
+            for alert in list(self._alerts.values()):
+                if user_id is None or alert.user_id == user_id:
+                    self._remove(alert.alert_id)
+            if user_id is None:
+                self._loaded_users.clear()
+            else:
+                self._loaded_users.discard(user_id)
+
+    def alert_ids(self, user_id: int) -> Set[int]:
+        """사용자의 체크 대상 알림 ID 집합"""
+        with self._lock:
+            return {alert.alert_id for alert in self._alerts.values() if alert.user_id == user_id}
+
+    def symbols(self, user_id: int) -> List[Tuple[str, str]]:
+        """사용자 알림이 걸린 (ticker, market) 목록"""
+        with self._lock:
+            return list(
+                dict.fromkeys(
+                    (alert.ticker, alert.market)
+                    for alert in self._alerts.values()
+                    if alert.user_id == user_id
+                )
+            )
+
+    def unreferenced(self, user_id: int, ticker: str, market: str) -> List[IndexedAlert]:
+        """기준가가 아직 없는 변동률 알림 목록"""
+        with self._lock:
+            symbol = self._symbols.get((ticker, market))
+            if symbol is None:
+                return []
+            alerts = [self._alerts[alert_id] for alert_id in symbol.unreferenced]
+        return [alert for alert in alerts if alert.user_id == user_id]
+
+    def nearest_distance(self, ticker: str, market: str, price: float) -> Optional[float]:
+        """
+        종목의 가장 가까운 임계가까지 거리 (종목 조회 주기 계산용)
+
+        Args:
+            ticker: 종목 티커
+            market: 시장 (US / KR)
+            price: 현재가
+
+        Returns:
+            float: 현재가 대비 비율 (임계가가 없으면 None)
+        """
+        with self._lock:
+            symbol = self._symbols.get((ticker, market))
+            return symbol.nearest_distance(price) if symbol is not None else None
+
+    def evaluate(self, user_id: int, prices: Dict[Tuple[str, str], float]) -> List[IndexedAlert]:
+        """
+        여러 종목 현재가로 모든 알림 조건을 한 번에 평가 (NumPy 벡터 연산)
+
+        Args:
+            user_id: 사용자 ID
+            prices: (ticker, market)별 현재가
+
+        Returns:
+            List[IndexedAlert]: 발동 조건을 만족한 알림 목록
+        """
+        with self._lock:
+            if self._matrix.needs_rebuild():
+                self._matrix.rebuild(self._alerts.values())
+            return [self._alerts[alert_id] for alert_id in self._matrix.evaluate(user_id, prices)]
+
+    def crossed(
+        self, user_id: int, ticker: str, market: str, price: float
+    ) -> List[IndexedAlert]:
+        """
+        시세가 임계가를 넘어선 알림 조회
+
+        Args:
+            user_id: 사용자 ID
+            ticker: 종목 티커
+            market: 시장 (US / KR)
+            price: 현재가
+
+        Returns:
+            List[IndexedAlert]: 발동 조건을 만족한 알림 목록
+        """
+        with self._lock:
+            symbol = self._symbols.get((ticker, market))
+            if symbol is None:
+                return []
+            targets, bands = symbol.crossed(price)
+            alerts = [self._alerts[alert_id] for alert_id in targets]
+            # 밴드 후보는 기존 변동률 계산식으로 다시 확인
+            alerts += [
+                self._alerts[alert_id]
+                for alert_id in sorted(bands)
+                if abs(self._alerts[alert_id].change_percent(price))
+                >= abs(self._alerts[alert_id].target_percent or 0)
+            ]
+        return [alert for alert in alerts if alert.user_id == user_id]
+
+
+# 싱글톤 인스턴스
+alert_index = AlertIndex()
@@ -0,0 +1,149 @@
+"""
+시장 데이터 실행기 모듈
+yfinance/pykrx 동기 호출을 전용 스레드 풀에서 실행하여 이벤트 루프 차단 방지
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+from app.config import settings
+
+# 시장별 데이터 제공자
+PROVIDER_YAHOO = "yahoo"
+PROVIDER_KRX = "krx"
+
+
+class MarketDataExecutor:
+    """
+    시장 데이터 전용 스레드 풀
+
+    - 동시 호출 수를 제한하는 제공자(yahoo / krx)는 제한 수 크기의 전용 스레드 풀에서 실행
+      (대기 중인 작업이 공용 스레드를 점유하지 않으므로 한 제공자가 몰려도 다른 제공자 호출은 지연되지 않음)
+    - 그 외 작업은 공용 스레드 풀에서 실행 (전체 동시 실행 수는 풀 크기로 제한)
+    - 제한 시간을 넘긴 호출은 스레드를 계속 점유하므로 지연 호출로 집계하고,
+      풀의 모든 스레드가 지연 호출로 점유되면 해당 풀에는 새 작업을 보내지 않고 즉시 시간 초과 처리
+    - 스레드 풀은 스케줄러 스레드의 이벤트 루프와 웹 이벤트 루프가 함께 사용
+    """
+
+    def __init__(self, max_workers: int, provider_limits: Dict[str, int]):
+        self.max_workers = max_workers
+        self.provider_limits = provider_limits
+        self._executors: Dict[Optional[str], ThreadPoolExecutor] = {}
+        self._stalled: Dict[Optional[str], int] = {}
+        self._executor_lock = threading.Lock()
+
+    @staticmethod
+    def provider_for(market: str) -> str:
+        """시장별 데이터 제공자 조회"""
+        return PROVIDER_KRX if market == "KR" else PROVIDER_YAHOO
+
+    def _pool_key(self, provider: str) -> Optional[str]:
+        """제공자가 사용할 스레드 풀 키 (전용 풀이 없으면 None = 공용 풀)"""
+        return provider if self.provider_limits.get(provider, 0) > 0 else None
+
+    def _pool_size(self, key: Optional[str]) -> int:
+        """스레드 풀 크기"""
+        return self.provider_limits[key] if key else self.max_workers
+
+    def _get_executor(self, provider: str) -> ThreadPoolExecutor:
+        """제공자별 스레드 풀 조회 (최초 사용 시 생성, 종료 후 재사용 시 재생성)"""
+        key = self._pool_key(provider)
+        with self._executor_lock:
+            executor = self._executors.get(key)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=self._pool_size(key),
+                    thread_name_prefix=f"market-data-{key}" if key else "market-data",
+                )
+                self._executors[key] = executor
+            return executor
+
+    def submit(self, provider: str, func: Callable, *args, **kwargs) -> Future:
+        """
+        스레드 풀에 작업 제출
+
+        Args:
+            provider: 데이터 제공자 (yahoo / krx)
+            func: 실행할 동기 함수
+
+        Returns:
+            Future: 실행 결과
+        """
+        return self._get_executor(provider).submit(func, *args, **kwargs)
+
+    async def run(self, provider: str, func: Callable, *args, **kwargs):
+        """
+        동기 함수를 스레드 풀에서 실행하고 결과 대기
+
+        Args:
+            provider: 데이터 제공자 (yahoo / krx)
+            func: 실행할 동기 함수
+
+        Returns:
+            함수 실행 결과
+        """
+        return await asyncio.wrap_future(self.submit(provider, func, *args, **kwargs))
+
+    async def run_with_timeout(self, provider: str, timeout: float, func: Callable, *args, **kwargs):
+        """
+        제한 시간 내에 동기 함수 실행 결과 대기
+
+        대기 중인 작업은 시간 초과 시 취소되고, 이미 실행 중인 작업은 끝날 때까지 지연 호출로 집계
+
+        Args:
+            provider: 데이터 제공자 (yahoo / krx)
+            timeout: 제한 시간 (초, 스레드 풀 대기 시간 포함)
+            func: 실행할 동기 함수
+
+        Returns:
+            함수 실행 결과
+
+        Raises:
+            asyncio.TimeoutError: 제한 시간 초과 또는 풀의 모든 스레드가 지연 호출로 점유된 경우
+        """
+        key = self._pool_key(provider)
+        if self.stalled_count(provider) >= self._pool_size(key):
+            raise asyncio.TimeoutError(f"{provider} 지연 호출이 스레드 풀을 모두 점유 중")
+
+        future = self.submit(provider, func, *args, **kwargs)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            if not future.cancel() and not future.done():
+                self._mark_stalled(key, future)
+            raise
+
+    def stalled_count(self, provider: str) -> int:
+        """제한 시간을 넘기고도 아직 실행 중인 호출 수"""
+        with self._executor_lock:
+            return self._stalled.get(self._pool_key(provider), 0)
+
+    def _mark_stalled(self, key: Optional[str], future: Future):
+        """지연 호출 집계 (작업이 끝나면 자동 차감)"""
+        with self._executor_lock:
+            self._stalled[key] = self._stalled.get(key, 0) + 1
+
+        def release(_future: Future):
+            with self._executor_lock:
+                self._stalled[key] = max(self._stalled.get(key, 0) - 1, 0)
+
+        future.add_done_callback(release)
+
+    def shutdown(self, wait: bool = False):
+        """스레드 풀 종료"""
+        with self._executor_lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# 싱글톤 인스턴스
+market_data_executor = MarketDataExecutor(
+    max_workers=settings.MARKET_DATA_MAX_WORKERS,
+    provider_limits={
+        PROVIDER_YAHOO: settings.MARKET_DATA_YAHOO_CONCURRENCY,
+        PROVIDER_KRX: settings.MARKET_DATA_KRX_CONCURRENCY,
+    },
+)
@@ -0,0 +1,214 @@
+"""
+일봉 저장소 모듈
+종목별 OHLCV를 로컬 DB(price_history)에 누적하고, 마지막 저장일 이후 일봉만 추가 조회
+"""
+
+import threading
+from datetime import date, timedelta
+from typing import Callable, Dict, Optional, Tuple
+import pandas as pd
+from app.database import SessionLocal
+from app.crud import (
+    get_price_history,
+    get_price_history_coverage,
+    get_price_history_range,
+    save_price_history_coverage,
+    upsert_price_history,
+)
+from app.services.market.trading_calendar import trading_calendar
+
+# (ticker, market, 조회 시작일) -> Open/High/Low/Close/Volume 컬럼의 DataFrame
+HistoryDownloader = Callable[[str, str, date], Optional[pd.DataFrame]]
+
+# 확정 일봉 종가 비교 허용 오차 (상대값, 이를 넘으면 수정주가 기준 변경으로 판단)
+REBASE_TOLERANCE = 1e-4
+
+# 폐장 후 제공자 일봉이 확정되기까지 여유 시간 (이전에 받은 마지막 일봉은 미완성으로 간주)
+FINAL_BAR_DELAY = timedelta(minutes=30)
+
+
+class HistoryStore:
+    """
+    로컬 일봉 저장소
+
+    - 저장된 데이터가 요청 기간을 포함하지 않으면 전체 기간을 조회해 저장
+      (전체 조회 시작일을 저장 범위로 기록하여, 요청 기간 이후 상장 종목도 다시 전체 조회하지 않음)
+    - 이후에는 마지막 저장일 직전 일봉부터만 조회 (장중 미완성 일봉은 매번 갱신)
+    - 다운로드 일봉은 수정주가이므로, 겹치는 확정 일봉의 종가가 저장값과 다르면
+      (액면분할/배당 반영) 저장된 전체 기간을 다시 조회해 교체
+    - 최근 정규장 일봉까지 저장되어 있고, 그 일봉을 폐장 후 받았으면 네트워크 조회 없이 반환
+      (장중에 받은 마지막 일봉은 폐장 후 다시 조회하여 확정 종가로 교체)
+    """
+
+    def __init__(self):
+        # 종목별 동시 갱신 방지용 잠금
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock_for(self, ticker: str, market: str) -> threading.Lock:
+        """종목별 잠금 객체 조회"""
+        with self._locks_guard:
+            return self._locks.setdefault((ticker, market), threading.Lock())
+
+    def get_history(
+        self,
+        ticker: str,
+        market: str,
+        days: int,
+        downloader: HistoryDownloader,
+    ) -> Optional[pd.DataFrame]:
+        """
+        일봉 조회 (저장소 우선, 부족한 구간만 다운로드)
+
+        Args:
+            ticker: 종목 티커
+            market: 시장 (US / KR)
+            days: 조회 기간 (일)
+            downloader: 원격 일봉 조회 함수
+
+        Returns:
+            DataFrame: 날짜 인덱스의 Open/High/Low/Close/Volume 또는 None
+        """
+        today = trading_calendar.local_now(market).date()
+        start_date = today - timedelta(days=days)
+
+        with self._lock_for(ticker, market):
+            db = SessionLocal()
+            try:
+                self._sync(db, ticker, market, start_date, downloader)
+                rows = get_price_history(db, ticker, market, start_date=start_date)
+            finally:
+                db.close()
+
+        if not rows:
+            return None
+
+        return pd.DataFrame(
+            {
+                "Open": [row.open for row in rows],
+                "High": [row.high for row in rows],
+                "Low": [row.low for row in rows],
+                "Close": [row.close for row in rows],
+                "Volume": [row.volume for row in rows],
+            },
+            index=pd.DatetimeIndex([row.date for row in rows], name="Date"),
+        )
+
+    def _sync(
+        self,
+        db,
+        ticker: str,
+        market: str,
+        start_date: date,
+        downloader: HistoryDownloader,
+    ):
+        """저장소에 없는 구간의 일봉을 다운로드하여 저장"""
+        first_date, last_date = get_price_history_range(db, ticker, market)
+        coverage = get_price_history_coverage(db, ticker, market)
+        anchor = None
+        full = False
+
+        # 저장 범위(없으면 첫 저장일)가 요청 기간 앞부분을 포함하지 않으면 (휴장 여유 7일) 전체 기간 다시 조회
+        covered_from = coverage.covered_from if coverage else first_date
+        if first_date is None or covered_from > start_date + timedelta(days=7):
+            fetch_from = start_date
+            full = True
+        else:
+            latest_session = trading_calendar.last_session_date(market)
+            is_up_to_date = (
+                latest_session is not None
+                and last_date >= latest_session
+                and self._is_final(market, last_date, coverage)
+            )
+            if is_up_to_date:
+                return
+
+            # 마지막 저장일 직전의 확정 일봉부터 조회 (수정주가 기준 비교 + 미완성 일봉 갱신)
+            recent = get_price_history(db, ticker, market, start_date=last_date - timedelta(days=14))
+            anchor = recent[-2] if len(recent) >= 2 else None
+            fetch_from = anchor.date if anchor else last_date
+
+        # 다운로드 시작 시각 (마지막 일봉의 확정 여부 판단용, 시장 현지 시간)
+        fetched_at = trading_calendar.local_now(market).replace(tzinfo=None)
+        try:
+            df = downloader(ticker, market, fetch_from)
+        except Exception as e:
+            print(f"⚠️  일봉 다운로드 실패 ({ticker}): {e}")
+            return
+
+        if df is None or df.empty:
+            return
+
+        replace_all = False
+        if anchor is not None and _is_rebased(df, anchor):
+            # 액면분할/배당으로 과거 수정주가가 바뀜 -> 저장된 전체 기간 다시 조회
+            fetch_from = min(first_date, start_date)
+            print(f"🔄 수정주가 기준 변경 감지: {ticker} ({market}), {fetch_from}부터 다시 조회")
+            try:
+                df = downloader(ticker, market, fetch_from)
+            except Exception as e:
+                print(f"⚠️  일봉 다운로드 실패 ({ticker}): {e}")
+                return
+            if df is None or df.empty:
+                return
+            replace_all = True
+            full = True
+
+        bars = [
+            {
+                "date": index.date() if hasattr(index, "date") else index,
+                "open": _to_float(row["Open"]),
+                "high": _to_float(row["High"]),
+                "low": _to_float(row["Low"]),
+                "close": _to_float(row["Close"]),
+                "volume": _to_float(row["Volume"]),
+            }
+            for index, row in df.iterrows()
+            if not pd.isna(row["Close"])
+        ]
+
+        saved = upsert_price_history(db, ticker, market, bars, replace_all=replace_all)
+        if saved:
+            save_price_history_coverage(
+                db,
+                ticker,
+                market,
+                last_fetched_at=fetched_at,
+                # 저장 범위 기록 전의 일봉은 첫 저장일부터 포함된 것으로 간주
+                covered_from=fetch_from if full else (None if coverage else first_date),
+            )
+            print(f"💾 일봉 저장: {ticker} ({market}) {saved}개 ({fetch_from} ~)")
+
+    @staticmethod
+    def _is_final(market: str, day: date, coverage) -> bool:
+        """저장된 일봉이 폐장 후 받은 확정 일봉인지 여부 (받은 시각을 모르면 미완성으로 간주)"""
+        if coverage is None or coverage.last_fetched_at is None:
+            return False
+        hours = trading_calendar.session_hours(market, day)
+        if hours is None:
+            return True
+        return coverage.last_fetched_at >= hours[1].replace(tzinfo=None) + FINAL_BAR_DELAY
+
+
+def _is_rebased(df: pd.DataFrame, anchor) -> bool:
+    """다운로드한 일봉 중 기준 일봉(확정)의 종가가 저장값과 다른지 여부"""
+    for index, row in df.iterrows():
+        day = index.date() if hasattr(index, "date") else index
+        if day != anchor.date:
+            continue
+        close = _to_float(row["Close"])
+        if close is None or not anchor.close:
+            return False
+        return abs(close - anchor.close) / abs(anchor.close) > REBASE_TOLERANCE
+    return False
+
+
+def _to_float(value) -> Optional[float]:
+    """NaN을 None으로 변환하여 float 반환"""
+    if value is None or pd.isna(value):
+        return None
+    return float(value)
+
+
+# 싱글톤 인스턴스
+history_store = HistoryStore()
@@ -0,0 +1,170 @@
+"""
+종목별 시세 조회 주기 모듈
+가장 가까운 알림 임계가까지의 거리와 최근 변동성으로 종목마다 다음 조회 시각을 정함
+"""
+
+import math
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+from app.config import settings
+
+Symbol = Tuple[str, str]
+
+# 변동성 갱신에 사용할 최대 관측 간격 (장 마감을 넘긴 가격 차이는 변동성에서 제외)
+MAX_OBSERVATION_GAP = timedelta(hours=2)
+# 변동성 하한 (1분당 0.02%, 가격 변화가 없던 종목도 무한정 미루지 않도록)
+MIN_VOLATILITY = 0.0002
+# 변동성 지수 이동 평균 가중치
+VOLATILITY_ALPHA = 0.3
+# 조회 Job 실행 시각 오차 허용
+DUE_SLACK = timedelta(seconds=30)
+
+
+@dataclass
+class PollState:
+    """종목별 조회 상태"""
+
+    last_price: Optional[float] = None
+    last_observed: Optional[datetime] = None
+    # 1분 기준 로그 수익률 표준편차 추정치 (√분 단위로 환산)
+    volatility: Optional[float] = None
+    last_checked: Optional[datetime] = None
+    next_check: Optional[datetime] = None
+
+
+class SymbolPollScheduler:
+    """
+    종목별 적응형 조회 주기 관리
+
+    - observe(): 조회한 시세로 종목 변동성(1분당) 갱신
+    - schedule(): 임계가까지 거리 d, 변동성 σ 기준 대기 시간 (d / (k·σ))² 분을 최소~최대 주기로 제한
+      (랜덤 워크 가정에서 대기 시간 동안 k 표준편차 이상 움직여야 임계가에 도달)
+    - is_due(): 다음 조회 시각이 되었는지 여부
+    """
+
+    def __init__(
+        self,
+        min_interval: timedelta,
+        default_interval: timedelta,
+        max_interval: timedelta,
+        safety: float,
+    ):
+        self.min_interval = min_interval
+        self.default_interval = default_interval
+        self.max_interval = max_interval
+        self.safety = safety
+        self._states: Dict[Symbol, PollState] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, symbol: Symbol, price: float, now: datetime):
+        """
+        조회한 시세 반영 (변동성 갱신)
+
+        Args:
+            symbol: (ticker, market)
+            price: 현재가
+            now: 조회 시각
+        """
+        with self._lock:
+            state = self._states.setdefault(symbol, PollState())
+            if state.last_price and price > 0 and state.last_observed is not None:
+                gap = now - state.last_observed
+                if timedelta(0) < gap <= MAX_OBSERVATION_GAP:
+                    minutes = gap.total_seconds() / 60
+                    move = abs(math.log(price / state.last_price)) / math.sqrt(minutes)
+                    state.volatility = (
+                        move
+                        if state.volatility is None
+                        else VOLATILITY_ALPHA * move + (1 - VOLATILITY_ALPHA) * state.volatility
+                    )
+            state.last_price = price
+            state.last_observed = now
+
+    def interval_for(self, symbol: Symbol, distance: Optional[float]) -> timedelta:
+        """
+        다음 조회까지 대기 시간 계산
+
+        Args:
+            symbol: (ticker, market)
+            distance: 가장 가까운 임계가까지 거리 (현재가 대비 비율, 임계가가 없으면 None)
+
+        Returns:
+            timedelta: 대기 시간
+        """
+        if distance is None:
+            return self.max_interval
+        if distance <= 0:
+            return self.min_interval
+
+        with self._lock:
+            state = self._states.get(symbol)
+            volatility = state.volatility if state else None
+        if volatility is None:
+            return self.default_interval
+
+        minutes = (distance / (self.safety * max(volatility, MIN_VOLATILITY))) ** 2
+        return min(max(timedelta(minutes=minutes), self.min_interval), self.max_interval)
+
+    def schedule(self, symbol: Symbol, distance: Optional[float], now: datetime) -> datetime:
+        """
+        조회 완료 처리 및 다음 조회 시각 지정
+
+        Args:
+            symbol: (ticker, market)
+            distance: 가장 가까운 임계가까지 거리 (현재가 대비 비율, 임계가가 없으면 None)
+            now: 조회 시각
+
+        Returns:
+            datetime: 다음 조회 시각
+        """
+        next_check = now + self.interval_for(symbol, distance)
+        with self._lock:
+            state = self._states.setdefault(symbol, PollState())
+            state.last_checked = now
+            state.next_check = next_check
+        return next_check
+
+    def defer(self, symbol: Symbol, now: datetime):
+        """시세 조회 실패 시 기본 주기 후 재조회"""
+        with self._lock:
+            state = self._states.setdefault(symbol, PollState())
+            state.last_checked = now
+            state.next_check = now + self.default_interval
+
+    def is_due(self, symbol: Symbol, now: datetime, max_wait: Optional[timedelta] = None) -> bool:
+        """
+        조회 시각 도달 여부
+
+        Args:
+            symbol: (ticker, market)
+            now: 기준 시각
+            max_wait: 마지막 조회 후 최대 대기 시간 (개장·폐장 부근 등 지정 시 예정 시각보다 우선)
+
+        Returns:
+            bool: 조회 필요 여부
+        """
+        with self._lock:
+            state = self._states.get(symbol)
+        if state is None or state.next_check is None:
+            return True
+        if now >= state.next_check - DUE_SLACK:
+            return True
+        return max_wait is not None and now - state.last_checked >= max_wait - DUE_SLACK
+
+    def prune(self, symbols: Iterable[Symbol]):
+        """알림이 없어진 종목 상태 제거"""
+        keep = set(symbols)
+        with self._lock:
+            for symbol in [symbol for symbol in self._states if symbol not in keep]:
+                del self._states[symbol]
+
+
+# 싱글톤 인스턴스
+poll_scheduler = SymbolPollScheduler(
+    min_interval=timedelta(minutes=settings.FINANCE_ALERT_CHECK_FAST_INTERVAL_MINUTES),
+    default_interval=timedelta(minutes=settings.FINANCE_ALERT_CHECK_INTERVAL_MINUTES),
+    max_interval=timedelta(minutes=settings.FINANCE_ALERT_CHECK_MAX_INTERVAL_MINUTES),
+    safety=settings.FINANCE_ALERT_CHECK_SAFETY_FACTOR,
+)
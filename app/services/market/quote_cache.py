@@ -0,0 +1,146 @@
+"""
+시세 캐시 모듈
+(ticker, market) 단위 시세를 메모리에 보관하여 라우터와 봇이 공유
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from app.config import settings
+from app.services.market.trading_calendar import trading_calendar
+
+
+class QuoteCache:
+    """
+    프로세스 전역 시세 캐시
+
+    - TTL 만료: 장중에는 짧게, 장 마감 후에는 길게 (단, 다음 개장 시각을 넘기지 않음)
+    - LRU 제거: 최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - 스레드 안전: 스케줄러 스레드와 요청 처리에서 동시에 접근 가능
+    """
+
+    def __init__(self, ttl: int, closed_ttl: int, max_size: int):
+        self.ttl = ttl
+        self.closed_ttl = closed_ttl
+        self.max_size = max_size
+
+        # (ticker, market) -> (만료 시각, 시세)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _expires_at(self, market: str) -> float:
+        """시장 개장 여부에 따른 만료 시각 계산"""
+        now = time.time()
+
+        if trading_calendar.is_open(market):
+            return now + self.ttl
+
+        expires_at = now + self.closed_ttl
+        next_open = trading_calendar.next_open(market)
+        if next_open is not None:
+            expires_at = min(expires_at, next_open.timestamp())
+        return expires_at
+
+    def get(self, ticker: str, market: str) -> Optional[Dict]:
+        """
+        캐시된 시세 조회
+
+        Args:
+            ticker: 종목 티커
+            market: 시장 (US / KR)
+
+        Returns:
+            Dict: 시세 정보 사본 또는 None (없거나 만료된 경우)
+        """
+        key = (ticker, market)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+
+    def peek(self, ticker: str, market: str) -> Optional[Dict]:
+        """
+        만료 여부와 관계없이 보관 중인 시세 조회 (통계 미반영)
+
+        Args:
+            ticker: 종목 티커
+            market: 시장 (US / KR)
+
+        Returns:
+            Dict: 시세 정보 사본 또는 None
+        """
+        with self._lock:
+            entry = self._entries.get((ticker, market))
+            return dict(entry[1]) if entry else None
+
+    def set(self, ticker: str, market: str, quote: Dict):
+        """
+        시세 저장
+
+        Args:
+            ticker: 종목 티커
+            market: 시장 (US / KR)
+            quote: 시세 정보
+        """
+        key = (ticker, market)
+        expires_at = self._expires_at(market)
+
+        with self._lock:
+            self._entries[key] = (expires_at, dict(quote))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, ticker: Optional[str] = None, market: Optional[str] = None):
+        """
+        캐시 무효화
+
+        Args:
+            ticker: 무효화할 종목 (None이면 전체)
+            market: 시장 (ticker와 함께 지정)
+        """
+        with self._lock:
+            if ticker is None:
+                self._entries.clear()
+            else:
+                self._entries.pop((ticker, market), None)
+
+    def get_stats(self) -> Dict:
+        """
+        캐시 통계 조회
+
+        Returns:
+            Dict: 항목 수, 적중/미적중 횟수, 적중률
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total * 100) if total else 0.0,
+                "ttl": self.ttl,
+                "closed_ttl": self.closed_ttl,
+            }
+
+
+# 싱글톤 인스턴스
+quote_cache = QuoteCache(
+    ttl=settings.QUOTE_CACHE_TTL,
+    closed_ttl=settings.QUOTE_CACHE_CLOSED_TTL,
+    max_size=settings.QUOTE_CACHE_MAX_SIZE,
+)
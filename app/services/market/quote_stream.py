@@ -0,0 +1,265 @@
+"""
+실시간 시세 스트림 모듈
+외부 시세 피드(WebSocket) 또는 로컬 재생 파일에서 체결가를 받아 등록된 처리 함수로 전달
+"""
+
+import asyncio
+import contextlib
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from app.config import settings
+
+Symbol = Tuple[str, str]
+# 시세 수신 시 호출할 함수 (tick: ticker, market, price)
+TickHandler = Callable[[Dict], Awaitable[None]]
+
+
+class QuoteSource(ABC):
+    """
+    시세 피드 어댑터 기본 클래스
+
+    stream()은 구독 종목의 시세(tick)를 순서대로 내보내며,
+    시세 외 메시지(하트비트 등)는 None을 내보내 연결이 살아 있음을 알림
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def stream(self, symbols: List[Symbol]) -> AsyncIterator[Optional[Dict]]:
+        """구독 종목 시세 수신 (하위 클래스에서 구현)"""
+
+    @staticmethod
+    def parse_tick(data) -> Optional[Dict]:
+        """
+        수신 데이터를 시세로 변환
+
+        Args:
+            data: {"ticker", "market", "price"} 형식의 dict
+
+        Returns:
+            Dict: 시세 (ticker, market, price) 또는 None (시세가 아닌 메시지)
+        """
+        if not isinstance(data, dict) or data.get("price") is None:
+            return None
+        ticker = data.get("ticker") or data.get("symbol")
+        if not ticker:
+            return None
+        try:
+            price = float(data["price"])
+        except (TypeError, ValueError):
+            return None
+        return {"ticker": str(ticker), "market": data.get("market", "US"), "price": price}
+
+
+class WebSocketQuoteSource(QuoteSource):
+    """
+    WebSocket 시세 피드 어댑터
+
+    - 연결 후 구독 메시지 전송: {"action": "subscribe", "symbols": [{"ticker", "market"}, ...]}
+    - 수신 메시지: 시세 dict 또는 시세 dict 목록 (그 외 메시지는 하트비트로 취급)
+    - 제공자별 형식이 다르면 subscribe_message() / parse_message()를 재정의
+    """
+
+    name = "websocket"
+
+    def __init__(self, url: str):
+        self.url = url
+
+    def subscribe_message(self, symbols: List[Symbol]) -> str:
+        return json.dumps(
+            {
+                "action": "subscribe",
+                "symbols": [{"ticker": ticker, "market": market} for ticker, market in symbols],
+            }
+        )
+
+    def parse_message(self, message) -> List[Dict]:
+        try:
+            data = json.loads(message)
+        except (TypeError, ValueError):
+            return []
+        items = data if isinstance(data, list) else [data]
+        return [tick for tick in map(self.parse_tick, items) if tick is not None]
+
+    async def stream(self, symbols: List[Symbol]) -> AsyncIterator[Optional[Dict]]:
+        import websockets
+
+        async with websockets.connect(self.url, ping_interval=20) as connection:
+            await connection.send(self.subscribe_message(symbols))
+            print(f"📡 시세 스트림 연결: {self.url} ({len(symbols)}개 종목)")
+            async for message in connection:
+                ticks = self.parse_message(message)
+                if not ticks:
+                    yield None
+                for tick in ticks:
+                    yield tick
+
+
+class ReplayQuoteSource(QuoteSource):
+    """
+    로컬 재생 어댑터 (테스트/점검용)
+    저장된 시세 목록 또는 JSON Lines 파일을 순서대로 재생
+    """
+
+    name = "replay"
+
+    def __init__(self, ticks: Iterable[Dict], interval: float = 0):
+        self.ticks = list(ticks)
+        self.interval = interval
+
+    @classmethod
+    def from_file(cls, path: str, interval: float = 0) -> "ReplayQuoteSource":
+        """JSON Lines 파일(한 줄에 시세 하나)에서 생성"""
+        with open(path, encoding="utf-8") as f:
+            return cls([json.loads(line) for line in f if line.strip()], interval)
+
+    async def stream(self, symbols: List[Symbol]) -> AsyncIterator[Optional[Dict]]:
+        for data in self.ticks:
+            if self.interval:
+                await asyncio.sleep(self.interval)
+            yield self.parse_tick(data)
+
+
+class QuoteStream:
+    """
+    실시간 시세 스트림 관리
+
+    - 구독 종목(symbols 함수)의 시세를 받아 on_tick으로 순서대로 전달
+    - 연결이 끊기면 지수 백오프로 재연결, 구독 종목이 바뀌면 재구독
+    - is_healthy(): 최근 STALE_SECONDS 안에 메시지를 받았는지 (아니면 주기 체크로 대체)
+    """
+
+    def __init__(self):
+        self.source: Optional[QuoteSource] = None
+        self.stale_seconds = settings.QUOTE_STREAM_STALE_SECONDS
+        self.resubscribe_interval = settings.QUOTE_STREAM_RESUBSCRIBE_SECONDS
+        self.max_backoff = settings.QUOTE_STREAM_MAX_BACKOFF_SECONDS
+
+        self._symbols: Callable[[], List[Symbol]] = list
+        self._on_tick: Optional[TickHandler] = None
+        self._future = None
+        self._connected = False
+        self._last_message = 0.0
+
+    @staticmethod
+    def source_from_settings() -> Optional[QuoteSource]:
+        """환경 설정의 시세 피드 어댑터 (설정되지 않았으면 None)"""
+        if settings.QUOTE_STREAM_SOURCE == "websocket" and settings.QUOTE_STREAM_URL:
+            return WebSocketQuoteSource(settings.QUOTE_STREAM_URL)
+        if settings.QUOTE_STREAM_SOURCE == "replay" and settings.QUOTE_STREAM_URL:
+            return ReplayQuoteSource.from_file(settings.QUOTE_STREAM_URL, interval=1)
+        return None
+
+    def is_running(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def is_healthy(self) -> bool:
+        """스트림으로 시세를 받고 있는지 여부"""
+        return (
+            self.is_running()
+            and self._connected
+            and time.monotonic() - self._last_message <= self.stale_seconds
+        )
+
+    def start(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        source: QuoteSource,
+        symbols: Callable[[], List[Symbol]],
+        on_tick: TickHandler,
+    ):
+        """
+        스트림 시작 (지정한 이벤트 루프에서 계속 실행)
+
+        Args:
+            loop: 실행할 이벤트 루프 (스케줄러 루프)
+            source: 시세 피드 어댑터
+            symbols: 현재 구독할 (ticker, market) 목록을 반환하는 함수
+            on_tick: 시세 처리 코루틴 함수
+        """
+        if self.is_running():
+            return
+        self.source = source
+        self._symbols = symbols
+        self._on_tick = on_tick
+        self._future = asyncio.run_coroutine_threadsafe(self.run(), loop)
+        print(f"✅ 실시간 시세 스트림 시작 ({source.name})")
+
+    def stop(self):
+        """스트림 종료"""
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+        self._connected = False
+
+    async def consume(self, symbols: List[Symbol]):
+        """
+        피드 연결 하나를 끝까지 소비 (연결 종료 또는 예외 시 반환)
+
+        Args:
+            symbols: 구독할 (ticker, market) 목록
+        """
+        subscribed = set(symbols)
+        try:
+            async for tick in self.source.stream(symbols):
+                self._connected = True
+                self._last_message = time.monotonic()
+                if tick is None or (tick["ticker"], tick["market"]) not in subscribed:
+                    continue
+                try:
+                    await self._on_tick(tick)
+                except Exception as e:
+                    print(f"⚠️  시세 처리 중 오류 ({tick['ticker']}): {e}")
+        finally:
+            self._connected = False
+
+    async def _consume_until_changed(self, symbols: List[Symbol]) -> bool:
+        """
+        구독 종목이 바뀔 때까지 소비
+
+        Returns:
+            bool: 구독 종목 변경으로 연결을 끊었으면 True, 연결이 종료되었으면 False
+        """
+        task = asyncio.ensure_future(self.consume(symbols))
+        try:
+            while True:
+                done, _ = await asyncio.wait({task}, timeout=self.resubscribe_interval)
+                if done:
+                    task.result()
+                    return False
+                if set(self._symbols()) != set(symbols):
+                    print("🔁 가격 알림 종목 변경, 시세 스트림 재구독")
+                    return True
+        finally:
+            if not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+    async def run(self):
+        """연결 유지 루프 (재연결/재구독 포함)"""
+        failures = 0
+        while True:
+            symbols = self._symbols()
+            if not symbols:
+                # 알림이 없으면 연결하지 않고 대기
+                await asyncio.sleep(self.resubscribe_interval)
+                continue
+
+            started = time.monotonic()
+            try:
+                if await self._consume_until_changed(symbols):
+                    continue
+                print("⚠️  시세 스트림 연결 종료")
+            except Exception as e:
+                print(f"❌ 시세 스트림 오류: {e}")
+
+            # 오래 유지된 연결이었다면 백오프 초기화
+            failures = 0 if time.monotonic() - started > self.max_backoff else failures + 1
+            await asyncio.sleep(min(2 ** failures, self.max_backoff))
+
+
+# 싱글톤 인스턴스
+quote_stream = QuoteStream()
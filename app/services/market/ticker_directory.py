@@ -0,0 +1,522 @@
+"""
+종목 디렉터리 모듈
+종목 코드/이름 목록을 메모리에 색인하여 네트워크 조회 없이 즉시 검색
+"""
+
+import bisect
+import csv
+import json
+import os
+import threading
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+from typing import Dict, List, Optional, Set, Tuple
+from pykrx import stock
+from pykrx.website import krx
+from app.config import settings
+from app.services.market.trading_calendar import trading_calendar
+
+# 한글 초성 (유니코드 음절 순서)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_START = 0xAC00
+HANGUL_END = 0xD7A3
+
+# 검색 결과 순위 (낮을수록 우선)
+RANK_EXACT_CODE = 0
+RANK_EXACT_NAME = 1
+RANK_CODE_PREFIX = 2
+RANK_NAME_PREFIX = 3
+RANK_SUBSTRING = 4
+RANK_CHOSEONG = 5
+
+
+def to_choseong(text: str) -> str:
+    """
+    문자열의 한글 음절을 초성으로 변환 (그 외 문자는 소문자로 유지)
+
+    Example:
+        "삼성전자" -> "ㅅㅅㅈㅈ"
+    """
+    result = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_START <= code <= HANGUL_END:
+            result.append(CHOSEONG[(code - HANGUL_START) // 588])
+        else:
+            result.append(char.lower())
+    return "".join(result)
+
+
+def is_choseong_query(text: str) -> bool:
+    """초성으로만 구성된 검색어인지 확인"""
+    return bool(text) and all(char in CHOSEONG for char in text)
+
+
+@dataclass(frozen=True)
+class TickerIndex:
+    """
+    종목 색인 스냅샷 (생성 후 변경하지 않음)
+
+    재구성 시 새 스냅샷을 만들어 참조 하나만 교체하므로,
+    검색 중 재구성이 일어나도 한 검색은 항상 같은 스냅샷만 읽음
+    """
+
+    entries: Tuple[Tuple[str, str], ...] = ()
+    codes: Tuple[Tuple[str, int], ...] = ()
+    names: Tuple[Tuple[str, int], ...] = ()
+    grams: Dict[str, Set[int]] = field(default_factory=dict)
+    choseong: Tuple[str, ...] = ()
+    # 3-gram 역색인 (퍼지 검색을 지원하는 디렉터리만 사용)
+    trigrams: Dict[str, Set[int]] = field(default_factory=dict)
+
+
+class TickerDirectory:
+    """
+    종목 디렉터리 색인
+
+    - 코드/이름 접두어: 정렬 목록 + 이진 탐색
+    - 부분 문자열: 1~2글자 n-gram 역색인으로 후보를 좁힌 뒤 확인
+    - 초성: 이름을 초성 문자열로 변환하여 비교
+    - 색인은 TickerIndex 스냅샷 단위로 교체 (검색은 잠금 없이 스냅샷 참조)
+    """
+
+    def __init__(self, market: str, path: Optional[str] = None):
+        self.market = market
+        self.path = path
+        self._index = TickerIndex()
+
+    @property
+    def entries(self) -> Tuple[Tuple[str, str], ...]:
+        """현재 색인의 (종목 코드, 종목명) 목록"""
+        return self._index.entries
+
+    def build(self, entries: List[Tuple[str, str]]):
+        """
+        색인 생성 (새 스냅샷을 만든 뒤 한 번에 교체)
+
+        Args:
+            entries: (종목 코드, 종목명) 목록
+        """
+        self._index = self._build_index(entries)
+
+    def _build_index(self, entries: List[Tuple[str, str]]) -> TickerIndex:
+        """색인 스냅샷 생성"""
+        entries = [(code, name) for code, name in entries if code and name]
+
+        codes = []
+        names = []
+        grams: Dict[str, Set[int]] = {}
+        choseong = []
+
+        for idx, (code, name) in enumerate(entries):
+            code_key = code.upper()
+            name_key = name.lower()
+            codes.append((code_key, idx))
+            names.append((name_key, idx))
+            choseong.append(to_choseong(name))
+
+            for text in (code_key.lower(), name_key):
+                for gram in self._ngrams(text):
+                    grams.setdefault(gram, set()).add(idx)
+
+        codes.sort()
+        names.sort()
+
+        return TickerIndex(
+            entries=tuple(entries),
+            codes=tuple(codes),
+            names=tuple(names),
+            grams=grams,
+            choseong=tuple(choseong),
+        )
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def _ngrams(text: str) -> Set[str]:
+        """1글자 및 2글자 n-gram 생성"""
+        grams = set(text)
+        grams.update(text[i:i + 2] for i in range(len(text) - 1))
+        return grams
+
+    @staticmethod
+    def _prefix_range(keys: Tuple[Tuple[str, int], ...], prefix: str) -> List[int]:
+        """정렬 목록에서 접두어가 일치하는 항목 인덱스 조회"""
+        start = bisect.bisect_left(keys, (prefix, -1))
+        matches = []
+        for key, idx in keys[start:]:
+            if not key.startswith(prefix):
+                break
+            matches.append(idx)
+        return matches
+
+    @staticmethod
+    def _substring_candidates(index: TickerIndex, query: str) -> Set[int]:
+        """n-gram 역색인으로 부분 문자열 후보 조회"""
+        if len(query) < 2:
+            grams = {query}
+        else:
+            grams = {query[i:i + 2] for i in range(len(query) - 1)}
+
+        candidates: Optional[Set[int]] = None
+        for gram in sorted(grams, key=lambda g: len(index.grams.get(g, ()))):
+            postings = index.grams.get(gram)
+            if not postings:
+                return set()
+            candidates = set(postings) if candidates is None else candidates & postings
+            if not candidates:
+                return set()
+        return candidates or set()
+
+    def search(self, keyword: str, limit: int = 20) -> List[Dict]:
+        """
+        종목 검색 (코드/이름 접두어, 부분 문자열, 초성)
+
+        Args:
+            keyword: 검색 키워드
+            limit: 최대 결과 수
+
+        Returns:
+            List[Dict]: 순위순 검색 결과
+        """
+        return self._search(self._index, keyword, limit)
+
+    def _search(self, index: TickerIndex, keyword: str, limit: int) -> List[Dict]:
+        """색인 스냅샷 하나로 검색"""
+        query = keyword.strip()
+        if not query or not index.entries:
+            return []
+
+        code_query = query.upper()
+        name_query = query.lower()
+        entries = index.entries
+        ranks: Dict[int, int] = {}
+
+        def add(idx: int, rank: int):
+            if idx not in ranks or rank < ranks[idx]:
+                ranks[idx] = rank
+
+        for idx in self._prefix_range(index.codes, code_query):
+            exact = entries[idx][0].upper() == code_query
+            add(idx, RANK_EXACT_CODE if exact else RANK_CODE_PREFIX)
+
+        for idx in self._prefix_range(index.names, name_query):
+            exact = entries[idx][1].lower() == name_query
+            add(idx, RANK_EXACT_NAME if exact else RANK_NAME_PREFIX)
+
+        for idx in self._substring_candidates(index, name_query):
+            code, name = entries[idx]
+            if name_query in name.lower() or name_query in code.lower():
+                add(idx, RANK_SUBSTRING)
+
+        if is_choseong_query(query):
+            for idx, initials in enumerate(index.choseong):
+                if query in initials:
+                    add(idx, RANK_CHOSEONG)
+
+        ordered = sorted(
+            ranks.items(),
+            key=lambda item: (item[1], len(entries[item[0]][1]), entries[item[0]][0]),
+        )
+
+        return [
+            {
+                "ticker": entries[idx][0],
+                "name": entries[idx][1],
+                "market": self.market,
+            }
+            for idx, _ in ordered[:limit]
+        ]
+
+    def _read_file(self) -> Optional[Dict]:
+        """저장된 종목 목록 파일 읽기"""
+        if not self.path or not os.path.exists(self.path):
+            return None
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  {self.market} 종목 파일 읽기 실패: {e}")
+            return None
+
+    def _write_file(self, data: Dict):
+        """종목 목록 파일 저장 (임시 파일 작성 후 교체)"""
+        if not self.path:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️  {self.market} 종목 파일 저장 실패: {e}")
+
+
+class KRTickerDirectory(TickerDirectory):
+    """
+    한국 종목 디렉터리
+    거래일마다 1회 pykrx에서 전체 종목을 조회하고 로컬 파일에 저장
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__("KR", path or os.path.join(settings.DATA_DIR, "kr_tickers.json"))
+        self.loaded_for: Optional[date] = None
+        self._lock = threading.Lock()
+
+    def ensure_loaded(self):
+        """현재 거래일 기준 디렉터리가 없으면 파일 또는 pykrx에서 로드"""
+        session_date = trading_calendar.last_session_date("KR")
+        if self.entries and self.loaded_for == session_date:
+            return
+
+        with self._lock:
+            if self.entries and self.loaded_for == session_date:
+                return
+
+            saved = self._read_file() or {}
+            saved_date = date.fromisoformat(saved["date"]) if saved.get("date") else None
+            saved_entries = [tuple(entry) for entry in saved.get("entries", [])]
+            if saved_entries and saved_date == session_date:
+                self.build(saved_entries)
+                self.loaded_for = saved_date
+                print(f"📂 KR 종목 디렉터리 로드: {len(self)}개 ({saved_date})")
+                return
+
+            try:
+                entries = self._download()
+            except Exception as e:
+                print(f"⚠️  KR 종목 목록 조회 실패: {e}")
+                entries = []
+
+            if entries:
+                self.build(entries)
+                self.loaded_for = session_date
+                self._write_file({
+                    "date": session_date.isoformat() if session_date else None,
+                    "entries": [list(entry) for entry in entries],
+                })
+                print(f"📥 KR 종목 디렉터리 갱신: {len(self)}개 ({session_date})")
+            elif saved_entries or self.entries:
+                # 조회 실패 시 이전 목록을 당일 동안 사용 (다음 거래일에 재시도)
+                if not self.entries:
+                    self.build(saved_entries)
+                self.loaded_for = session_date
+
+    def search(self, keyword: str, limit: int = 20) -> List[Dict]:
+        self.ensure_loaded()
+        return super().search(keyword, limit)
+
+    def _download(self) -> List[Tuple[str, str]]:
+        """pykrx 전체 종목 코드/이름 조회 (코드-이름 목록을 요청 1회로 조회)"""
+        session_date = trading_calendar.last_session_date("KR")
+        day = session_date.strftime("%Y%m%d") if session_date else stock.get_nearest_business_day_in_a_week()
+        names = krx.get_market_ticker_and_name(day, "ALL")
+        return [(str(code), str(name)) for code, name in names.items()]
+
+
+class USTickerDirectory(TickerDirectory):
+    """
+    미국 종목 디렉터리
+    종목 목록 파일(NASDAQ Trader 파이프 구분 또는 CSV)을 가져와 로컬에 저장하고,
+    접두어/부분 문자열 외에 3-gram 유사도 기반 퍼지 검색 지원
+    """
+
+    # 퍼지 검색 최소 유사도 (검색어 3-gram 중 일치 비율)
+    FUZZY_THRESHOLD = 0.5
+
+    # 종목 목록 파일 헤더 후보 (소문자)
+    SYMBOL_COLUMNS = ("symbol", "act symbol", "ticker", "nasdaq symbol")
+    NAME_COLUMNS = ("security name", "name", "company name", "company")
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__("US", path or os.path.join(settings.DATA_DIR, "us_tickers.json"))
+        self.imported_at: Optional[str] = None
+        self.source: Optional[str] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _build_index(self, entries: List[Tuple[str, str]]) -> TickerIndex:
+        index = super()._build_index(entries)
+
+        trigrams: Dict[str, Set[int]] = {}
+        for idx, (code, name) in enumerate(index.entries):
+            for text in (code.lower(), name.lower()):
+                for gram in self._trigrams_of(text):
+                    trigrams.setdefault(gram, set()).add(idx)
+        return replace(index, trigrams=trigrams)
+
+    @staticmethod
+    def _trigrams_of(text: str) -> Set[str]:
+        """단어 경계를 포함한 3-gram 생성"""
+        padded = f"  {text.strip()} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def ensure_loaded(self):
+        """저장된 디렉터리 로드 (없으면 설정된 가져오기 파일 사용)"""
+        if self._loaded:
+            return
+
+        with self._lock:
+            if self._loaded:
+                return
+
+            saved = self._read_file()
+            if saved and saved.get("entries"):
+                self.build([tuple(entry) for entry in saved["entries"]])
+                self.imported_at = saved.get("imported_at")
+                self.source = saved.get("source")
+                print(f"📂 US 종목 디렉터리 로드: {len(self)}개 ({self.imported_at})")
+            elif settings.US_TICKER_IMPORT_FILE and os.path.exists(settings.US_TICKER_IMPORT_FILE):
+                self._import_locked(settings.US_TICKER_IMPORT_FILE)
+
+            self._loaded = True
+
+    def import_file(self, file_path: str) -> int:
+        """
+        종목 목록 파일 가져오기
+
+        Args:
+            file_path: 종목 목록 파일 경로
+
+        Returns:
+            int: 가져온 종목 수
+        """
+        with self._lock:
+            count = self._import_locked(file_path)
+            self._loaded = True
+            return count
+
+    def import_text(self, text: str, source: Optional[str] = None) -> int:
+        """
+        종목 목록 텍스트 가져오기 (업로드 파일 등)
+
+        Args:
+            text: 종목 목록 파일 내용
+            source: 출처 표시용 이름
+
+        Returns:
+            int: 가져온 종목 수
+        """
+        entries = self.parse_listing(text)
+        if not entries:
+            return 0
+
+        with self._lock:
+            self._replace(entries, source)
+            self._loaded = True
+        return len(entries)
+
+    def _import_locked(self, file_path: str) -> int:
+        """파일 읽기 후 디렉터리 교체 (잠금 보유 상태에서 호출)"""
+        try:
+            with open(file_path, encoding="utf-8-sig") as f:
+                entries = self.parse_listing(f.read())
+        except OSError as e:
+            print(f"⚠️  US 종목 목록 파일 읽기 실패: {e}")
+            return 0
+
+        if entries:
+            self._replace(entries, os.path.basename(file_path))
+        return len(entries)
+
+    def _replace(self, entries: List[Tuple[str, str]], source: Optional[str]):
+        """디렉터리 교체 및 저장"""
+        self.build(entries)
+        self.imported_at = datetime.now(ZoneInfo("Asia/Seoul")).isoformat()
+        self.source = source
+        self._write_file({
+            "imported_at": self.imported_at,
+            "source": source,
+            "entries": [list(entry) for entry in self.entries],
+        })
+        print(f"📥 US 종목 디렉터리 가져오기: {len(self)}개 ({source})")
+
+    @classmethod
+    def parse_listing(cls, text: str) -> List[Tuple[str, str]]:
+        """
+        종목 목록 파싱
+
+        지원 형식:
+            - NASDAQ Trader nasdaqlisted.txt / otherlisted.txt (| 구분)
+            - symbol, name 헤더를 가진 CSV
+
+        Returns:
+            List[Tuple[str, str]]: (티커, 종목명) 목록 (Yahoo 표기: BRK.B -> BRK-B)
+        """
+        lines = [line for line in text.splitlines() if line.strip()]
+        if not lines:
+            return []
+
+        delimiter = "|" if "|" in lines[0] else ","
+        reader = csv.DictReader(lines, delimiter=delimiter)
+        columns = {(name or "").strip().lower(): name for name in reader.fieldnames or []}
+
+        symbol_column = next((columns[c] for c in cls.SYMBOL_COLUMNS if c in columns), None)
+        name_column = next((columns[c] for c in cls.NAME_COLUMNS if c in columns), None)
+        test_column = columns.get("test issue")
+        if not symbol_column or not name_column:
+            print("⚠️  US 종목 목록 형식 오류: symbol/name 컬럼 없음")
+            return []
+
+        entries: Dict[str, str] = {}
+        for row in reader:
+            symbol = (row.get(symbol_column) or "").strip().upper()
+            name = (row.get(name_column) or "").strip()
+
+            # NASDAQ Trader 파일 마지막 줄 (File Creation Time) 및 테스트 종목 제외
+            if not symbol or not name or symbol.startswith("FILE CREATION TIME"):
+                continue
+            if test_column and (row.get(test_column) or "").strip().upper() == "Y":
+                continue
+
+            symbol = symbol.replace(".", "-").replace("/", "-")
+            # "Apple Inc. - Common Stock" -> "Apple Inc."
+            name = name.split(" - ")[0].strip()
+            entries.setdefault(symbol, name)
+
+        return list(entries.items())
+
+    def search(self, keyword: str, limit: int = 20) -> List[Dict]:
+        self.ensure_loaded()
+        # 접두어 검색과 퍼지 검색이 같은 스냅샷을 사용하도록 한 번만 참조
+        index = self._index
+        results = self._search(index, keyword, limit)
+
+        query = keyword.strip().lower()
+        if len(results) >= limit or len(query) < 3:
+            return results
+
+        # 접두어/부분 문자열 결과가 부족하면 3-gram 유사도로 보충 (오타 대응)
+        entries = index.entries
+        query_grams = self._trigrams_of(query)
+        scores: Dict[int, int] = {}
+        for gram in query_grams:
+            for idx in index.trigrams.get(gram, ()):
+                scores[idx] = scores.get(idx, 0) + 1
+
+        found = {result["ticker"] for result in results}
+        fuzzy = [
+            (count / len(query_grams), idx)
+            for idx, count in scores.items()
+            if count / len(query_grams) >= self.FUZZY_THRESHOLD
+            and entries[idx][0] not in found
+        ]
+        fuzzy.sort(key=lambda item: (-item[0], len(entries[item[1]][1]), entries[item[1]][0]))
+
+        for _, idx in fuzzy[: limit - len(results)]:
+            results.append({
+                "ticker": entries[idx][0],
+                "name": entries[idx][1],
+                "market": self.market,
+            })
+        return results
+
+
+# 싱글톤 인스턴스
+kr_ticker_directory = KRTickerDirectory()
+us_ticker_directory = USTickerDirectory()
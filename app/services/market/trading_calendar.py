@@ -0,0 +1,346 @@
+"""
+거래 시간 관리 모듈
+한국(KRX) / 미국(NYSE) 정규장 개장 여부 판단 (휴장일, 조기 폐장/지연 개장 포함)
+"""
+
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+from typing import Dict, FrozenSet, Optional, Tuple
+from app.config import settings
+
+# KRX 휴장일 (음력 명절, 대체공휴일, 선거일 등 계산할 수 없는 날짜 포함, 매년 추가 필요)
+# 목록에 없는 연도는 양력 고정 공휴일만 적용, 임시 휴장은 KRX_EXTRA_HOLIDAYS로 추가
+KRX_HOLIDAYS: Dict[int, Tuple[str, ...]] = {
+    2024: (
+        "2024-01-01", "2024-02-09", "2024-02-12", "2024-03-01", "2024-04-10",
+        "2024-05-01", "2024-05-06", "2024-05-15", "2024-06-06", "2024-08-15",
+        "2024-09-16", "2024-09-17", "2024-09-18", "2024-10-01", "2024-10-03",
+        "2024-10-09", "2024-12-25", "2024-12-31",
+    ),
+    2025: (
+        "2025-01-01", "2025-01-27", "2025-01-28", "2025-01-29", "2025-01-30",
+        "2025-03-03", "2025-05-01", "2025-05-05", "2025-05-06", "2025-06-03",
+        "2025-06-06", "2025-08-15", "2025-10-03", "2025-10-06", "2025-10-07",
+        "2025-10-08", "2025-10-09", "2025-12-25", "2025-12-31",
+    ),
+    2026: (
+        "2026-01-01", "2026-02-16", "2026-02-17", "2026-02-18", "2026-03-02",
+        "2026-05-01", "2026-05-05", "2026-05-25", "2026-06-03", "2026-08-17",
+        "2026-09-24", "2026-09-25", "2026-10-05", "2026-10-09", "2026-12-25",
+        "2026-12-31",
+    ),
+    2027: (
+        "2027-01-01", "2027-02-08", "2027-02-09", "2027-03-01", "2027-05-05",
+        "2027-05-13", "2027-08-16", "2027-09-14", "2027-09-15", "2027-09-16",
+        "2027-10-04", "2027-10-11", "2027-12-27", "2027-12-31",
+    ),
+}
+
+# KRX 양력 고정 휴장일 (월, 일): 신정, 삼일절, 근로자의 날, 어린이날, 현충일, 광복절, 개천절, 한글날, 성탄절, 연말 휴장일
+KRX_FIXED_HOLIDAYS = (
+    (1, 1), (3, 1), (5, 1), (5, 5), (6, 6), (8, 15), (10, 3), (10, 9), (12, 25), (12, 31),
+)
+
+# 대학수학능력시험일 (KRX 10:00 개장, 16:30 폐장)
+KRX_CSAT_DAYS = ("2024-11-14", "2025-11-13", "2026-11-19")
+
+
+def _parse_dates(values) -> FrozenSet[date]:
+    return frozenset(date.fromisoformat(value.strip()) for value in values if value.strip())
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """해당 월의 n번째 요일 (n=-1이면 마지막 요일)"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = (date(year, month + 1, 1) if month < 12 else date(year + 1, 1, 1)) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """부활절 날짜 (그레고리력, Anonymous Gregorian algorithm)"""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    weekday_shift = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * weekday_shift) // 451
+    month, day = divmod(h + weekday_shift - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> date:
+    """NYSE 공휴일 대체 규칙 (토요일 → 금요일, 일요일 → 월요일)"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=32)
+def nyse_holidays(year: int) -> FrozenSet[date]:
+    """
+    NYSE 휴장일 계산
+
+    Args:
+        year: 연도
+
+    Returns:
+        FrozenSet[date]: 해당 연도 휴장일
+    """
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving Day
+        _observed(date(year, 12, 25)),  # Christmas Day
+    }
+    # 신정이 토요일이면 전년도 12/31로 대체하지 않음
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    return frozenset(holidays)
+
+
+@lru_cache(maxsize=32)
+def nyse_half_days(year: int) -> FrozenSet[date]:
+    """
+    NYSE 조기 폐장일 (13:00 폐장) 계산
+    독립기념일 전날, 추수감사절 다음 날, 크리스마스 이브 (평일이고 휴장일이 아닌 경우)
+    """
+    holidays = nyse_holidays(year)
+    candidates = (
+        date(year, 7, 3),
+        _nth_weekday(year, 11, 3, 4) + timedelta(days=1),
+        date(year, 12, 24),
+    )
+    return frozenset(day for day in candidates if day.weekday() < 5 and day not in holidays)
+
+
+@lru_cache(maxsize=32)
+def krx_holidays(year: int) -> FrozenSet[date]:
+    """
+    KRX 휴장일
+
+    Args:
+        year: 연도
+
+    Returns:
+        FrozenSet[date]: 해당 연도 휴장일 (등록된 목록 + 양력 고정 휴장일)
+    """
+    fixed = {date(year, month, day) for month, day in KRX_FIXED_HOLIDAYS}
+    return frozenset(fixed | _parse_dates(KRX_HOLIDAYS.get(year, ())))
+
+
+class TradingCalendar:
+    """시장별 정규장 시간 관리"""
+
+    def __init__(self):
+        # 시장별 시간대 및 정규장 시간
+        self.sessions: Dict[str, Dict] = {
+            "KR": {
+                "timezone": ZoneInfo("Asia/Seoul"),
+                "open": time(9, 0),
+                "close": time(15, 30),
+            },
+            "US": {
+                "timezone": ZoneInfo("America/New_York"),
+                "open": time(9, 30),
+                "close": time(16, 0),
+            },
+        }
+        # 임시 휴장일 (환경 설정)
+        self.extra_holidays: Dict[str, FrozenSet[date]] = {
+            "KR": _parse_dates(settings.KRX_EXTRA_HOLIDAYS.split(",")),
+            "US": _parse_dates(settings.NYSE_EXTRA_HOLIDAYS.split(",")),
+        }
+        self.krx_csat_days = _parse_dates(KRX_CSAT_DAYS)
+
+    def local_now(self, market: str, now: Optional[datetime] = None) -> datetime:
+        """
+        시장 현지 시간으로 변환
+
+        Args:
+            market: 시장 (US / KR)
+            now: 기준 시간 (기본: 현재 시간, timezone 없으면 KST로 간주)
+
+        Returns:
+            datetime: 시장 현지 시간
+        """
+        tz = self.sessions[market]["timezone"]
+        if now is None:
+            return datetime.now(tz)
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=ZoneInfo("Asia/Seoul"))
+        return now.astimezone(tz)
+
+    def is_holiday(self, market: str, day: date) -> bool:
+        """
+        휴장일 여부 확인 (주말 제외한 공휴일/임시 휴장일)
+
+        Args:
+            market: 시장 (US / KR)
+            day: 확인할 날짜 (시장 현지 날짜)
+
+        Returns:
+            bool: 휴장일 여부
+        """
+        if day in self.extra_holidays.get(market, ()):
+            return True
+        if market == "KR":
+            return day in krx_holidays(day.year)
+        if market == "US":
+            return day in nyse_holidays(day.year)
+        return False
+
+    def is_trading_day(self, market: str, day) -> bool:
+        """
+        거래일 여부 확인 (주말, 휴장일 제외)
+
+        Args:
+            market: 시장 (US / KR)
+            day: 확인할 날짜 (date)
+
+        Returns:
+            bool: 거래일 여부
+        """
+        return day.weekday() < 5 and not self.is_holiday(market, day)
+
+    def session_hours(self, market: str, day: date) -> Optional[Tuple[datetime, datetime]]:
+        """
+        특정 날짜의 정규장 시간 조회
+
+        - KRX: 연초 첫 거래일 10:00 개장, 수능일 10:00 개장 / 16:30 폐장
+        - NYSE: 조기 폐장일 13:00 폐장
+
+        Args:
+            market: 시장 (US / KR)
+            day: 조회할 날짜 (시장 현지 날짜)
+
+        Returns:
+            Tuple[datetime, datetime]: (개장, 폐장) 시장 현지 시간 또는 None (휴장일)
+        """
+        if market not in self.sessions or not self.is_trading_day(market, day):
+            return None
+
+        session = self.sessions[market]
+        open_time, close_time = session["open"], session["close"]
+
+        if market == "KR":
+            first_day = date(day.year, 1, 2)
+            while not self.is_trading_day(market, first_day):
+                first_day += timedelta(days=1)
+            if day == first_day:
+                open_time = time(10, 0)
+            if day in self.krx_csat_days:
+                open_time, close_time = time(10, 0), time(16, 30)
+        elif market == "US" and day in nyse_half_days(day.year):
+            close_time = time(13, 0)
+
+        tz = session["timezone"]
+        return (
+            datetime.combine(day, open_time, tzinfo=tz),
+            datetime.combine(day, close_time, tzinfo=tz),
+        )
+
+    def current_session(
+        self, market: str, now: Optional[datetime] = None
+    ) -> Optional[Tuple[datetime, datetime]]:
+        """
+        진행 중인 정규장 시간 조회
+
+        Args:
+            market: 시장 (US / KR)
+            now: 기준 시간 (기본: 현재 시간)
+
+        Returns:
+            Tuple[datetime, datetime]: (개장, 폐장) 시장 현지 시간 또는 None (장이 열려 있지 않음)
+        """
+        if market not in self.sessions:
+            return None
+
+        local_now = self.local_now(market, now)
+        hours = self.session_hours(market, local_now.date())
+        if hours is not None and hours[0] <= local_now < hours[1]:
+            return hours
+        return None
+
+    def is_open(self, market: str, now: Optional[datetime] = None) -> bool:
+        """
+        정규장 개장 여부 확인
+
+        Args:
+            market: 시장 (US / KR)
+            now: 기준 시간 (기본: 현재 시간)
+
+        Returns:
+            bool: 개장 여부 (지원하지 않는 시장은 False)
+        """
+        return self.current_session(market, now) is not None
+
+    def last_session_date(self, market: str, now: Optional[datetime] = None) -> Optional[date]:
+        """
+        가장 최근에 개장한 정규장 날짜 조회
+        (오늘이 거래일이고 개장 시각이 지났으면 오늘, 아니면 직전 거래일)
+
+        Args:
+            market: 시장 (US / KR)
+            now: 기준 시간 (기본: 현재 시간)
+
+        Returns:
+            date: 최근 정규장 날짜 (시장 현지 날짜) 또는 None
+        """
+        if market not in self.sessions:
+            return None
+
+        local_now = self.local_now(market, now)
+        day = local_now.date()
+
+        hours = self.session_hours(market, day)
+        if hours is not None and local_now >= hours[0]:
+            return day
+
+        # 최대 2주 이전까지 탐색 (연휴 대응)
+        for offset in range(1, 15):
+            previous_day = day - timedelta(days=offset)
+            if self.is_trading_day(market, previous_day):
+                return previous_day
+
+        return None
+
+    def next_open(self, market: str, now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        다음 정규장 개장 시간 조회
+
+        Args:
+            market: 시장 (US / KR)
+            now: 기준 시간 (기본: 현재 시간)
+
+        Returns:
+            datetime: 다음 개장 시간 (시장 현지 시간) 또는 None
+        """
+        if market not in self.sessions:
+            return None
+
+        local_now = self.local_now(market, now)
+
+        # 최대 2주 이내에서 탐색 (연휴 대응)
+        for offset in range(15):
+            hours = self.session_hours(market, local_now.date() + timedelta(days=offset))
+            if hours is not None and hours[0] > local_now:
+                return hours[0]
+
+        return None
+
+
+# 싱글톤 인스턴스
+trading_calendar = TradingCalendar()
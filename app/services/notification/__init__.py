@@ -8,10 +8,12 @@ from app.services.notification.notification_service import (
 )
 from app.services.notification.kakao_sender import kakao_sender
 from app.services.notification.telegram_sender import telegram_sender
+from app.services.notification.outbox import notification_outbox
 
 __all__ = [
     "notification_service",
     "NotificationResult",
     "kakao_sender",
     "telegram_sender",
+    "notification_outbox",
 ]
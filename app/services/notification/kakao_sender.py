@@ -4,8 +4,12 @@ KakaoAuthService를 활용한 메시지 발송 전용 클래스
 """
 
 from typing import Optional
+from app.config import settings
 from app.models import User
-from app.services.auth.kakao_auth import kakao_auth_service
+from app.services.auth.kakao_auth import kakao_auth_service, KakaoUnauthorizedError
+from app.services.auth.kakao_token_manager import kakao_token_manager
+from app.services.http_client import RateLimitedError
+from app.services.notification.rate_limiter import rate_limiter
 
 
 class KakaoSender:
@@ -13,6 +17,7 @@ class KakaoSender:
 
     def __init__(self):
         self.kakao_auth = kakao_auth_service
+        self.token_manager = kakao_token_manager
 
     async def send_message(self, user: User, message: str) -> bool:
         """
@@ -26,15 +31,34 @@ class KakaoSender:
             bool: 발송 성공 여부
         """
         try:
-            # 토큰이 없으면 발송 불가
-            if not user.kakao_access_token:
+            # 캐시된 토큰 사용 (만료 임박 시 자동 갱신)
+            access_token = await self.token_manager.get_access_token(user)
+            if not access_token:
                 print("❌ 카카오톡 토큰이 없습니다")
                 return False
 
             # 카카오톡 메시지 발송
-            await self.kakao_auth.send_message_to_me(
-                user.kakao_access_token, message
-            )
+            # - 401 응답 시 토큰 갱신 후 1회 재발송
+            # - 429 응답 시 retry_after만큼 대기 후 1회 재발송
+            refreshed = False
+            rate_limited = False
+            while True:
+                try:
+                    await self.kakao_auth.send_message_to_me(access_token, message)
+                    break
+                except KakaoUnauthorizedError:
+                    if refreshed:
+                        raise
+                    refreshed = True
+                    access_token = await self.token_manager.refresh(
+                        user.user_id, stale_token=access_token
+                    )
+                except RateLimitedError as e:
+                    rate_limiter.block("kakao", self.rate_limit_key(user), e.retry_after)
+                    if rate_limited or e.retry_after > settings.RATE_LIMIT_MAX_RETRY_AFTER:
+                        raise
+                    rate_limited = True
+                    await rate_limiter.acquire("kakao", self.rate_limit_key(user))
 
             print(f"✅ 카카오톡 메시지 발송 성공 (user_id: {user.user_id})")
             return True
@@ -43,6 +67,10 @@ class KakaoSender:
             print(f"❌ 카카오톡 메시지 발송 실패: {e}")
             return False
 
+    def rate_limit_key(self, user: User) -> str:
+        """발송 속도 제한용 채팅방 식별자"""
+        return str(user.user_id)
+
     def is_available(self, user: User) -> bool:
         """
         카카오톡 발송 가능 여부 확인
@@ -3,11 +3,20 @@
 연동된 모든 채널로 메시지를 자동 발송
 """
 
+import asyncio
 from typing import Dict, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from app.config import settings
 from app.models import User
 from app.services.notification.kakao_sender import kakao_sender
 from app.services.notification.telegram_sender import telegram_sender
+from app.services.notification.rate_limiter import rate_limiter
+
+# 채널 표시 이름
+CHANNEL_DISPLAY_NAMES = {
+    "kakao": "카카오톡",
+    "telegram": "텔레그램",
+}
 
 
 @dataclass
@@ -19,22 +28,36 @@ class NotificationResult:
     telegram_sent: bool  # 텔레그램 발송 성공 여부
     failed_channels: List[str]  # 실패한 채널 목록
     message: str  # 결과 메시지
+    channel_results: Dict[str, bool] = field(default_factory=dict)  # 채널별 발송 성공 여부
 
 
 class NotificationService:
     """
     알림 발송 통합 서비스
 
-    사용자에게 연동된 모든 채널(카카오톡, 텔레그램)로 메시지를 발송합니다.
+    사용자에게 연동된 모든 채널(카카오톡, 텔레그램)로 메시지를 동시에 발송합니다.
+    채널별 제한 시간이 있어 느린 채널이 다른 채널 발송을 지연시키지 않습니다.
     """
 
     def __init__(self):
         self.kakao_sender = kakao_sender
         self.telegram_sender = telegram_sender
+        self.channel_timeout = settings.NOTIFICATION_CHANNEL_TIMEOUT
+
+    @property
+    def channels(self) -> Dict[str, object]:
+        """
+        발송 채널 목록 (채널명 -> 발송 객체)
+        발송 객체는 is_available(user), send_message(user, message)를 제공
+        """
+        channels = {"kakao": self.kakao_sender}
+        if self.telegram_sender:
+            channels["telegram"] = self.telegram_sender
+        return channels
 
     async def send(self, user: User, message: str) -> NotificationResult:
         """
-        연동된 모든 채널로 메시지 발송
+        연동된 모든 채널로 메시지 동시 발송
 
         Args:
             user: 사용자 객체
@@ -43,35 +66,31 @@ class NotificationService:
         Returns:
             NotificationResult: 발송 결과
         """
-        kakao_sent = False
-        telegram_sent = False
-        failed_channels = []
-
-        # 카카오톡 발송
-        if self.kakao_sender.is_available(user):
-            kakao_sent = await self.kakao_sender.send_message(user, message)
-            if not kakao_sent:
-                failed_channels.append("kakao")
-
-        # 텔레그램 발송
-        if self.telegram_sender and self.telegram_sender.is_available(user):
-            telegram_sent = await self.telegram_sender.send_message(user, message)
-            if not telegram_sent:
-                failed_channels.append("telegram")
-
-        # 결과 생성
-        success = kakao_sent or telegram_sent
-        result_message = self._generate_result_message(
-            kakao_sent, telegram_sent, failed_channels
-        )
+        channels = self.get_available_channels(user)
 
-        return NotificationResult(
-            success=success,
-            kakao_sent=kakao_sent,
-            telegram_sent=telegram_sent,
-            failed_channels=failed_channels,
-            message=result_message,
+        sent = await asyncio.gather(
+            *[self._send_with_timeout(channel, user, message) for channel in channels]
         )
+        channel_results = dict(zip(channels, sent))
+
+        return self.build_result(channel_results)
+
+    async def send_to_channel(self, user: User, message: str, channel: str) -> bool:
+        """
+        지정한 채널로만 메시지 발송
+
+        Args:
+            user: 사용자 객체
+            message: 발송할 메시지
+            channel: 채널명 (kakao / telegram)
+
+        Returns:
+            bool: 발송 성공 여부
+        """
+        sender = self.channels.get(channel)
+        if not sender or not sender.is_available(user):
+            return False
+        return await self._send_with_timeout(channel, user, message)
 
     async def send_to_kakao(self, user: User, message: str) -> bool:
         """
@@ -84,9 +103,7 @@ class NotificationService:
         Returns:
             bool: 발송 성공 여부
         """
-        if not self.kakao_sender.is_available(user):
-            return False
-        return await self.kakao_sender.send_message(user, message)
+        return await self.send_to_channel(user, message, "kakao")
 
     async def send_to_telegram(self, user: User, message: str) -> bool:
         """
@@ -99,9 +116,42 @@ class NotificationService:
         Returns:
             bool: 발송 성공 여부
         """
-        if not self.telegram_sender or not self.telegram_sender.is_available(user):
+        return await self.send_to_channel(user, message, "telegram")
+
+    async def _send_with_timeout(self, channel: str, user: User, message: str) -> bool:
+        """
+        채널 발송 (제한 시간 초과 또는 예외 시 실패 처리)
+        발송 속도 제한에 걸리면 실패하지 않고 차례가 올 때까지 대기 (대기 시간은 제한 시간에 미포함)
+        """
+        sender = self.channels[channel]
+        await rate_limiter.acquire(channel, sender.rate_limit_key(user))
+
+        try:
+            return bool(
+                await asyncio.wait_for(
+                    sender.send_message(user, message),
+                    timeout=self.channel_timeout,
+                )
+            )
+        except asyncio.TimeoutError:
+            print(f"❌ {CHANNEL_DISPLAY_NAMES.get(channel, channel)} 발송 시간 초과 ({self.channel_timeout}초)")
+            return False
+        except Exception as e:
+            print(f"❌ {CHANNEL_DISPLAY_NAMES.get(channel, channel)} 발송 오류: {e}")
             return False
-        return await self.telegram_sender.send_message(user, message)
+
+    def build_result(self, channel_results: Dict[str, bool]) -> NotificationResult:
+        """채널별 발송 결과를 NotificationResult로 병합"""
+        failed_channels = [channel for channel, sent in channel_results.items() if not sent]
+
+        return NotificationResult(
+            success=any(channel_results.values()),
+            kakao_sent=channel_results.get("kakao", False),
+            telegram_sent=channel_results.get("telegram", False),
+            failed_channels=failed_channels,
+            message=self._generate_result_message(channel_results),
+            channel_results=channel_results,
+        )
 
     def get_available_channels(self, user: User) -> List[str]:
         """
@@ -113,47 +163,37 @@ class NotificationService:
         Returns:
             List[str]: 연동된 채널 목록 ['kakao', 'telegram']
         """
-        channels = []
-
-        if self.kakao_sender.is_available(user):
-            channels.append("kakao")
+        return [
+            channel for channel, sender in self.channels.items() if sender.is_available(user)
+        ]
 
-        if self.telegram_sender and self.telegram_sender.is_available(user):
-            channels.append("telegram")
-
-        return channels
-
-    def _generate_result_message(
-        self, kakao_sent: bool, telegram_sent: bool, failed_channels: List[str]
-    ) -> str:
+    def _generate_result_message(self, channel_results: Dict[str, bool]) -> str:
         """
         발송 결과 메시지 생성
 
         Args:
-            kakao_sent: 카카오톡 발송 성공 여부
-            telegram_sent: 텔레그램 발송 성공 여부
-            failed_channels: 실패한 채널 목록
+            channel_results: 채널별 발송 성공 여부
 
         Returns:
             str: 결과 메시지
         """
-        sent_channels = []
-        if kakao_sent:
-            sent_channels.append("카카오톡")
-        if telegram_sent:
-            sent_channels.append("텔레그램")
-
-        if not sent_channels:
+        sent_names = [
+            CHANNEL_DISPLAY_NAMES.get(channel, channel)
+            for channel, sent in channel_results.items()
+            if sent
+        ]
+        failed_names = [
+            CHANNEL_DISPLAY_NAMES.get(channel, channel)
+            for channel, sent in channel_results.items()
+            if not sent
+        ]
+
+        if not sent_names:
             return "알림 발송 실패: 연동된 채널이 없거나 모두 실패했습니다"
 
-        result = f"알림 발송 성공: {', '.join(sent_channels)}"
+        result = f"알림 발송 성공: {', '.join(sent_names)}"
 
-        if failed_channels:
-            failed_names = []
-            if "kakao" in failed_channels:
-                failed_names.append("카카오톡")
-            if "telegram" in failed_channels:
-                failed_names.append("텔레그램")
+        if failed_names:
             result += f" (실패: {', '.join(failed_names)})"
 
         return result
@@ -0,0 +1,239 @@
+"""
+알림 발송 대기열 모듈
+알림을 DB 대기열에 저장한 뒤 발송하고, 실패한 채널은 지수 백오프로 재시도
+"""
+
+import asyncio
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo
+from app.config import settings
+from app.database import SessionLocal
+from app.crud import (
+    create_log,
+    create_outbox_messages,
+    claim_due_outbox_messages,
+    get_user,
+    mark_outbox_failed,
+    mark_outbox_sent,
+    reset_sending_outbox_messages,
+)
+from app.models import NotificationOutbox, User
+from app.services.notification.notification_service import (
+    notification_service,
+    NotificationResult,
+)
+
+
+class NotificationOutboxService:
+    """
+    알림 발송 대기열 서비스
+
+    - send(): 채널별 대기열 등록 후 즉시 1회 발송 시도 (실패 채널은 대기열에 남음)
+    - process_due(): 재시도 시간이 된 항목 발송 (스케줄러에서 주기 실행)
+    - 채널별 발송 속도는 NotificationService의 속도 제한기(토큰 버킷)가 조절
+    - 최대 시도 횟수 초과 시 DEAD 처리 후 로그 기록
+    """
+
+    def __init__(self):
+        self.max_attempts = settings.OUTBOX_MAX_ATTEMPTS
+        self.retry_base_seconds = settings.OUTBOX_RETRY_BASE_SECONDS
+        self.retry_max_seconds = settings.OUTBOX_RETRY_MAX_SECONDS
+        self.batch_size = settings.OUTBOX_BATCH_SIZE
+
+    @staticmethod
+    def _now() -> datetime:
+        """현재 한국 시간 (naive)"""
+        return datetime.now(ZoneInfo("Asia/Seoul")).replace(tzinfo=None)
+
+    def next_retry_at(self, attempts: int, now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        다음 재시도 시간 계산 (지수 백오프 + 지터)
+
+        Args:
+            attempts: 지금까지 시도한 횟수 (실패 포함)
+            now: 기준 시간
+
+        Returns:
+            datetime: 다음 재시도 시간 (최대 시도 횟수 초과 시 None)
+        """
+        if attempts >= self.max_attempts:
+            return None
+
+        delay = min(self.retry_base_seconds * (2 ** (attempts - 1)), self.retry_max_seconds)
+        # 동시에 실패한 항목이 같은 시각에 몰리지 않도록 절반은 무작위 지연
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        return (now or self._now()) + timedelta(seconds=delay)
+
+    def enqueue(
+        self,
+        db,
+        user: User,
+        message: str,
+        category: str,
+        channels: Optional[List[str]] = None,
+    ) -> List[NotificationOutbox]:
+        """
+        알림 대기열 등록 (발송은 process_due에서 수행)
+
+        Args:
+            db: 데이터베이스 세션
+            user: 사용자 객체
+            message: 발송할 메시지
+            category: 알림 카테고리 (memo / finance / ...)
+            channels: 발송 채널 목록 (기본: 연동된 모든 채널)
+
+        Returns:
+            List[NotificationOutbox]: 등록된 대기열 항목 목록
+        """
+        channels = channels or notification_service.get_available_channels(user)
+        if not channels:
+            return []
+
+        return create_outbox_messages(
+            db, user.user_id, channels, category, message, max_attempts=self.max_attempts
+        )
+
+    async def send(self, db, user: User, message: str, category: str) -> NotificationResult:
+        """
+        대기열 등록 후 즉시 발송 시도
+
+        실패한 채널은 대기열에 남아 백오프 후 재발송되므로 메시지가 유실되지 않음
+
+        Args:
+            db: 데이터베이스 세션
+            user: 사용자 객체
+            message: 발송할 메시지
+            category: 알림 카테고리
+
+        Returns:
+            NotificationResult: 1차 발송 결과 (결과 메시지에 재시도 예정 채널 표시)
+        """
+        items = self.enqueue(db, user, message, category)
+        sent = await self._process(db, outbox_ids=[item.outbox_id for item in items])
+        channel_results = {item.channel: sent.get(item.outbox_id, False) for item in items}
+
+        result = notification_service.build_result(channel_results)
+        if result.failed_channels:
+            result.message += " - 재시도 예정"
+        return result
+
+    async def process_due(self) -> int:
+        """
+        재시도 시간이 된 대기열 항목 발송
+
+        Returns:
+            int: 발송 성공 건수
+        """
+        db = SessionLocal()
+        try:
+            sent = await self._process(db)
+            return sum(1 for success in sent.values() if success)
+        finally:
+            db.close()
+
+    def recover(self) -> int:
+        """
+        발송 중(SENDING) 상태로 남은 항목 복구 (앱 시작 시 실행)
+
+        Returns:
+            int: 복구된 항목 수
+        """
+        db = SessionLocal()
+        try:
+            count = reset_sending_outbox_messages(db)
+            if count:
+                print(f"📮 발송 중단된 알림 {count}개 대기열 복구")
+            return count
+        finally:
+            db.close()
+
+    async def _process(self, db, outbox_ids: Optional[List[int]] = None) -> Dict[int, bool]:
+        """
+        대기열 항목 발송 (채널별 동시, 채널 내에서는 순차 발송)
+
+        Args:
+            db: 데이터베이스 세션
+            outbox_ids: 특정 항목만 발송할 경우 ID 목록
+
+        Returns:
+            Dict[int, bool]: outbox_id -> 발송 성공 여부
+        """
+        items = claim_due_outbox_messages(
+            db, self._now(), limit=self.batch_size, outbox_ids=outbox_ids
+        )
+        if not items:
+            return {}
+
+        users: Dict[int, Optional[User]] = {}
+        by_channel: Dict[str, List[NotificationOutbox]] = {}
+        for item in items:
+            if item.user_id not in users:
+                users[item.user_id] = get_user(db, item.user_id)
+            by_channel.setdefault(item.channel, []).append(item)
+
+        results: Dict[int, bool] = {}
+
+        async def drain(channel: str, channel_items: List[NotificationOutbox]):
+            for item in channel_items:
+                sent = await self._deliver(db, item, users.get(item.user_id))
+                results[item.outbox_id] = sent
+
+        await asyncio.gather(
+            *[drain(channel, channel_items) for channel, channel_items in by_channel.items()]
+        )
+        return results
+
+    async def _deliver(self, db, item: NotificationOutbox, user: Optional[User]) -> bool:
+        """대기열 항목 1건 발송 및 결과 기록"""
+        error = None
+        sent = False
+
+        if user is None:
+            error = "사용자를 찾을 수 없습니다"
+        else:
+            try:
+                sent = await notification_service.send_to_channel(user, item.message, item.channel)
+                if not sent:
+                    error = "채널 발송 실패"
+            except Exception as e:
+                error = str(e)
+
+        if sent:
+            mark_outbox_sent(db, item, self._now())
+            return True
+
+        next_attempt_at = self.next_retry_at(item.attempts + 1)
+        mark_outbox_failed(db, item, error, next_attempt_at)
+
+        if next_attempt_at is None:
+            create_log(
+                db,
+                item.category,
+                "FAIL",
+                f"알림 최종 발송 실패 ({item.channel}, outbox_id: {item.outbox_id}, "
+                f"{item.attempts}회 시도): {error}",
+            )
+            print(f"☠️  알림 최종 발송 실패: outbox_id={item.outbox_id} ({item.channel})")
+        else:
+            print(
+                f"🔁 알림 재시도 예정: outbox_id={item.outbox_id} ({item.channel}) "
+                f"- {next_attempt_at.strftime('%H:%M:%S')}"
+            )
+        return False
+
+
+# 싱글톤 인스턴스
+notification_outbox = NotificationOutboxService()
+
+
+# 스케줄러에서 호출할 함수
+def process_notification_outbox_sync():
+    """동기 방식으로 알림 대기열 발송"""
+    from app.services.scheduler import scheduler_service
+
+    try:
+        scheduler_service.run_coroutine(notification_outbox.process_due())
+    except Exception as e:
+        print(f"❌ 알림 대기열 발송 오류: {e}")
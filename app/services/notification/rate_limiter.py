@@ -0,0 +1,155 @@
+"""
+알림 발송 속도 제한 모듈
+채널별/채팅방별 토큰 버킷으로 발송 속도를 제한하고, 429 응답의 retry_after를 반영
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from app.config import settings
+
+
+class TokenBucket:
+    """
+    토큰 버킷
+
+    토큰이 부족하면 실패 대신 대기 시간을 예약하여 순서대로 발송되도록 함
+    (토큰이 음수가 되는 만큼 뒤에 온 요청의 대기 시간이 늘어남)
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        # 429 응답 등으로 발송이 막힌 시각 (time.monotonic)
+        self.blocked_until = 0.0
+
+    def reserve(self, now: float) -> float:
+        """
+        토큰 1개 예약
+
+        Args:
+            now: 현재 시각 (time.monotonic)
+
+        Returns:
+            float: 발송 전 대기해야 하는 시간 (초)
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens -= 1
+
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+    def block(self, now: float, seconds: float):
+        """지정 시간 동안 발송 중단"""
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+
+class RateLimiter:
+    """
+    채널별 속도 제한기
+
+    - 채널 전체 버킷: 봇/앱 단위 전송 한도
+    - 채팅방 버킷: 같은 채팅방(사용자)으로 보내는 전송 한도
+    스레드(웹 루프/스케줄러 루프) 간에 공유되므로 버킷 상태는 스레드 잠금으로 보호
+    """
+
+    def __init__(self, limits: Dict[str, Dict[str, float]]):
+        """
+        Args:
+            limits: 채널별 제한 설정
+                {"telegram": {"rate": 초당 발송 수, "burst": 최대 연속 발송 수,
+                              "chat_rate": 채팅방별 초당 발송 수, "chat_burst": 채팅방별 최대 연속 발송 수}}
+        """
+        self.limits = limits
+        self._buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, channel: str, key: Optional[str]) -> Optional[TokenBucket]:
+        """버킷 조회 (없으면 생성, 제한 설정이 없는 채널은 None)"""
+        limit = self.limits.get(channel)
+        if not limit:
+            return None
+
+        bucket = self._buckets.get((channel, key))
+        if bucket is None:
+            if key is None:
+                bucket = TokenBucket(limit["rate"], limit["burst"])
+            else:
+                bucket = TokenBucket(limit["chat_rate"], limit["chat_burst"])
+            self._buckets[(channel, key)] = bucket
+        return bucket
+
+    def _buckets_for(self, channel: str, key: Optional[str]) -> List[TokenBucket]:
+        """채널 전체 버킷과 채팅방 버킷 목록"""
+        keys = [None, key] if key else [None]
+        return [bucket for bucket in (self._bucket(channel, k) for k in keys) if bucket is not None]
+
+    def reserve(self, channel: str, key: Optional[str] = None) -> float:
+        """
+        채널 및 채팅방 토큰 예약
+
+        Args:
+            channel: 채널명 (kakao / telegram)
+            key: 채팅방 식별자 (chat_id, user_id 등)
+
+        Returns:
+            float: 발송 전 대기 시간 (초)
+        """
+        now = time.monotonic()
+        with self._lock:
+            waits = [bucket.reserve(now) for bucket in self._buckets_for(channel, key)]
+        return max(waits, default=0.0)
+
+    async def acquire(self, channel: str, key: Optional[str] = None) -> float:
+        """
+        발송 가능할 때까지 대기 (한도 초과 시 실패하지 않고 대기열처럼 순서대로 대기)
+
+        Args:
+            channel: 채널명 (kakao / telegram)
+            key: 채팅방 식별자
+
+        Returns:
+            float: 실제 대기한 시간 (초)
+        """
+        wait = self.reserve(channel, key)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def block(self, channel: str, key: Optional[str], retry_after: float):
+        """
+        429 응답의 retry_after 반영 (해당 채팅방 및 채널 전체 발송 중단)
+
+        Args:
+            channel: 채널명
+            key: 채팅방 식별자
+            retry_after: 재시도까지 대기 시간 (초)
+        """
+        now = time.monotonic()
+        with self._lock:
+            for bucket in self._buckets_for(channel, key):
+                bucket.block(now, retry_after)
+        print(f"⏳ {channel} 발송 한도 초과 - {retry_after:.0f}초 후 재개")
+
+
+# 싱글톤 인스턴스
+rate_limiter = RateLimiter(
+    {
+        "telegram": {
+            "rate": settings.TELEGRAM_RATE_PER_SECOND,
+            "burst": settings.TELEGRAM_RATE_BURST,
+            "chat_rate": settings.TELEGRAM_CHAT_RATE_PER_SECOND,
+            "chat_burst": settings.TELEGRAM_CHAT_RATE_BURST,
+        },
+        "kakao": {
+            "rate": settings.KAKAO_RATE_PER_SECOND,
+            "burst": settings.KAKAO_RATE_BURST,
+            "chat_rate": settings.KAKAO_CHAT_RATE_PER_SECOND,
+            "chat_burst": settings.KAKAO_CHAT_RATE_BURST,
+        },
+    }
+)
@@ -3,10 +3,11 @@
 Telegram Bot API를 사용한 메시지 발송
 """
 
-import httpx
 from typing import Optional, Dict
 from app.models import User
 from app.config import settings
+from app.services.http_client import http_clients, get_retry_after
+from app.services.notification.rate_limiter import rate_limiter
 
 
 class TelegramSender:
@@ -40,15 +41,23 @@ class TelegramSender:
                 "parse_mode": "HTML",  # HTML 포맷 지원
             }
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(url, json=data)
-
-                if response.status_code == 200:
-                    print(f"✅ 텔레그램 메시지 발송 성공 (user_id: {user.user_id})")
-                    return True
-                else:
-                    print(f"❌ 텔레그램 메시지 발송 실패: {response.status_code} - {response.text}")
-                    return False
+            client = http_clients.get(url)
+            response = await client.post(url, json=data)
+
+            # 429 응답 시 retry_after만큼 대기 후 1회 재발송
+            if response.status_code == 429:
+                retry_after = get_retry_after(response)
+                rate_limiter.block("telegram", self.rate_limit_key(user), retry_after)
+                if retry_after <= settings.RATE_LIMIT_MAX_RETRY_AFTER:
+                    await rate_limiter.acquire("telegram", self.rate_limit_key(user))
+                    response = await client.post(url, json=data)
+
+            if response.status_code == 200:
+                print(f"✅ 텔레그램 메시지 발송 성공 (user_id: {user.user_id})")
+                return True
+            else:
+                print(f"❌ 텔레그램 메시지 발송 실패: {response.status_code} - {response.text}")
+                return False
 
         except Exception as e:
             print(f"❌ 텔레그램 메시지 발송 실패: {e}")
@@ -64,19 +73,23 @@ class TelegramSender:
         try:
             url = f"{self.base_url}/getMe"
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url)
+            client = http_clients.get(url)
+            response = await client.get(url)
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    print(f"❌ 텔레그램 봇 정보 조회 실패: {response.status_code}")
-                    return None
+            if response.status_code == 200:
+                return response.json()
+            else:
+                print(f"❌ 텔레그램 봇 정보 조회 실패: {response.status_code}")
+                return None
 
         except Exception as e:
             print(f"❌ 텔레그램 봇 정보 조회 실패: {e}")
             return None
 
+    def rate_limit_key(self, user: User) -> str:
+        """발송 속도 제한용 채팅방 식별자"""
+        return str(user.telegram_chat_id)
+
     def is_available(self, user: User) -> bool:
         """
         텔레그램 발송 가능 여부 확인
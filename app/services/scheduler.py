@@ -3,6 +3,9 @@
 APScheduler를 사용한 정기 작업 관리
 """
 
+import asyncio
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.triggers.cron import CronTrigger
@@ -10,10 +13,93 @@ from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from typing import Optional, List, Dict
+from typing import Any, Coroutine, Optional, List, Dict
 from app.config import settings
 
 
+class BackgroundEventLoop:
+    """
+    스케줄러 작업 전용 asyncio 이벤트 루프
+    별도 스레드에서 계속 실행되며, 작업마다 루프를 새로 만들지 않고 코루틴을 제출받아 실행
+    (루프에 묶인 HTTP 연결 풀, 캐시 등을 작업 간에 재사용)
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """실행 중인 이벤트 루프 (미실행 시 None)"""
+        return self._loop if self.is_running() else None
+
+    def is_running(self) -> bool:
+        """루프 스레드 실행 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """루프 스레드 시작"""
+        with self._lock:
+            if self.is_running():
+                return
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+                # 종료 시 남은 작업 정리
+                pending = asyncio.all_tasks(loop)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=run, name="scheduler-loop", daemon=True)
+            self._thread.start()
+            ready.wait()
+
+    def stop(self, timeout: float = 10):
+        """루프 스레드 종료"""
+        with self._lock:
+            if not self.is_running():
+                return
+
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=timeout)
+            self._loop = None
+            self._thread = None
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """
+        코루틴을 루프에서 실행하고 결과 대기 (호출 스레드는 완료까지 대기)
+
+        Args:
+            coro: 실행할 코루틴
+            timeout: 최대 대기 시간 (초, 기본: 제한 없음)
+
+        Returns:
+            코루틴 실행 결과
+        """
+        loop = self.loop
+        if loop is None:
+            raise RuntimeError("이벤트 루프가 실행 중이 아닙니다")
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+
 class SchedulerService:
     """
     스케줄러 관리 서비스
@@ -36,6 +122,9 @@ class SchedulerService:
             timezone=ZoneInfo("Asia/Seoul"),  # 한국 시간대 설정
         )
 
+        # 작업 코루틴 실행용 공유 이벤트 루프
+        self.event_loop = BackgroundEventLoop()
+
         self._running = False
 
     def start(self):
@@ -43,6 +132,7 @@ class SchedulerService:
         스케줄러 시작
         """
         if not self._running:
+            self.event_loop.start()
             self.scheduler.start()
             self._running = True
             print("✅ 스케줄러 시작")
@@ -53,9 +143,26 @@ class SchedulerService:
         """
         if self._running:
             self.scheduler.shutdown()
+            self.event_loop.stop()
             self._running = False
             print("👋 스케줄러 종료")
 
+    def run_coroutine(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """
+        스케줄러 작업에서 비동기 함수 실행
+        공유 이벤트 루프가 실행 중이면 해당 루프에서 실행하고, 아니면 asyncio.run으로 실행
+
+        Args:
+            coro: 실행할 코루틴
+            timeout: 최대 대기 시간 (초, 공유 루프 실행 시에만 적용)
+
+        Returns:
+            코루틴 실행 결과
+        """
+        if self.event_loop.is_running():
+            return self.event_loop.run(coro, timeout=timeout)
+        return asyncio.run(coro)
+
     def is_running(self) -> bool:
         """
         스케줄러 실행 상태 확인
@@ -198,12 +305,12 @@ class SchedulerService:
         job_list = []
 
         for job in jobs:
+            # 스케줄러 시작 전 등록된 Job은 next_run_time 속성이 없음
+            next_run_time = getattr(job, "next_run_time", None)
             job_info = {
                 "id": job.id,
                 "name": job.name,
-                "next_run_time": (
-                    job.next_run_time.isoformat() if job.next_run_time else None
-                ),
+                "next_run_time": next_run_time.isoformat() if next_run_time else None,
                 "trigger": str(job.trigger),
             }
             job_list.append(job_info)
@@ -285,6 +392,38 @@ class SchedulerService:
         finally:
             db.close()
 
+    def setup_outbox_job(self):
+        """
+        알림 발송 대기열 Job 설정
+        1분마다 재시도 시간이 된 알림 발송
+        """
+        from app.services.notification.outbox import process_notification_outbox_sync
+
+        try:
+            self.add_interval_job(
+                func=process_notification_outbox_sync,
+                job_id="notification_outbox",
+                minutes=1,
+            )
+        except Exception as e:
+            print(f"❌ 알림 대기열 Job 등록 실패: {e}")
+
+    def setup_kakao_token_job(self):
+        """
+        카카오 토큰 사전 갱신 Job 설정
+        주기적으로 만료 임박한 카카오 액세스 토큰 갱신
+        """
+        from app.services.auth.kakao_token_manager import refresh_kakao_tokens_sync
+
+        try:
+            self.add_interval_job(
+                func=refresh_kakao_tokens_sync,
+                job_id="kakao_token_refresh",
+                minutes=settings.KAKAO_TOKEN_CHECK_INTERVAL_MINUTES,
+            )
+        except Exception as e:
+            print(f"❌ 카카오 토큰 갱신 Job 등록 실패: {e}")
+
     def update_weather_job(self):
         """
         Weather 설정 변경 시 Job 업데이트
@@ -357,7 +496,7 @@ class SchedulerService:
         """
         Finance 알림 Job 설정
         설정된 시간에 미국/한국 증시 알림 발송 Job 등록
-        가격 알림 체크 Job 등록 (5분마다)
+        가격 알림 체크 Job 등록 (장중에만 시세 조회)
         """
         from app.database import SessionLocal
         from app.crud import get_setting_by_category, get_or_create_user
@@ -416,14 +555,15 @@ class SchedulerService:
             except Exception as e:
                 print(f"❌ KR Market Job 등록 실패: {e}")
 
-            # 가격 알림 체크 Job 등록 (5분마다)
+            # 가격 알림 체크 Job 등록 (장이 열린 시장만 체크, 실시간 시세 스트림 동작 중에는 생략되는 대체 수단)
             try:
+                interval = settings.FINANCE_ALERT_CHECK_FAST_INTERVAL_MINUTES
                 self.add_interval_job(
                     func=check_price_alerts_sync,
                     job_id="finance_price_alert_check",
-                    minutes=5,
+                    minutes=interval,
                 )
-                print(f"✅ 가격 알림 체크 Job 등록: 5분마다 실행")
+                print(f"✅ 가격 알림 체크 Job 등록: {interval}분마다 실행 (장중만 조회)")
             except Exception as e:
                 print(f"❌ 가격 알림 체크 Job 등록 실패: {e}")
 
@@ -6,6 +6,7 @@ CREATE TABLE IF NOT EXISTS users (
     user_id INTEGER PRIMARY KEY AUTOINCREMENT,
     kakao_access_token VARCHAR,
     kakao_refresh_token VARCHAR,
+    kakao_token_expiry DATETIME,
     google_access_token VARCHAR,
     google_refresh_token VARCHAR,
     google_token_expiry DATETIME,
@@ -75,6 +76,63 @@ CREATE TABLE IF NOT EXISTS price_alerts (
     FOREIGN KEY (watchlist_id) REFERENCES watchlists(watchlist_id)
 );
 
+-- price_history 테이블 (일봉 OHLCV)
+CREATE TABLE IF NOT EXISTS price_history (
+    history_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticker VARCHAR(20) NOT NULL,
+    market VARCHAR(10) NOT NULL,
+    date DATE NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL NOT NULL,
+    volume REAL,
+    CONSTRAINT uq_price_history_symbol_date UNIQUE (ticker, market, date)
+);
+
+-- notification_outbox 테이블 (알림 발송 대기열)
+CREATE TABLE IF NOT EXISTS notification_outbox (
+    outbox_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    channel VARCHAR(20) NOT NULL,
+    category VARCHAR(20) NOT NULL,
+    message TEXT NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'PENDING',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 5,
+    last_error TEXT,
+    next_attempt_at DATETIME NOT NULL,
+    created_at DATETIME,
+    sent_at DATETIME,
+    FOREIGN KEY (user_id) REFERENCES users(user_id)
+);
+
+-- calendar_events 테이블 (구글 캘린더 일정 캐시)
+CREATE TABLE IF NOT EXISTS calendar_events (
+    calendar_event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    calendar_id VARCHAR NOT NULL,
+    event_id VARCHAR NOT NULL,
+    start_at DATETIME NOT NULL,
+    end_at DATETIME NOT NULL,
+    event_json TEXT NOT NULL,
+    FOREIGN KEY (user_id) REFERENCES users(user_id),
+    CONSTRAINT uq_calendar_events_event UNIQUE (user_id, calendar_id, event_id)
+);
+
+-- calendar_sync_states 테이블 (캘린더 증분 동기화 상태)
+CREATE TABLE IF NOT EXISTS calendar_sync_states (
+    sync_state_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    calendar_id VARCHAR NOT NULL,
+    sync_token VARCHAR,
+    window_start DATETIME NOT NULL,
+    window_end DATETIME NOT NULL,
+    synced_at DATETIME NOT NULL,
+    FOREIGN KEY (user_id) REFERENCES users(user_id),
+    CONSTRAINT uq_calendar_sync_states_calendar UNIQUE (user_id, calendar_id)
+);
+
 -- 인덱스 생성
 CREATE INDEX IF NOT EXISTS ix_users_user_id ON users(user_id);
 CREATE INDEX IF NOT EXISTS ix_settings_setting_id ON settings(setting_id);
@@ -89,3 +147,9 @@ CREATE INDEX IF NOT EXISTS ix_watchlists_ticker ON watchlists(ticker);
 CREATE INDEX IF NOT EXISTS ix_price_alerts_alert_id ON price_alerts(alert_id);
 CREATE INDEX IF NOT EXISTS ix_price_alerts_user_id ON price_alerts(user_id);
 CREATE INDEX IF NOT EXISTS ix_price_alerts_watchlist_id ON price_alerts(watchlist_id);
+CREATE INDEX IF NOT EXISTS ix_price_history_symbol_date ON price_history(ticker, market, date);
+CREATE INDEX IF NOT EXISTS ix_notification_outbox_outbox_id ON notification_outbox(outbox_id);
+CREATE INDEX IF NOT EXISTS ix_notification_outbox_status_next ON notification_outbox(status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS ix_calendar_events_calendar_event_id ON calendar_events(calendar_event_id);
+CREATE INDEX IF NOT EXISTS ix_calendar_events_calendar_start ON calendar_events(user_id, calendar_id, start_at);
+CREATE INDEX IF NOT EXISTS ix_calendar_sync_states_sync_state_id ON calendar_sync_states(sync_state_id);
@@ -67,7 +67,7 @@ class TestWeatherBot:
         mock_response.json.return_value = {"name": "Seoul", "main": {"temp": 15}}
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -85,7 +85,7 @@ class TestWeatherBot:
         mock_response.text = "Unauthorized"
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -98,7 +98,7 @@ class TestWeatherBot:
         bot = WeatherBot()
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 side_effect=Exception("Network Error")
             )
 
@@ -115,7 +115,7 @@ class TestWeatherBot:
         mock_response.json.return_value = {"list": [{"main": {"temp": 15}}]}
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -124,6 +124,40 @@ class TestWeatherBot:
             assert "list" in result
 
 
+class TestHttpClientRegistry:
+    """HttpClientRegistry 테스트"""
+
+    async def test_client_reused_per_host(self):
+        """같은 호스트는 같은 클라이언트 재사용 테스트"""
+        from app.services.http_client import HttpClientRegistry
+
+        registry = HttpClientRegistry()
+        first = registry.get("https://api.telegram.org/bot1/sendMessage")
+        second = registry.get("https://api.telegram.org/bot1/getMe")
+        other = registry.get("https://kapi.kakao.com/v2/user/me")
+
+        assert first is second
+        assert first is not other
+
+        await registry.aclose()
+        assert first.is_closed and other.is_closed
+
+    def test_client_per_event_loop(self):
+        """이벤트 루프별 클라이언트 분리 테스트"""
+        import asyncio
+        from app.services.http_client import HttpClientRegistry
+
+        registry = HttpClientRegistry()
+
+        async def get_client():
+            return registry.get("https://api.openweathermap.org/data/2.5/weather")
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert first is not second
+
+
 class TestWeatherBotNotification:
     """WeatherBot 알림 발송 테스트"""
 
@@ -153,6 +187,1270 @@ class TestFinanceBot:
         assert FinanceBot is not None
         assert finance_bot is not None
 
+    def test_get_stock_quotes_deduplicates_symbols(self):
+        """동일 종목 중복 제거 및 시장별 일괄 조회 테스트"""
+        import pandas as pd
+        from app.services.bots.finance_bot import FinanceBot
+        from app.services.market import quote_cache
+
+        quote_cache.invalidate()
+        bot = FinanceBot()
+        columns = pd.MultiIndex.from_product([["AAPL", "MSFT"], ["Close", "Volume"]])
+        us_data = pd.DataFrame(
+            [[100.0, 10, 200.0, 20], [110.0, 11, 190.0, 21]], columns=columns
+        )
+        kr_data = pd.DataFrame(
+            {"종가": [70000], "거래량": [1000], "등락률": [0.0]}, index=["005930"]
+        )
+
+        with patch("app.services.bots.finance_bot.yf.download", return_value=us_data) as mock_download, \
+                patch("app.services.bots.finance_bot.stock") as mock_stock:
+            mock_stock.get_market_ohlcv_by_ticker.return_value = kr_data
+            mock_stock.get_market_ticker_name.return_value = "삼성전자"
+
+            quotes = bot.get_stock_quotes([
+                ("AAPL", "US"),
+                ("AAPL", "US"),
+                ("MSFT", "US"),
+                ("005930", "KR"),
+                ("005930", "KR"),
+            ])
+
+        mock_download.assert_called_once()
+        assert mock_download.call_args[0][0] == ["AAPL", "MSFT"]
+        mock_stock.get_market_ohlcv_by_ticker.assert_called_once()
+
+        assert quotes[("AAPL", "US")]["price"] == 110.0
+        assert round(quotes[("AAPL", "US")]["change_percent"], 2) == 10.0
+        assert quotes[("MSFT", "US")]["change"] == -10.0
+        assert quotes[("005930", "KR")]["name"] == "삼성전자"
+        assert quotes[("005930", "KR")]["price"] == 70000
+
+
+    def test_get_symbol_snapshot_single_fetch(self):
+        """스냅샷 조회 시 일봉 1회 조회로 모든 지표 계산 테스트"""
+        import pandas as pd
+        from app.services.bots.finance_bot import FinanceBot
+
+        bot = FinanceBot()
+        closes = [100.0 + i for i in range(30)]
+        hist = pd.DataFrame({
+            "Open": closes,
+            "High": [c + 1 for c in closes],
+            "Low": [c - 1 for c in closes],
+            "Close": closes,
+            "Volume": [1000] * 30,
+        })
+
+        with patch.object(bot, "_fetch_history", return_value=hist) as mock_fetch:
+            snapshot = bot.get_symbol_snapshot("AAPL", "US", include_info=False)
+
+        mock_fetch.assert_called_once()
+        assert snapshot["quote"]["price"] == 129.0
+        assert snapshot["quote"]["change"] == 1.0
+        assert round(snapshot["period_changes"]["weekly"], 4) == round(5 / 124 * 100, 4)
+        assert round(snapshot["period_changes"]["monthly"], 4) == round(21 / 108 * 100, 4)
+        assert snapshot["week_52_range"]["low"] == 99.0
+        assert snapshot["week_52_range"]["high"] == 130.0
+
+
+    async def test_enrich_watchlists_concurrent_with_timeout(self):
+        """관심 종목 동시 조회 및 종목별 제한 시간 테스트 (지연 종목이 다른 종목을 지연시키지 않음)"""
+        import asyncio
+        import threading
+        from types import SimpleNamespace
+        from app.services.bots.finance_bot import FinanceBot
+        from app.services.market.executor import MarketDataExecutor
+
+        bot = FinanceBot()
+        executor = MarketDataExecutor(max_workers=4, provider_limits={"yahoo": 4})
+        release = threading.Event()
+        watchlists = [SimpleNamespace(ticker="SLOW", name="Slow")] + [
+            SimpleNamespace(ticker=f"T{i}", name=f"Name{i}") for i in range(30)
+        ]
+
+        def fake_snapshot(ticker, market, include_info=True):
+            if ticker == "SLOW":
+                release.wait(timeout=5)
+            return {"quote": {"price": 1.0}, "period_changes": {}, "week_52_range": {}}
+
+        with patch.object(bot, "get_symbol_snapshot", side_effect=fake_snapshot), \
+             patch("app.services.bots.finance_bot.market_data_executor", executor), \
+             patch("app.services.bots.finance_bot.settings") as mock_settings:
+            mock_settings.FINANCE_REPORT_MAX_SYMBOLS = 100
+            mock_settings.FINANCE_REPORT_CONCURRENCY = 10
+            mock_settings.FINANCE_REPORT_SYMBOL_TIMEOUT = 0.2
+
+            started = asyncio.get_running_loop().time()
+            results = await bot._enrich_watchlists(watchlists, "US")
+            elapsed = asyncio.get_running_loop().time() - started
+
+        assert [r["ticker"] for r in results] == [f"T{i}" for i in range(30)]
+        assert elapsed < 0.8
+        assert executor.stalled_count("yahoo") == 1
+
+        release.set()
+        executor.shutdown(wait=True)
+        assert executor.stalled_count("yahoo") == 0
+
+    def test_format_alert_digest_pages(self):
+        """발동 알림 병합 및 최대 길이 기준 페이지 분할 테스트"""
+        from app.services.bots.finance_bot import FinanceBot
+
+        messages = [f"[가격 알림] T{i}\n목표가 도달!\n현재가: ${i:,.2f}" for i in range(20)]
+
+        single = FinanceBot.format_alert_digest(messages[:3], 1000)
+        assert len(single) == 1
+        assert single[0].startswith("[가격 알림] 3건 발동\n\n▶ T0")
+
+        pages = FinanceBot.format_alert_digest(messages, 150)
+        assert len(pages) > 1
+        assert all(len(page) <= 150 for page in pages)
+        assert pages[0].startswith(f"[가격 알림] 20건 발동 (1/{len(pages)})")
+        assert sum(page.count("▶ ") for page in pages) == 20
+
+    async def test_alert_digest_window_coalesces(self, db_session, test_user):
+        """묶음 대기 시간 동안 발동 알림을 모아 한 번에 발송하는지 테스트"""
+        from datetime import datetime, timedelta
+        from app.services.bots.finance_bot import FinanceBot
+
+        bot = FinanceBot()
+        entries = [
+            {"alert_id": i, "alert_type": "TARGET_HIGH", "ticker": f"T{i}",
+             "current_price": 10.0, "message": f"[가격 알림] T{i}\n목표가 도달!"}
+            for i in range(3)
+        ]
+
+        with patch.object(bot, "_send_alert_pages", new_callable=AsyncMock) as mock_send:
+            await bot._send_alert_digest(db_session, test_user, entries[:2], {0, 1, 2}, 10)
+            await bot._send_alert_digest(db_session, test_user, entries[1:], {0, 1, 2}, 10)
+            mock_send.assert_not_called()
+
+            # 대기 시간 경과 후 중복 없이 1개 메시지로 발송
+            bot._alert_digest_started[test_user.user_id] = datetime.now() - timedelta(minutes=11)
+            await bot._send_alert_digest(db_session, test_user, [], {0, 1, 2}, 10)
+
+        mock_send.assert_awaited_once()
+        pages, sent_entries = mock_send.await_args.args[2:]
+        assert len(pages) == 1
+        assert pages[0].startswith("[가격 알림] 3건 발동")
+        assert [entry["alert_id"] for entry in sent_entries] == [0, 1, 2]
+        assert test_user.user_id not in bot._alert_digest
+
+
+class TestTradingCalendar:
+    """TradingCalendar 테스트"""
+
+    def test_nyse_holidays_and_half_days(self):
+        """NYSE 휴장일(대체 휴일 포함)과 조기 폐장일 테스트"""
+        from datetime import date
+        from app.services.market.trading_calendar import nyse_half_days, nyse_holidays, trading_calendar
+
+        holidays = nyse_holidays(2026)
+        assert date(2026, 4, 3) in holidays  # Good Friday
+        assert date(2026, 7, 3) in holidays  # 독립기념일(토) 대체
+        assert date(2026, 11, 26) in holidays  # Thanksgiving
+        assert date(2027, 12, 31) not in nyse_holidays(2027)  # 신정(토)은 대체하지 않음
+
+        assert nyse_half_days(2026) == {date(2026, 11, 27), date(2026, 12, 24)}
+        _, close = trading_calendar.session_hours("US", date(2026, 11, 27))
+        assert close.hour == 13
+        assert not trading_calendar.is_trading_day("US", date(2026, 11, 26))
+
+    def test_krx_holidays_and_special_sessions(self):
+        """KRX 명절 휴장, 첫 거래일/수능일 개장 시간 변경 테스트"""
+        from datetime import date
+        from app.services.market.trading_calendar import trading_calendar
+
+        assert not trading_calendar.is_trading_day("KR", date(2026, 2, 17))  # 설날
+        assert not trading_calendar.is_trading_day("KR", date(2026, 12, 31))  # 연말 휴장
+        assert trading_calendar.session_hours("KR", date(2026, 1, 2))[0].hour == 10
+        open_at, close_at = trading_calendar.session_hours("KR", date(2026, 11, 19))
+        assert (open_at.hour, close_at.hour, close_at.minute) == (10, 16, 30)
+
+        # 설 연휴 다음 개장일
+        assert trading_calendar.next_open("KR", datetime(2026, 2, 13, 16, 0)).date() == date(2026, 2, 19)
+        assert trading_calendar.last_session_date("KR", datetime(2026, 2, 18, 12, 0)) == date(2026, 2, 13)
+
+    def test_due_symbols_by_session(self):
+        """장이 열린 시장의 종목만, 개장·폐장 부근은 최소 주기로 조회하는지 테스트"""
+        from datetime import timedelta
+        from zoneinfo import ZoneInfo
+        from app.services.bots.finance_bot import FinanceBot
+        from app.services.market.poll_scheduler import SymbolPollScheduler
+
+        kst = ZoneInfo("Asia/Seoul")
+        bot = FinanceBot()
+        scheduler = SymbolPollScheduler(
+            timedelta(minutes=1), timedelta(minutes=5), timedelta(minutes=30), 3
+        )
+        samsung, apple = ("005930", "KR"), ("AAPL", "US")
+
+        with patch("app.services.bots.finance_bot.poll_scheduler", scheduler):
+            # 2026-10-16(금) 11:00 KST: 한국 장중, 미국 장 마감
+            midday = datetime(2026, 10, 16, 11, 0, tzinfo=kst)
+            assert bot._due_symbols([samsung, apple], midday) == [samsung]
+            scheduler.schedule(samsung, 0.05, midday)
+            assert bot._due_symbols([samsung], midday + timedelta(minutes=2)) == []
+            assert bot._due_symbols([samsung], midday + timedelta(minutes=5)) == [samsung]
+
+            # 폐장 30분 전부터는 예정 시각과 관계없이 1분 주기
+            near_close = datetime(2026, 10, 16, 15, 10, tzinfo=kst)
+            scheduler.schedule(samsung, None, near_close)
+            assert bot._due_symbols([samsung], near_close + timedelta(minutes=1)) == [samsung]
+
+            # 주말에는 조회하지 않음
+            assert bot._due_symbols([samsung, apple], datetime(2026, 10, 17, 11, 0, tzinfo=kst)) == []
+
+
+class TestSymbolPollScheduler:
+    """SymbolPollScheduler 테스트"""
+
+    @pytest.fixture
+    def scheduler(self):
+        from datetime import timedelta
+        from app.services.market.poll_scheduler import SymbolPollScheduler
+
+        return SymbolPollScheduler(
+            timedelta(minutes=1), timedelta(minutes=5), timedelta(minutes=30), 3
+        )
+
+    def test_interval_by_distance_and_volatility(self, scheduler):
+        """임계가에 가깝거나 변동성이 크면 자주, 멀면 드물게 조회하는지 테스트"""
+        from datetime import timedelta
+
+        start = datetime(2026, 10, 16, 10, 0)
+        calm, volatile = ("CALM", "US"), ("WILD", "US")
+        for minute, (calm_price, wild_price) in enumerate([(100.0, 100.0), (100.05, 101.0), (100.0, 100.0)]):
+            now = start + timedelta(minutes=minute)
+            scheduler.observe(calm, calm_price, now)
+            scheduler.observe(volatile, wild_price, now)
+
+        # 변동성을 모르면 기본 주기, 임계가가 없으면 최대 주기, 이미 넘어섰으면 최소 주기
+        assert scheduler.interval_for(("NEW", "US"), 0.01) == timedelta(minutes=5)
+        assert scheduler.interval_for(calm, None) == timedelta(minutes=30)
+        assert scheduler.interval_for(calm, 0) == timedelta(minutes=1)
+
+        near = scheduler.interval_for(calm, 0.003)
+        far = scheduler.interval_for(calm, 0.02)
+        assert timedelta(minutes=1) < near < far == timedelta(minutes=30)
+        assert scheduler.interval_for(volatile, 0.02) < far
+
+    def test_index_nearest_distance(self, db_session, test_user):
+        """알림 인덱스의 가장 가까운 임계가 거리 테스트"""
+        from app import crud
+        from app.services.market.alert_index import AlertIndex
+
+        watchlist = crud.create_watchlist(db_session, test_user.user_id, "AAPL", "Apple", "US")
+        crud.create_price_alert(db_session, test_user.user_id, watchlist.watchlist_id, "TARGET_HIGH", target_price=110.0)
+        crud.create_price_alert(db_session, test_user.user_id, watchlist.watchlist_id, "TARGET_LOW", target_price=95.0)
+        index = AlertIndex()
+        index.ensure_loaded(db_session, test_user.user_id)
+
+        assert index.nearest_distance("AAPL", "US", 100.0) == pytest.approx(0.05)
+        assert index.nearest_distance("AAPL", "US", 108.0) == pytest.approx(2 / 108)
+        assert index.nearest_distance("AAPL", "US", 111.0) == 0.0
+        assert index.nearest_distance("MSFT", "US", 100.0) is None
+
+
+class TestQuoteCache:
+    """QuoteCache 테스트"""
+
+    @pytest.fixture
+    def cache(self):
+        """테스트용 캐시 픽스처"""
+        from app.services.market.quote_cache import QuoteCache
+
+        return QuoteCache(ttl=60, closed_ttl=60, max_size=2)
+
+    def test_hit_and_miss(self, cache):
+        """적중/미적중 카운터 테스트"""
+        assert cache.get("AAPL", "US") is None
+
+        cache.set("AAPL", "US", {"ticker": "AAPL", "price": 100.0})
+        assert cache.get("AAPL", "US")["price"] == 100.0
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_expiry(self, cache):
+        """TTL 만료 테스트"""
+        cache.ttl = cache.closed_ttl = 0
+        cache.set("AAPL", "US", {"ticker": "AAPL", "price": 100.0})
+
+        assert cache.get("AAPL", "US") is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_lru_eviction(self, cache):
+        """최대 크기 초과 시 LRU 제거 테스트"""
+        cache.set("AAPL", "US", {"price": 1})
+        cache.set("MSFT", "US", {"price": 2})
+        cache.get("AAPL", "US")  # AAPL을 최근 사용으로 갱신
+        cache.set("005930", "KR", {"price": 3})
+
+        assert cache.get("MSFT", "US") is None
+        assert cache.get("AAPL", "US") is not None
+        assert cache.get("005930", "KR") is not None
+
+    def test_get_stock_quote_uses_cache(self):
+        """get_stock_quote 캐시 재사용 테스트"""
+        from app.services.bots.finance_bot import FinanceBot
+        from app.services.market import quote_cache
+
+        quote_cache.invalidate()
+        bot = FinanceBot()
+
+        with patch.object(
+            bot, "_get_us_stock_quote", return_value={"ticker": "AAPL", "price": 100.0}
+        ) as mock_fetch:
+            bot.get_stock_quote("AAPL", "US")
+            bot.get_stock_quote("AAPL", "US")
+
+        mock_fetch.assert_called_once()
+        quote_cache.invalidate()
+
+
+class TestHistoryStore:
+    """HistoryStore 테스트"""
+
+    @staticmethod
+    def _bars(start, count, first_close=100.0):
+        """테스트용 일봉 DataFrame 생성"""
+        import pandas as pd
+
+        index = pd.bdate_range(start=start, periods=count)
+        closes = [first_close + i for i in range(count)]
+        return pd.DataFrame({
+            "Open": closes,
+            "High": closes,
+            "Low": closes,
+            "Close": closes,
+            "Volume": [1000] * count,
+        }, index=index)
+
+    @staticmethod
+    def _mock_calendar(mock_calendar):
+        """뉴욕 정규장 시간(09:30 ~ 16:00)을 반환하는 거래 캘린더 목"""
+        from datetime import time
+        from zoneinfo import ZoneInfo
+
+        tz = ZoneInfo("America/New_York")
+        mock_calendar.session_hours.side_effect = lambda market, day: (
+            datetime.combine(day, time(9, 30), tzinfo=tz),
+            datetime.combine(day, time(16, 0), tzinfo=tz),
+        )
+        mock_calendar.is_open.return_value = False
+        return mock_calendar
+
+    def test_incremental_append(self, db_session):
+        """최초 전체 조회 후 신규 일봉만 조회 테스트"""
+        from datetime import date
+        from app.services.market.history_store import HistoryStore
+        from tests.conftest import TestSessionLocal
+
+        store = HistoryStore()
+        downloader = MagicMock(return_value=self._bars("2025-01-01", 10))
+
+        with patch("app.services.market.history_store.SessionLocal", TestSessionLocal), \
+             patch("app.services.market.history_store.trading_calendar") as mock_calendar:
+            self._mock_calendar(mock_calendar)
+            mock_calendar.local_now.return_value = datetime(2025, 1, 15, 20, 0)
+            mock_calendar.last_session_date.return_value = date(2025, 1, 14)
+
+            first = store.get_history("AAPL", "US", 14, downloader)
+            assert len(first) == 10
+            assert downloader.call_args[0][2] == date(2025, 1, 1)
+
+            # 최근 정규장까지 저장되어 있고 장 마감 상태면 다운로드 생략
+            store.get_history("AAPL", "US", 14, downloader)
+            assert downloader.call_count == 1
+
+            # 새 거래일이 생기면 마지막 저장일 직전 확정 일봉부터만 조회
+            mock_calendar.local_now.return_value = datetime(2025, 1, 16, 20, 0)
+            mock_calendar.last_session_date.return_value = date(2025, 1, 15)
+            downloader.return_value = self._bars("2025-01-13", 3, first_close=108.0)
+            latest = store.get_history("AAPL", "US", 14, downloader)
+
+        assert downloader.call_count == 2
+        assert downloader.call_args[0][2] == date(2025, 1, 13)
+        assert latest.index[0].date() == date(2025, 1, 2)
+        assert latest.index[-1].date() == date(2025, 1, 15)
+        assert latest["Close"].iloc[-1] == 110.0
+
+    def test_intraday_bar_refetched_after_close(self, db_session):
+        """장중에 받은 마지막 일봉은 폐장 후 다시 조회하여 확정 종가로 교체하는지 테스트"""
+        from datetime import date
+        from app.services.market.history_store import HistoryStore
+        from tests.conftest import TestSessionLocal
+
+        store = HistoryStore()
+        downloader = MagicMock(return_value=self._bars("2025-01-01", 10))
+
+        with patch("app.services.market.history_store.SessionLocal", TestSessionLocal), \
+             patch("app.services.market.history_store.trading_calendar") as mock_calendar:
+            self._mock_calendar(mock_calendar)
+            # 1월 14일 장중 (마지막 일봉은 미완성)
+            mock_calendar.local_now.return_value = datetime(2025, 1, 14, 11, 0)
+            mock_calendar.last_session_date.return_value = date(2025, 1, 14)
+            store.get_history("AAPL", "US", 14, downloader)
+
+            # 폐장 후에는 마지막 일봉을 다시 조회
+            mock_calendar.local_now.return_value = datetime(2025, 1, 14, 20, 0)
+            final = self._bars("2025-01-13", 2, first_close=108.0)
+            final.loc[final.index[-1], "Close"] = 120.0
+            downloader.return_value = final
+            latest = store.get_history("AAPL", "US", 14, downloader)
+            assert downloader.call_count == 2
+            assert latest["Close"].iloc[-1] == 120.0
+
+            # 폐장 후 받은 일봉은 확정이므로 다시 조회하지 않음
+            mock_calendar.local_now.return_value = datetime(2025, 1, 14, 21, 0)
+            store.get_history("AAPL", "US", 14, downloader)
+
+        assert downloader.call_count == 2
+
+    def test_recent_listing_not_refetched(self, db_session):
+        """조회 기간 중간에 상장한 종목은 저장 범위를 기록하여 전체 조회를 반복하지 않는지 테스트"""
+        from datetime import date
+        from app.services.market.history_store import HistoryStore
+        from tests.conftest import TestSessionLocal
+
+        store = HistoryStore()
+        # 2025년 1월 8일 상장 (365일 조회 기간보다 짧은 이력)
+        downloader = MagicMock(return_value=self._bars("2025-01-08", 6))
+
+        with patch("app.services.market.history_store.SessionLocal", TestSessionLocal), \
+             patch("app.services.market.history_store.trading_calendar") as mock_calendar:
+            self._mock_calendar(mock_calendar)
+            mock_calendar.local_now.return_value = datetime(2025, 1, 15, 20, 0)
+            mock_calendar.last_session_date.return_value = date(2025, 1, 15)
+            store.get_history("NEWCO", "US", 365, downloader)
+            assert downloader.call_args[0][2] == date(2024, 1, 16)
+
+            store.get_history("NEWCO", "US", 365, downloader)
+            assert downloader.call_count == 1
+
+            # 다음 거래일에는 신규 일봉만 조회
+            mock_calendar.local_now.return_value = datetime(2025, 1, 16, 20, 0)
+            mock_calendar.last_session_date.return_value = date(2025, 1, 16)
+            downloader.return_value = self._bars("2025-01-14", 3, first_close=104.0)
+            latest = store.get_history("NEWCO", "US", 365, downloader)
+
+        assert downloader.call_count == 2
+        assert downloader.call_args[0][2] == date(2025, 1, 14)
+        assert len(latest) == 7
+
+    def test_split_rebase_redownloads(self, db_session):
+        """액면분할로 확정 일봉 종가가 바뀌면 전체 기간을 다시 조회해 교체하는지 테스트"""
+        from datetime import date
+        from app.services.market.history_store import HistoryStore
+        from tests.conftest import TestSessionLocal
+
+        store = HistoryStore()
+        downloader = MagicMock(return_value=self._bars("2025-01-01", 10))
+
+        with patch("app.services.market.history_store.SessionLocal", TestSessionLocal), \
+             patch("app.services.market.history_store.trading_calendar") as mock_calendar:
+            self._mock_calendar(mock_calendar)
+            mock_calendar.local_now.return_value = datetime(2025, 1, 15, 20, 0)
+            mock_calendar.last_session_date.return_value = date(2025, 1, 14)
+            store.get_history("AAPL", "US", 14, downloader)
+
+            # 2:1 분할 후 수정주가는 과거 일봉까지 절반으로 바뀜
+            mock_calendar.local_now.return_value = datetime(2025, 1, 16, 20, 0)
+            mock_calendar.last_session_date.return_value = date(2025, 1, 15)
+            split = self._bars("2025-01-01", 11)
+            split[["Open", "High", "Low", "Close"]] /= 2
+            downloader.side_effect = lambda ticker, market, start: split[split.index.date >= start]
+            latest = store.get_history("AAPL", "US", 14, downloader)
+
+        assert downloader.call_count == 3
+        assert downloader.call_args_list[1][0][2] == date(2025, 1, 13)
+        assert downloader.call_args_list[2][0][2] == date(2025, 1, 1)
+        assert latest["Close"].iloc[0] == 50.5
+        assert latest["Close"].iloc[-1] == 55.0
+        assert latest["Close"].tolist() == sorted(latest["Close"].tolist())
+
+
+class TestAlertIndex:
+    """AlertIndex 테스트"""
+
+    @pytest.fixture
+    def alerts(self, db_session, test_user):
+        from app import crud
+
+        apple = crud.create_watchlist(db_session, test_user.user_id, "AAPL", "Apple", "US")
+        samsung = crud.create_watchlist(db_session, test_user.user_id, "005930", "삼성전자", "KR")
+        return {
+            "high": crud.create_price_alert(db_session, test_user.user_id, apple.watchlist_id, "TARGET_HIGH", target_price=200.0),
+            "higher": crud.create_price_alert(db_session, test_user.user_id, apple.watchlist_id, "TARGET_HIGH", target_price=250.0),
+            "low": crud.create_price_alert(db_session, test_user.user_id, apple.watchlist_id, "TARGET_LOW", target_price=80.0),
+            "band": crud.create_price_alert(
+                db_session, test_user.user_id, apple.watchlist_id, "PERCENT_CHANGE", target_percent=10.0, reference_price=100.0
+            ),
+            "unreferenced": crud.create_price_alert(
+                db_session, test_user.user_id, samsung.watchlist_id, "PERCENT_CHANGE", target_percent=5.0
+            ),
+        }
+
+    @staticmethod
+    def crossed_ids(index, user_id, price):
+        return sorted(alert.alert_id for alert in index.crossed(user_id, "AAPL", "US", price))
+
+    def test_crossed_thresholds(self, db_session, test_user, alerts):
+        """정렬된 임계가에서 넘어선 알림만 조회되는지 테스트"""
+        from app.services.market.alert_index import AlertIndex
+
+        index = AlertIndex()
+        index.ensure_loaded(db_session, test_user.user_id)
+
+        assert index.symbols(test_user.user_id) == [("005930", "KR"), ("AAPL", "US")]
+        assert self.crossed_ids(index, test_user.user_id, 175.0) == [alerts["band"].alert_id]
+        assert self.crossed_ids(index, test_user.user_id, 210.0) == sorted(
+            [alerts["high"].alert_id, alerts["band"].alert_id]
+        )
+        assert self.crossed_ids(index, test_user.user_id, 75.0) == sorted(
+            [alerts["low"].alert_id, alerts["band"].alert_id]
+        )
+        # 밴드 경계 (기준가 100 대비 정확히 +10%, -10%)
+        assert self.crossed_ids(index, test_user.user_id, 105.0) == []
+        assert self.crossed_ids(index, test_user.user_id, 110.0) == [alerts["band"].alert_id]
+        assert self.crossed_ids(index, test_user.user_id, 90.0) == [alerts["band"].alert_id]
+        assert [alert.alert_id for alert in index.unreferenced(test_user.user_id, "005930", "KR")] == [
+            alerts["unreferenced"].alert_id
+        ]
+
+    def test_incremental_updates(self, db_session, test_user, alerts):
+        """등록/삭제/기준가 변경이 인덱스에 바로 반영되는지 테스트"""
+        from app import crud
+        from app.services.market.alert_index import AlertIndex
+
+        index = AlertIndex()
+        index.ensure_loaded(db_session, test_user.user_id)
+
+        index.remove(alerts["high"].alert_id)
+        assert alerts["high"].alert_id not in self.crossed_ids(index, test_user.user_id, 210.0)
+
+        index.update_reference(alerts["band"].alert_id, 200.0)
+        assert self.crossed_ids(index, test_user.user_id, 210.0) == []
+
+        watchlist = crud.get_watchlist(db_session, alerts["low"].watchlist_id)
+        new_alert = crud.create_price_alert(
+            db_session, test_user.user_id, watchlist.watchlist_id, "TARGET_LOW", target_price=205.0
+        )
+        index.add(new_alert, watchlist)
+        assert self.crossed_ids(index, test_user.user_id, 205.0) == [new_alert.alert_id]
+
+        index.remove_watchlist(watchlist.watchlist_id)
+        assert index.symbols(test_user.user_id) == [("005930", "KR")]
+
+    async def test_watchlist_rename_updates_index(self, db_session, test_user, alerts):
+        """관심 종목명 수정 API 호출 시 인덱스의 종목명이 갱신되는지 테스트"""
+        from app.routers.finance import WatchlistUpdateRequest, update_user_watchlist
+        from app.services.market.alert_index import AlertIndex
+
+        index = AlertIndex()
+        index.ensure_loaded(db_session, test_user.user_id)
+
+        with patch("app.routers.finance.alert_index", index):
+            response = await update_user_watchlist(
+                alerts["high"].watchlist_id, WatchlistUpdateRequest(name="애플"), db=db_session
+            )
+
+        assert response.status_code == 200
+        names = {alert.name for alert in index.crossed(test_user.user_id, "AAPL", "US", 210.0)}
+        assert names == {"애플"}
+
+    def test_evaluate_matches_crossed(self, db_session, test_user, alerts):
+        """벡터 일괄 평가 결과가 종목별 이진 탐색 결과와 같은지 테스트"""
+        from app.services.market.alert_index import AlertIndex
+
+        index = AlertIndex()
+        index.ensure_loaded(db_session, test_user.user_id)
+
+        for price in (75.0, 90.0, 105.0, 110.0, 175.0, 210.0, 260.0):
+            fired = index.evaluate(test_user.user_id, {("AAPL", "US"): price, ("005930", "KR"): 70000.0})
+            assert sorted(alert.alert_id for alert in fired) == self.crossed_ids(index, test_user.user_id, price)
+
+        # 조회되지 않은 종목, 다른 사용자 알림은 평가하지 않음
+        assert index.evaluate(test_user.user_id, {("005930", "KR"): 70000.0}) == []
+        assert index.evaluate(test_user.user_id + 1, {("AAPL", "US"): 210.0}) == []
+
+        # 삭제/기준가 변경 반영
+        index.remove(alerts["high"].alert_id)
+        index.update_reference(alerts["band"].alert_id, 200.0)
+        assert index.evaluate(test_user.user_id, {("AAPL", "US"): 210.0}) == []
+
+    def test_alert_matrix_bulk(self):
+        """대량 알림 배열 평가가 알림별 조건 계산과 일치하는지 테스트"""
+        import random
+        from app.services.market.alert_evaluator import AlertMatrix
+        from app.services.market.alert_index import IndexedAlert
+
+        rng = random.Random(7)
+        symbols = [(f"T{i:04d}", "US" if i % 2 else "KR") for i in range(500)]
+        alerts = []
+        for alert_id in range(20000):
+            ticker, market = rng.choice(symbols)
+            alert_type = rng.choice(["TARGET_HIGH", "TARGET_LOW", "PERCENT_CHANGE"])
+            percent = alert_type == "PERCENT_CHANGE"
+            alerts.append(IndexedAlert(
+                alert_id=alert_id,
+                user_id=rng.choice([1, 2]),
+                watchlist_id=0,
+                ticker=ticker,
+                market=market,
+                name=None,
+                alert_type=alert_type,
+                target_price=None if percent else rng.uniform(50, 150),
+                target_percent=rng.choice([-1, 1]) * rng.uniform(1, 20) if percent else None,
+                reference_price=rng.choice([None, rng.uniform(50, 150)]) if percent else None,
+            ))
+        prices = {symbol: rng.uniform(50, 150) for symbol in symbols[:400]}
+
+        def expected(user_id):
+            result = []
+            for alert in alerts:
+                price = prices.get((alert.ticker, alert.market))
+                if alert.user_id != user_id or price is None:
+                    continue
+                if alert.alert_type == "TARGET_HIGH":
+                    hit = price >= alert.target_price
+                elif alert.alert_type == "TARGET_LOW":
+                    hit = price <= alert.target_price
+                else:
+                    hit = bool(alert.reference_price) and abs(alert.change_percent(price)) >= abs(alert.target_percent)
+                if hit:
+                    result.append(alert.alert_id)
+            return result
+
+        matrix = AlertMatrix()
+        assert matrix.needs_rebuild()
+        matrix.rebuild(alerts)
+        assert not matrix.needs_rebuild()
+        assert matrix.evaluate(1, prices) == expected(1)
+        assert matrix.evaluate(2, prices) == expected(2)
+
+        # 행 단위 삭제/기준가 변경 (재구성 없이 반영)
+        fired = matrix.evaluate(1, prices)
+        matrix.remove(fired[0])
+        assert fired[0] not in matrix.evaluate(1, prices)
+        band = next(alert for alert in alerts if alert.alert_type == "PERCENT_CHANGE" and alert.user_id == 1
+                    and (alert.ticker, alert.market) in prices)
+        assert matrix.set_reference(band.alert_id, prices[(band.ticker, band.market)])
+        assert band.alert_id not in matrix.evaluate(1, prices)
+        assert not matrix.needs_rebuild()
+        assert not matrix.set_reference(-1, 100.0)
+
+    async def test_check_price_alerts_uses_index(self, db_session, test_user, alerts):
+        """가격 알림 체크가 인덱스로 발동 알림을 찾고 상태를 갱신하는지 테스트"""
+        from app import crud
+        from app.services.bots.finance_bot import FinanceBot
+        from app.services.market.alert_index import AlertIndex
+        from tests.conftest import TestSessionLocal
+
+        bot = FinanceBot()
+        index = AlertIndex()
+        quotes = {("AAPL", "US"): {"price": 210.0}, ("005930", "KR"): {"price": 70000.0}}
+
+        with patch("app.services.bots.finance_bot.SessionLocal", TestSessionLocal), \
+                patch("app.services.bots.finance_bot.alert_index", index), \
+                patch.object(bot, "get_stock_quotes_async", new=AsyncMock(return_value=quotes)), \
+                patch.object(bot, "_get_alert_digest_config", return_value=(True, 0)), \
+                patch.object(bot, "_due_symbols", side_effect=lambda symbols, now: symbols), \
+                patch.object(bot, "_send_alert_pages", new_callable=AsyncMock) as mock_send:
+            await bot.check_price_alerts()
+
+        mock_send.assert_awaited_once()
+        pages, entries = mock_send.await_args.args[2:]
+        assert sorted(entry["alert_id"] for entry in entries) == sorted(
+            [alerts["high"].alert_id, alerts["band"].alert_id]
+        )
+        assert "목표가: $200.00" in pages[0]
+        assert "변동률: +110.00%" in pages[0]
+
+        db_session.expire_all()
+        assert crud.get_price_alert(db_session, alerts["unreferenced"].alert_id).reference_price == 70000.0
+        assert index.unreferenced(test_user.user_id, "005930", "KR") == []
+
+
+class TestQuoteStream:
+    """QuoteStream 테스트"""
+
+    async def test_replay_delivers_subscribed_ticks(self):
+        """재생 어댑터의 시세 중 구독 종목만 순서대로 전달되는지 테스트"""
+        from app.services.market.quote_stream import QuoteStream, ReplayQuoteSource
+
+        received = []
+        stream = QuoteStream()
+        stream.source = ReplayQuoteSource([
+            {"ticker": "AAPL", "market": "US", "price": "201.5"},
+            {"type": "heartbeat"},
+            {"ticker": "MSFT", "market": "US", "price": 400},
+            {"symbol": "AAPL", "market": "US", "price": 199},
+        ])
+
+        async def on_tick(tick):
+            received.append(tick)
+            assert stream._connected
+
+        stream._on_tick = on_tick
+        await stream.consume([("AAPL", "US")])
+
+        assert [tick["price"] for tick in received] == [201.5, 199.0]
+        assert not stream._connected
+
+    async def test_resubscribe_when_symbols_change(self):
+        """구독 종목이 바뀌면 연결을 끊고 재구독하는지 테스트"""
+        import asyncio
+        from app.services.market.quote_stream import QuoteSource, QuoteStream
+
+        class EndlessSource(QuoteSource):
+            async def stream(self, symbols):
+                while True:
+                    await asyncio.sleep(0.01)
+                    yield None
+
+        symbols = [("AAPL", "US")]
+        stream = QuoteStream()
+        stream.source = EndlessSource()
+        stream.resubscribe_interval = 0.05
+        stream._symbols = lambda: symbols
+        stream._on_tick = AsyncMock()
+
+        task = asyncio.ensure_future(stream._consume_until_changed(list(symbols)))
+        await asyncio.sleep(0.1)
+        assert not task.done() and stream._connected
+
+        symbols.append(("MSFT", "US"))
+        assert await asyncio.wait_for(task, 1) is True
+        assert not stream._connected
+
+    async def test_tick_triggers_alert(self, db_session, test_user):
+        """실시간 시세가 임계가를 넘으면 바로 알림이 발송되는지 테스트"""
+        from app import crud
+        from app.services.bots.finance_bot import FinanceBot
+        from app.services.market.alert_index import AlertIndex
+        from app.services.market.quote_stream import QuoteStream, ReplayQuoteSource
+        from tests.conftest import TestSessionLocal
+
+        watchlist = crud.create_watchlist(db_session, test_user.user_id, "AAPL", "Apple", "US")
+        alert = crud.create_price_alert(
+            db_session, test_user.user_id, watchlist.watchlist_id, "TARGET_HIGH", target_price=200.0
+        )
+        index = AlertIndex()
+        index.ensure_loaded(db_session, test_user.user_id)
+
+        bot = FinanceBot()
+        stream = QuoteStream()
+        stream.source = ReplayQuoteSource([
+            {"ticker": "AAPL", "market": "US", "price": price} for price in (195.0, 199.0, 201.0, 202.0)
+        ])
+        stream._on_tick = lambda tick: bot.handle_quote_tick(test_user.user_id, tick)
+
+        with patch("app.services.bots.finance_bot.SessionLocal", TestSessionLocal), \
+                patch("app.services.bots.finance_bot.alert_index", index), \
+                patch.object(bot, "_get_alert_digest_config", return_value=(False, 0)), \
+                patch("app.services.bots.finance_bot.notification_service") as mock_service, \
+                patch("app.services.bots.finance_bot.notification_outbox") as mock_outbox:
+            mock_service.get_available_channels.return_value = ["telegram"]
+            mock_outbox.send = AsyncMock(return_value=MagicMock(success=True, failed_channels=[], message="ok"))
+            await stream.consume([("AAPL", "US")])
+
+        # 201.0에서 한 번 발동 후 인덱스에서 제거되어 202.0에서는 다시 발동되지 않음
+        mock_outbox.send.assert_awaited_once()
+        assert "현재가: $201.00" in mock_outbox.send.await_args.args[2]
+        db_session.expire_all()
+        assert crud.get_price_alert(db_session, alert.alert_id).is_triggered
+        assert index.symbols(test_user.user_id) == []
+
+    async def test_polling_skipped_while_stream_healthy(self, db_session, test_user):
+        """스트림이 동작 중이면 주기 체크에서 시세를 조회하지 않는지 테스트"""
+        from app.services.bots.finance_bot import FinanceBot
+        from tests.conftest import TestSessionLocal
+
+        bot = FinanceBot()
+        with patch("app.services.bots.finance_bot.SessionLocal", TestSessionLocal), \
+                patch("app.services.bots.finance_bot.quote_stream") as mock_stream, \
+                patch("app.services.bots.finance_bot.alert_index"), \
+                patch.object(bot, "get_stock_quotes_async", new_callable=AsyncMock) as mock_quotes:
+            mock_stream.is_healthy.return_value = True
+            await bot.check_price_alerts()
+
+        mock_quotes.assert_not_awaited()
+
+
+class TestTickerDirectory:
+    """TickerDirectory 테스트"""
+
+    @pytest.fixture
+    def directory(self):
+        """테스트용 종목 디렉터리 픽스처"""
+        from app.services.market.ticker_directory import TickerDirectory
+
+        directory = TickerDirectory("KR")
+        directory.build([
+            ("005930", "삼성전자"),
+            ("005935", "삼성전자우"),
+            ("000660", "SK하이닉스"),
+            ("035420", "NAVER"),
+            ("207940", "삼성바이오로직스"),
+        ])
+        return directory
+
+    def test_code_prefix_and_exact(self, directory):
+        """코드 정확 일치 우선 및 접두어 검색 테스트"""
+        results = directory.search("00593")
+        assert [r["ticker"] for r in results] == ["005930", "005935"]
+        assert directory.search("005930")[0]["name"] == "삼성전자"
+
+    def test_name_prefix_and_substring(self, directory):
+        """이름 접두어 우선, 부분 문자열 검색 테스트"""
+        names = [r["name"] for r in directory.search("삼성")]
+        assert names == ["삼성전자", "삼성전자우", "삼성바이오로직스"]
+        assert directory.search("하이닉")[0]["ticker"] == "000660"
+        assert directory.search("naver")[0]["ticker"] == "035420"
+
+    def test_choseong_search(self, directory):
+        """초성 검색 테스트"""
+        results = directory.search("ㅅㅅㅈㅈ")
+        assert [r["ticker"] for r in results] == ["005930", "005935"]
+
+    def test_kr_directory_persisted_per_session(self, tmp_path):
+        """거래일 1회 조회 후 파일 재사용 테스트"""
+        from datetime import date
+        from app.services.market.ticker_directory import KRTickerDirectory
+
+        path = str(tmp_path / "kr_tickers.json")
+        entries = [("005930", "삼성전자")]
+
+        with patch("app.services.market.ticker_directory.trading_calendar") as mock_calendar:
+            mock_calendar.last_session_date.return_value = date(2025, 1, 15)
+
+            first = KRTickerDirectory(path)
+            with patch.object(first, "_download", return_value=entries) as mock_download:
+                first.search("삼성")
+                first.search("005")
+            mock_download.assert_called_once()
+
+            # 같은 거래일에는 저장된 파일에서 로드
+            second = KRTickerDirectory(path)
+            with patch.object(second, "_download") as mock_download:
+                assert second.search("삼성")[0]["ticker"] == "005930"
+            mock_download.assert_not_called()
+
+
+    def test_kr_download_fetches_names_in_bulk(self):
+        """KR 종목 목록을 코드-이름 일괄 조회 1회로 가져오는지 테스트"""
+        import pandas as pd
+        from datetime import date
+        from app.services.market.ticker_directory import KRTickerDirectory
+
+        names = pd.Series({"005930": "삼성전자", "000660": "SK하이닉스"})
+        with patch("app.services.market.ticker_directory.trading_calendar") as mock_calendar, \
+             patch("app.services.market.ticker_directory.krx") as mock_krx, \
+             patch("app.services.market.ticker_directory.stock") as mock_stock:
+            mock_calendar.last_session_date.return_value = date(2025, 1, 15)
+            mock_krx.get_market_ticker_and_name.return_value = names
+            entries = KRTickerDirectory(None)._download()
+
+        mock_krx.get_market_ticker_and_name.assert_called_once_with("20250115", "ALL")
+        mock_stock.get_market_ticker_name.assert_not_called()
+        assert entries == [("005930", "삼성전자"), ("000660", "SK하이닉스")]
+
+    def test_search_during_rebuild_uses_one_snapshot(self, directory):
+        """검색 중 재구성이 일어나도 한 검색은 이전 또는 새 색인 하나만 사용하는지 테스트"""
+        import threading
+        from app.services.market.ticker_directory import TickerDirectory
+
+        old_entries = list(directory.entries)
+        new_entries = [(f"9{i:05d}", f"삼성테스트{i}") for i in range(300)]
+        old_result = [r["ticker"] for r in directory.search("삼성")]
+        rebuilt = TickerDirectory("KR")
+        rebuilt.build(new_entries)
+        new_result = [r["ticker"] for r in rebuilt.search("삼성")]
+        stop = threading.Event()
+        errors = []
+
+        def rebuild():
+            while not stop.is_set():
+                directory.build(new_entries)
+                directory.build(old_entries)
+
+        thread = threading.Thread(target=rebuild)
+        thread.start()
+        try:
+            for _ in range(300):
+                try:
+                    result = [r["ticker"] for r in directory.search("삼성")]
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                assert result in (old_result, new_result)
+        finally:
+            stop.set()
+            thread.join()
+
+        assert errors == []
+
+
+class TestUSTickerDirectory:
+    """USTickerDirectory 테스트"""
+
+    NASDAQ_LISTING = (
+        "Symbol|Security Name|Market Category|Test Issue|Financial Status|Round Lot Size|ETF|NextShares\n"
+        "AAPL|Apple Inc. - Common Stock|Q|N|N|100|N|N\n"
+        "APLE|Apple Hospitality REIT, Inc. - Common Shares|Q|N|N|100|N|N\n"
+        "AMAT|Applied Materials, Inc. - Common Stock|Q|N|N|100|N|N\n"
+        "MSFT|Microsoft Corporation - Common Stock|Q|N|N|100|N|N\n"
+        "ZXZZT|NASDAQ TEST STOCK|G|Y|N|100|N|N\n"
+        "File Creation Time: 0101202500:00|||||||\n"
+    )
+
+    @pytest.fixture
+    def directory(self, tmp_path):
+        """가져오기 완료된 디렉터리 픽스처"""
+        from app.services.market.ticker_directory import USTickerDirectory
+
+        directory = USTickerDirectory(str(tmp_path / "us_tickers.json"))
+        assert directory.import_text(self.NASDAQ_LISTING, source="nasdaqlisted.txt") == 4
+        return directory
+
+    def test_parse_csv_listing(self):
+        """CSV 형식 파싱 및 Yahoo 티커 표기 변환 테스트"""
+        from app.services.market.ticker_directory import USTickerDirectory
+
+        entries = USTickerDirectory.parse_listing("symbol,name\nBRK.B,Berkshire Hathaway\n")
+        assert entries == [("BRK-B", "Berkshire Hathaway")]
+
+    def test_name_search_ranking(self, directory):
+        """회사명 검색 순위 테스트"""
+        results = directory.search("apple")
+        assert [r["ticker"] for r in results][:2] == ["AAPL", "APLE"]
+        assert directory.search("msft")[0]["name"] == "Microsoft Corporation"
+
+    def test_fuzzy_search(self, directory):
+        """오타 검색 테스트"""
+        results = directory.search("microsfot")
+        assert results[0]["ticker"] == "MSFT"
+
+    def test_search_ticker_without_network(self, directory):
+        """US 검색 시 네트워크 조회 없음 테스트"""
+        from app.services.bots.finance_bot import FinanceBot
+
+        bot = FinanceBot()
+        with patch("app.services.bots.finance_bot.us_ticker_directory", directory), \
+             patch("app.services.bots.finance_bot.yf") as mock_yf:
+            results = bot.search_ticker("apple", "US")
+
+        mock_yf.Ticker.assert_not_called()
+        assert results[0]["ticker"] == "AAPL"
+
+    def test_fuzzy_search_during_rebuild(self, directory):
+        """재구성 중에도 접두어/퍼지 검색이 같은 색인 스냅샷을 사용하는지 테스트"""
+        import threading
+        from app.services.market.ticker_directory import USTickerDirectory
+
+        old_entries = list(directory.entries)
+        new_entries = [(f"T{i:04d}", f"Microsoft Test {i}") for i in range(200)]
+        rebuilt = USTickerDirectory(None)
+        rebuilt._loaded = True
+        rebuilt.build(new_entries)
+        expected = (
+            [r["ticker"] for r in directory.search("microsfot")],
+            [r["ticker"] for r in rebuilt.search("microsfot")],
+        )
+        stop = threading.Event()
+
+        def rebuild():
+            while not stop.is_set():
+                directory.build(new_entries)
+                directory.build(old_entries)
+
+        thread = threading.Thread(target=rebuild)
+        thread.start()
+        try:
+            results = [[r["ticker"] for r in directory.search("microsfot")] for _ in range(200)]
+        finally:
+            stop.set()
+            thread.join()
+
+        assert all(result in expected for result in results)
+
+    def test_reload_from_saved_file(self, directory):
+        """저장된 디렉터리 재사용 테스트"""
+        from app.services.market.ticker_directory import USTickerDirectory
+
+        reloaded = USTickerDirectory(directory.path)
+        assert reloaded.search("AMAT")[0]["name"] == "Applied Materials, Inc."
+
+
+class TestMarketDataExecutor:
+    """MarketDataExecutor 테스트"""
+
+    async def test_provider_concurrency_limit(self):
+        """제공자별 동시 호출 수 제한 테스트"""
+        import asyncio
+        import threading
+        import time
+        from app.services.market.executor import MarketDataExecutor
+
+        executor = MarketDataExecutor(max_workers=4, provider_limits={"krx": 1})
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def slow_call():
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.02)
+            with lock:
+                state["running"] -= 1
+            return "ok"
+
+        results = await asyncio.gather(*[executor.run("krx", slow_call) for _ in range(3)])
+        executor.shutdown(wait=True)
+
+        assert results == ["ok", "ok", "ok"]
+        assert state["peak"] == 1
+
+    async def test_busy_provider_does_not_block_others(self):
+        """한 제공자 호출이 밀려 있어도 다른 제공자 호출은 바로 실행되는지 테스트"""
+        import asyncio
+        import time
+        from app.services.market.executor import MarketDataExecutor
+
+        executor = MarketDataExecutor(max_workers=2, provider_limits={"krx": 1, "yahoo": 1})
+        release = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def krx_call():
+            asyncio.run_coroutine_threadsafe(release.wait(), loop).result(timeout=5)
+            return "krx"
+
+        krx_calls = [asyncio.ensure_future(executor.run("krx", krx_call)) for _ in range(4)]
+        started = time.monotonic()
+        assert await asyncio.wait_for(executor.run("yahoo", lambda: "yahoo"), timeout=1) == "yahoo"
+        assert time.monotonic() - started < 1
+
+        release.set()
+        assert await asyncio.gather(*krx_calls) == ["krx"] * 4
+        executor.shutdown(wait=True)
+
+    async def test_stalled_provider_fails_fast(self):
+        """지연 호출이 전용 풀을 모두 점유하면 새 호출은 즉시 시간 초과, 다른 제공자는 정상 실행 테스트"""
+        import asyncio
+        import threading
+        import time
+        from app.services.market.executor import MarketDataExecutor
+
+        executor = MarketDataExecutor(max_workers=2, provider_limits={"krx": 1, "yahoo": 1})
+        release = threading.Event()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.run_with_timeout("krx", 0.1, release.wait, 5)
+        assert executor.stalled_count("krx") == 1
+
+        started = time.monotonic()
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.run_with_timeout("krx", 1, lambda: "krx")
+        assert time.monotonic() - started < 0.1
+        assert await executor.run_with_timeout("yahoo", 1, lambda: "yahoo") == "yahoo"
+
+        release.set()
+        executor.shutdown(wait=True)
+        assert executor.stalled_count("krx") == 0
+        assert await executor.run_with_timeout("krx", 1, lambda: "krx") == "krx"
+        executor.shutdown(wait=True)
+
+    async def test_async_facade_runs_off_event_loop(self):
+        """비동기 조회가 이벤트 루프 스레드 밖에서 실행되는지 테스트"""
+        import threading
+        from app.services.bots.finance_bot import FinanceBot
+
+        bot = FinanceBot()
+        loop_thread = threading.current_thread()
+        call_threads = []
+
+        def fake_quote(ticker, market):
+            call_threads.append(threading.current_thread())
+            return {"ticker": ticker, "price": 1.0}
+
+        with patch.object(bot, "get_stock_quote", side_effect=fake_quote):
+            quote = await bot.get_stock_quote_async("AAPL", "US")
+
+        assert quote["ticker"] == "AAPL"
+        assert call_threads[0] is not loop_thread
+
+
+class TestNotificationService:
+    """NotificationService 채널 동시 발송 테스트"""
+
+    async def test_channels_sent_concurrently_with_timeout(self):
+        """느린 채널이 다른 채널 발송을 지연시키지 않는지 테스트"""
+        import asyncio
+        from app.services.notification.notification_service import NotificationService
+
+        async def slow_send(user, message):
+            await asyncio.sleep(1)
+            return True
+
+        service = NotificationService()
+        service.channel_timeout = 0.1
+        service.kakao_sender = MagicMock()
+        service.kakao_sender.is_available.return_value = True
+        service.kakao_sender.send_message = slow_send
+        service.telegram_sender = MagicMock()
+        service.telegram_sender.is_available.return_value = True
+        service.telegram_sender.send_message = AsyncMock(return_value=True)
+
+        started = asyncio.get_running_loop().time()
+        result = await service.send(MagicMock(), "테스트")
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert elapsed < 0.5
+        assert result.success is True
+        assert result.telegram_sent is True
+        assert result.kakao_sent is False
+        assert result.failed_channels == ["kakao"]
+        assert result.channel_results == {"kakao": False, "telegram": True}
+        assert result.message == "알림 발송 성공: 텔레그램 (실패: 카카오톡)"
+
+
+class TestRateLimiter:
+    """채널별 토큰 버킷 속도 제한 테스트"""
+
+    @pytest.fixture
+    def limiter(self):
+        """테스트용 속도 제한기 픽스처 (채널 초당 10건, 채팅방 초당 1건/연속 2건)"""
+        from app.services.notification.rate_limiter import RateLimiter
+
+        return RateLimiter(
+            {"telegram": {"rate": 10, "burst": 10, "chat_rate": 1, "chat_burst": 2}}
+        )
+
+    def test_burst_then_queued_wait(self, limiter):
+        """한도 초과 요청은 실패하지 않고 대기 시간이 순서대로 늘어나는지 테스트"""
+        waits = [limiter.reserve("telegram", "100") for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(1.0, abs=0.05)
+        assert waits[3] == pytest.approx(2.0, abs=0.05)
+
+        # 다른 채팅방은 채널 전체 한도 내에서 바로 발송
+        assert limiter.reserve("telegram", "200") == 0.0
+        # 제한 설정이 없는 채널은 대기 없음
+        assert limiter.reserve("email", "100") == 0.0
+
+    def test_retry_after_blocks_channel(self, limiter):
+        """429 retry_after 반영 시 같은 채널의 다음 발송이 지연되는지 테스트"""
+        limiter.block("telegram", "100", 5)
+
+        assert limiter.reserve("telegram", "100") == pytest.approx(5.0, abs=0.05)
+        assert limiter.reserve("telegram", "200") == pytest.approx(5.0, abs=0.05)
+
+    async def test_telegram_retries_once_after_429(self, test_user):
+        """텔레그램 429 응답 시 retry_after 대기 후 1회 재발송 테스트"""
+        from app.services.notification.telegram_sender import TelegramSender
+
+        rate_limited = MagicMock(status_code=429)
+        rate_limited.json.return_value = {"ok": False, "parameters": {"retry_after": 0}}
+        ok = MagicMock(status_code=200)
+
+        test_user.telegram_chat_id = "12345"
+        with patch("app.services.notification.telegram_sender.http_clients") as mock_clients:
+            mock_clients.get.return_value.post = AsyncMock(side_effect=[rate_limited, ok])
+            assert await TelegramSender().send_message(test_user, "테스트") is True
+            assert mock_clients.get.return_value.post.await_count == 2
+
+
+class TestNotificationOutbox:
+    """NotificationOutboxService 테스트"""
+
+    @pytest.fixture
+    def outbox(self):
+        """테스트용 대기열 서비스 픽스처"""
+        from app.services.notification.outbox import NotificationOutboxService
+
+        service = NotificationOutboxService()
+        service.max_attempts = 2
+        return service
+
+    async def test_failed_channel_retried_until_sent(self, outbox, db_session, test_user):
+        """실패 채널 재시도 후 발송 완료 테스트"""
+        from datetime import timedelta
+        from app.models import NotificationOutbox
+        from app.services.notification.notification_service import NotificationService
+        from tests.conftest import TestSessionLocal
+
+        with patch("app.services.notification.outbox.notification_service") as mock_service:
+            mock_service.get_available_channels.return_value = ["kakao", "telegram"]
+            mock_service.build_result = NotificationService().build_result
+            mock_service.send_to_channel = AsyncMock(
+                side_effect=lambda user, message, channel: channel == "telegram"
+            )
+
+            result = await outbox.send(db_session, test_user, "가격 알림", "finance")
+
+            assert result.success is True
+            assert result.failed_channels == ["kakao"]
+            assert result.message.endswith("재시도 예정")
+
+            pending = db_session.query(NotificationOutbox).filter_by(channel="kakao").one()
+            assert pending.status == "PENDING"
+            assert pending.attempts == 1
+            assert pending.next_attempt_at > outbox._now()
+
+            # 재시도 시간이 되면 워커가 발송
+            pending.next_attempt_at = outbox._now() - timedelta(seconds=1)
+            db_session.commit()
+            mock_service.send_to_channel = AsyncMock(return_value=True)
+
+            with patch("app.services.notification.outbox.SessionLocal", TestSessionLocal):
+                assert await outbox.process_due() == 1
+
+        db_session.expire_all()
+        statuses = {item.channel: item.status for item in db_session.query(NotificationOutbox)}
+        assert statuses == {"kakao": "SENT", "telegram": "SENT"}
+
+    async def test_dead_letter_after_max_attempts(self, outbox, db_session, test_user):
+        """최대 시도 횟수 초과 시 DEAD 처리 테스트"""
+        from datetime import timedelta
+        from app.models import Log, NotificationOutbox
+        from tests.conftest import TestSessionLocal
+
+        with patch("app.services.notification.outbox.notification_service") as mock_service:
+            mock_service.send_to_channel = AsyncMock(return_value=False)
+            items = outbox.enqueue(db_session, test_user, "메모", "memo", channels=["telegram"])
+
+            with patch("app.services.notification.outbox.SessionLocal", TestSessionLocal):
+                for _ in range(2):
+                    items[0].next_attempt_at = outbox._now() - timedelta(seconds=1)
+                    db_session.commit()
+                    await outbox.process_due()
+                    db_session.expire_all()
+
+        item = db_session.query(NotificationOutbox).one()
+        assert item.status == "DEAD"
+        assert item.attempts == 2
+        assert db_session.query(Log).filter_by(category="memo", status="FAIL").count() == 1
+
+    def test_backoff_grows_with_jitter(self, outbox):
+        """지수 백오프 및 지터 범위 테스트"""
+        from datetime import datetime
+
+        outbox.max_attempts = 10
+        outbox.retry_base_seconds = 60
+        outbox.retry_max_seconds = 600
+        now = datetime(2025, 1, 1, 9, 0)
+
+        for attempts, full_delay in [(1, 60), (2, 120), (3, 240), (6, 600)]:
+            delay = (outbox.next_retry_at(attempts, now) - now).total_seconds()
+            assert full_delay / 2 <= delay <= full_delay
+
+        assert outbox.next_retry_at(10, now) is None
+
 
 class TestCalendarBot:
     """CalendarBot 관련 테스트"""
@@ -185,6 +1483,289 @@ class TestCalendarBot:
         assert "오늘의 일정" in message
         assert "없습니다" in message
 
+    def test_calendar_service_reused_per_credentials(self):
+        """같은 Credentials는 서비스 객체를 재사용하고 정적 discovery로 생성하는지 테스트"""
+        import threading
+        from app.services.auth.google_auth import GoogleAuthService
+
+        service = GoogleAuthService()
+        credentials = service.create_credentials("token", "refresh_token")
+        other = service.create_credentials("token", "refresh_token")
+
+        with patch("app.services.auth.google_auth.build", side_effect=lambda *a, **k: object()) as mock_build:
+            first = service.get_service("calendar", "v3", credentials)
+            assert service.get_service("calendar", "v3", credentials) is first
+            assert service.get_service("calendar", "v3", other) is not first
+
+            # 다른 스레드는 별도 서비스 객체 사용
+            results = []
+            thread = threading.Thread(
+                target=lambda: results.append(service.get_service("calendar", "v3", credentials))
+            )
+            thread.start()
+            thread.join()
+            assert results[0] is not first
+
+        assert mock_build.call_count == 3
+        assert mock_build.call_args.kwargs["static_discovery"] is True
+
+    def test_multiple_calendars_single_batch_request(self):
+        """여러 캘린더를 배치 요청 1회로 조회하고 실패 캘린더만 빈 목록인지 테스트"""
+        import json
+        from googleapiclient.discovery import build
+        from googleapiclient.http import HttpMockSequence
+        from app.services.auth.google_auth import GoogleAuthService
+
+        def part(request_id, status, body):
+            return (
+                f"--batch_boundary\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-base + {request_id}>\r\n\r\n"
+                f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n\r\n{json.dumps(body)}\r\n"
+            )
+
+        batch_body = (
+            part(0, "200 OK", {"items": [{"summary": "팀 미팅"}]})
+            + part(1, "404 Not Found", {"error": {"code": 404, "message": "Not Found"}})
+            + part(2, "200 OK", {"items": []})
+            + "--batch_boundary--"
+        )
+        http = HttpMockSequence([
+            ({"status": "200", "content-type": "multipart/mixed; boundary=batch_boundary"}, batch_body)
+        ])
+        calendar_service = build("calendar", "v3", http=http, static_discovery=True)
+
+        service = GoogleAuthService()
+        with patch.object(service, "get_service", return_value=calendar_service):
+            results = service.get_multiple_calendars_events(
+                MagicMock(), ["primary", "deleted@group.calendar.google.com", "work"]
+            )
+
+        # HttpMockSequence는 응답을 1개만 가지므로 요청이 1회였음을 보장 (다음 페이지 없음)
+        assert results == {
+            "primary": [{"summary": "팀 미팅"}],
+            "deleted@group.calendar.google.com": [],
+            "work": [],
+        }
+
+    def test_sync_multiple_calendars_single_batch(self):
+        """여러 캘린더 동기화를 배치 요청 1회로 처리하고 410은 토큰 만료로 구분하는지 테스트"""
+        import json
+        from googleapiclient.discovery import build
+        from googleapiclient.http import HttpMockSequence
+        from app.services.auth.google_auth import GoogleAuthService, CalendarSyncTokenExpiredError
+
+        def part(request_id, status, body):
+            return (
+                f"--batch_boundary\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-base + {request_id}>\r\n\r\n"
+                f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n\r\n{json.dumps(body)}\r\n"
+            )
+
+        batch_body = (
+            part(0, "200 OK", {"items": [{"id": "a"}], "nextSyncToken": "token-a"})
+            + part(1, "410 Gone", {"error": {"code": 410, "message": "Gone"}})
+            + "--batch_boundary--"
+        )
+        http = HttpMockSequence([
+            ({"status": "200", "content-type": "multipart/mixed; boundary=batch_boundary"}, batch_body)
+        ])
+        calendar_service = build("calendar", "v3", http=http, static_discovery=True)
+
+        service = GoogleAuthService()
+        with patch.object(service, "get_service", return_value=calendar_service):
+            results = service.sync_multiple_calendars(
+                MagicMock(),
+                {"primary": {"time_min": datetime(2025, 1, 1)}, "work": {"sync_token": "old"}},
+            )
+
+        assert results["primary"] == ([{"id": "a"}], "token-a")
+        assert isinstance(results["work"], CalendarSyncTokenExpiredError)
+
+    def test_events_paginated_lazily_with_fields(self):
+        """다음 페이지를 소비할 때 요청하고 필요한 필드만 요청하는지 테스트"""
+        import json
+        from urllib.parse import parse_qs, urlparse
+        from googleapiclient.discovery import build
+        from googleapiclient.http import HttpMockSequence
+        from app.services.auth.google_auth import GoogleAuthService
+
+        pages = [
+            {"items": [{"id": f"e{i}", "summary": f"일정 {i}"} for i in range(10)], "nextPageToken": "p2"},
+            {"items": [{"id": f"e{i}", "summary": f"일정 {i}"} for i in range(10, 15)]},
+        ]
+        http = HttpMockSequence([({"status": "200"}, json.dumps(page)) for page in pages])
+        requested = []
+        original_request = http.request
+
+        def record(uri, *args, **kwargs):
+            requested.append(parse_qs(urlparse(uri).query))
+            return original_request(uri, *args, **kwargs)
+
+        http.request = record
+        calendar_service = build("calendar", "v3", http=http, static_discovery=True)
+
+        service = GoogleAuthService()
+        with patch.object(service, "get_service", return_value=calendar_service):
+            events = service.iter_calendar_events(MagicMock())
+            first = [next(events) for _ in range(10)]
+            assert len(requested) == 1
+            rest = list(events)
+
+        assert [event["id"] for event in first + rest] == [f"e{i}" for i in range(15)]
+        assert len(requested) == 2
+        assert "pageToken" not in requested[0]
+        assert requested[1]["pageToken"] == ["p2"]
+        assert requested[0]["fields"][0].startswith("nextPageToken,items(id,")
+
+    def test_format_calendar_message_from_generator(self, mock_calendar_events):
+        """제너레이터로 전달된 일정도 포맷팅되는지 테스트"""
+        from app.services.bots.calendar_bot import CalendarBot
+
+        bot = CalendarBot()
+        message = bot.format_calendar_message(event for event in mock_calendar_events)
+        empty = bot.format_calendar_message(event for event in [])
+
+        assert "팀 미팅" in message
+        assert "없습니다" in empty
+
+
+class TestCalendarCache:
+    """CalendarCache 증분 동기화 테스트"""
+
+    @pytest.fixture
+    def cache(self):
+        """테스트 DB를 사용하는 일정 캐시 픽스처"""
+        from app.services.calendar_cache import CalendarCache
+        from tests.conftest import TestSessionLocal
+
+        cache = CalendarCache()
+        cache.auth = MagicMock()
+        with patch("app.services.calendar_cache.SessionLocal", TestSessionLocal):
+            yield cache
+
+    @staticmethod
+    def _event(event_id, start, end, summary="일정"):
+        return {
+            "id": event_id,
+            "status": "confirmed",
+            "summary": summary,
+            "start": start,
+            "end": end,
+        }
+
+    def test_full_sync_then_incremental(self, cache, test_user):
+        """전체 동기화 후 캐시 조회, 변경분만 증분 반영 테스트"""
+        from datetime import date, timedelta
+
+        today = date.today()
+        tomorrow = today + timedelta(days=1)
+        meeting = self._event(
+            "meeting",
+            {"dateTime": f"{today}T10:00:00+09:00"},
+            {"dateTime": f"{today}T11:00:00+09:00"},
+            "팀 미팅",
+        )
+        holiday = self._event("holiday", {"date": str(today)}, {"date": str(tomorrow)})
+        later = self._event(
+            "later",
+            {"dateTime": f"{tomorrow}T10:00:00+09:00"},
+            {"dateTime": f"{tomorrow}T11:00:00+09:00"},
+        )
+        cache.auth.sync_calendar_events.return_value = ([meeting, holiday, later], "token-1")
+        cache._now = lambda: datetime.combine(today, datetime.min.time()).replace(hour=8)
+
+        events = cache.get_today_events(None, test_user.user_id, ["primary"])["primary"]
+        assert [event["id"] for event in events] == ["holiday", "meeting"]
+        assert "sync_token" not in cache.auth.sync_calendar_events.call_args.kwargs
+
+        # 재동기화 주기 내에서는 API 호출 없이 캐시 조회
+        cache.get_today_events(None, test_user.user_id, ["primary"])
+        assert cache.auth.sync_calendar_events.call_count == 1
+
+        # 주기 경과 후 syncToken으로 변경분(취소/추가)만 반영
+        cache.max_age = timedelta(0)
+        cancelled = {"id": "meeting", "status": "cancelled"}
+        lunch = self._event(
+            "lunch",
+            {"dateTime": f"{today}T12:00:00+09:00"},
+            {"dateTime": f"{today}T13:00:00+09:00"},
+        )
+        cache.auth.sync_calendar_events.return_value = ([cancelled, lunch], "token-2")
+
+        events = cache.get_today_events(None, test_user.user_id, ["primary"])["primary"]
+        assert cache.auth.sync_calendar_events.call_args.kwargs["sync_token"] == "token-1"
+        assert [event["id"] for event in events] == ["holiday", "lunch"]
+
+    def test_stale_calendars_synced_in_one_batch(self, cache, test_user):
+        """동기화가 필요한 캘린더 여러 개를 배치 요청 1회로 동기화하는지 테스트"""
+        import json
+        from datetime import date
+        from googleapiclient.discovery import build
+        from googleapiclient.http import HttpMockSequence
+        from app.services.auth.google_auth import GoogleAuthService
+
+        today = date.today()
+        calendar_ids = ["primary", "work", "family"]
+
+        def part(request_id, body):
+            return (
+                f"--batch_boundary\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-base + {request_id}>\r\n\r\n"
+                f"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n{json.dumps(body)}\r\n"
+            )
+
+        batch_body = "".join(
+            part(index, {
+                "items": [self._event(calendar_id, {"date": str(today)}, {"date": str(today)})],
+                "nextSyncToken": f"token-{calendar_id}",
+            })
+            for index, calendar_id in enumerate(calendar_ids)
+        ) + "--batch_boundary--"
+        # 응답이 배치 1개뿐이므로 캘린더별 개별 요청이 있으면 실패
+        http = HttpMockSequence([
+            ({"status": "200", "content-type": "multipart/mixed; boundary=batch_boundary"}, batch_body)
+        ])
+        cache.auth = GoogleAuthService()
+        cache._now = lambda: datetime.combine(today, datetime.min.time()).replace(hour=8)
+
+        calendar_service = build("calendar", "v3", http=http, static_discovery=True)
+        with patch.object(cache.auth, "get_service", return_value=calendar_service), \
+                patch.object(calendar_service, "new_batch_http_request",
+                             wraps=calendar_service.new_batch_http_request) as mock_batch:
+            results = cache.get_today_events(None, test_user.user_id, calendar_ids)
+            # 재동기화 주기 내에서는 요청 없이 캐시 조회
+            cached = cache.get_today_events(None, test_user.user_id, calendar_ids)
+
+        mock_batch.assert_called_once()
+        assert {calendar_id: [event["id"] for event in events] for calendar_id, events in results.items()} == {
+            calendar_id: [calendar_id] for calendar_id in calendar_ids
+        }
+        assert cached == results
+
+    def test_expired_sync_token_full_resync(self, cache, test_user):
+        """동기화 토큰 만료(410) 시 전체 재동기화 테스트"""
+        from datetime import date, timedelta
+        from app.services.auth.google_auth import CalendarSyncTokenExpiredError
+
+        today = date.today()
+        old = self._event("old", {"date": str(today)}, {"date": str(today)})
+        new = self._event("new", {"date": str(today)}, {"date": str(today)})
+        cache._now = lambda: datetime.combine(today, datetime.min.time()).replace(hour=8)
+
+        cache.auth.sync_calendar_events.return_value = ([old], "token-1")
+        cache.get_today_events(None, test_user.user_id, ["work"])
+
+        cache.max_age = timedelta(0)
+        cache.auth.sync_calendar_events.side_effect = [
+            CalendarSyncTokenExpiredError("gone"),
+            ([new], "token-2"),
+        ]
+        events = cache.get_today_events(None, test_user.user_id, ["work"])["work"]
+
+        assert [event["id"] for event in events] == ["new"]
+        last_call = cache.auth.sync_calendar_events.call_args
+        assert "time_min" in last_call.kwargs and "sync_token" not in last_call.kwargs
+
 
 class TestMemoBot:
     """MemoBot 관련 테스트"""
@@ -225,6 +225,208 @@ class TestTokenRefreshScenarios:
         is_expired = user.google_token_expiry < datetime.now()
         assert is_expired is True
 
+    @pytest.mark.asyncio
+    async def test_kakao_401_refreshes_once_and_retries(self, db_session, test_user):
+        """카카오 401 응답 시 토큰 1회 갱신 후 재발송 테스트"""
+        from app.services.auth.kakao_auth import KakaoUnauthorizedError
+        from app.services.auth.kakao_token_manager import KakaoTokenManager
+        from app.services.notification.kakao_sender import KakaoSender
+        from tests.conftest import TestSessionLocal
+
+        manager = KakaoTokenManager()
+        manager.auth = MagicMock()
+        manager.auth.refresh_access_token = AsyncMock(
+            return_value={"access_token": "refreshed_token", "expires_in": 21599}
+        )
+        sender = KakaoSender()
+        sender.token_manager = manager
+        sender.kakao_auth = MagicMock()
+        sender.kakao_auth.send_message_to_me = AsyncMock(
+            side_effect=[KakaoUnauthorizedError("expired"), {"result_code": 0}]
+        )
+
+        with patch("app.services.auth.kakao_token_manager.SessionLocal", TestSessionLocal):
+            assert await sender.send_message(test_user, "테스트") is True
+            # 두 번째 발송부터는 캐시된 토큰 사용 (DB 조회/갱신 없음)
+            sender.kakao_auth.send_message_to_me.side_effect = None
+            assert await sender.send_message(test_user, "테스트") is True
+
+        manager.auth.refresh_access_token.assert_awaited_once_with("test_kakao_refresh_token")
+        tokens = [c.args[0] for c in sender.kakao_auth.send_message_to_me.await_args_list]
+        assert tokens == ["test_kakao_access_token", "refreshed_token", "refreshed_token"]
+
+        db_session.expire_all()
+        assert test_user.kakao_access_token == "refreshed_token"
+        assert test_user.kakao_refresh_token == "test_kakao_refresh_token"
+        assert test_user.kakao_token_expiry > datetime.now() + timedelta(hours=5)
+
+    @pytest.mark.asyncio
+    async def test_kakao_expiring_token_refreshed_ahead(self, db_session, test_user):
+        """만료 임박 카카오 토큰 사전 갱신 테스트"""
+        from app import crud
+        from app.services.auth.kakao_token_manager import KakaoTokenManager
+        from tests.conftest import TestSessionLocal
+
+        manager = KakaoTokenManager()
+        manager.auth = MagicMock()
+        manager.auth.refresh_access_token = AsyncMock(
+            return_value={
+                "access_token": "renewed_token",
+                "refresh_token": "renewed_refresh_token",
+                "expires_in": 21599,
+            }
+        )
+
+        # 만료까지 여유가 있으면 갱신하지 않음
+        crud.update_user_kakao_tokens(
+            db_session, test_user.user_id, "valid_token", "refresh_token",
+            datetime.now() + timedelta(hours=5),
+        )
+        with patch("app.services.auth.kakao_token_manager.SessionLocal", TestSessionLocal):
+            assert await manager.refresh_expiring() == 0
+
+            crud.update_user_kakao_tokens(
+                db_session, test_user.user_id, "expiring_token", "refresh_token",
+                datetime.now() + timedelta(minutes=10),
+            )
+            assert await manager.refresh_expiring() == 1
+            assert await manager.get_access_token(test_user) == "renewed_token"
+
+        db_session.expire_all()
+        assert test_user.kakao_refresh_token == "renewed_refresh_token"
+
+    def test_kakao_refresh_single_flight_across_loops(self, db_session, test_user):
+        """두 이벤트 루프에서 동시에 갱신해도 Refresh Token은 1회만 사용하는지 테스트"""
+        import asyncio
+        import threading
+        from app.services.auth.kakao_token_manager import KakaoTokenManager
+        from tests.conftest import TestSessionLocal
+
+        manager = KakaoTokenManager()
+        manager.auth = MagicMock()
+
+        async def slow_refresh(refresh_token):
+            await asyncio.sleep(0.2)
+            return {"access_token": "refreshed_token", "refresh_token": "rotated_refresh", "expires_in": 21599}
+
+        manager.auth.refresh_access_token = AsyncMock(side_effect=slow_refresh)
+        results = []
+
+        def refresh_in_new_loop():
+            results.append(asyncio.run(
+                manager.refresh(test_user.user_id, stale_token="test_kakao_access_token")
+            ))
+
+        with patch("app.services.auth.kakao_token_manager.SessionLocal", TestSessionLocal):
+            threads = [threading.Thread(target=refresh_in_new_loop) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        assert results == ["refreshed_token", "refreshed_token"]
+        manager.auth.refresh_access_token.assert_awaited_once_with("test_kakao_refresh_token")
+        db_session.expire_all()
+        assert test_user.kakao_refresh_token == "rotated_refresh"
+
+    def test_google_credentials_single_flight_refresh(self, db_session, test_user):
+        """동시 요청 시 구글 토큰 1회만 갱신 및 변경 시에만 저장 테스트"""
+        import threading
+        import time
+        from app import crud
+        from app.services.auth.google_auth import GoogleAuthService
+        from app.services.auth.google_credentials_manager import GoogleCredentialsManager
+
+        crud.update_user_google_tokens(
+            db_session, test_user.user_id, "expired_token", "refresh_token",
+            datetime.utcnow() - timedelta(minutes=1),
+        )
+
+        def fake_refresh(credentials):
+            time.sleep(0.1)
+            credentials.token = "fresh_token"
+            credentials.expiry = datetime.utcnow() + timedelta(hours=1)
+            return credentials
+
+        manager = GoogleCredentialsManager()
+        manager.auth = MagicMock()
+        manager.auth.create_credentials = GoogleAuthService().create_credentials
+        manager.auth.refresh_credentials = MagicMock(side_effect=fake_refresh)
+
+        results = []
+        with patch(
+            "app.services.auth.google_credentials_manager.update_user_google_tokens"
+        ) as mock_update:
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(manager.get_credentials(db_session, test_user))
+                )
+                for _ in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            manager.auth.refresh_credentials.assert_called_once()
+            mock_update.assert_called_once()
+            assert mock_update.call_args.args[2] == "fresh_token"
+            assert {id(credentials) for credentials in results} == {id(results[0])}
+
+            # 갱신 결과 토큰이 같으면 DB 저장 생략
+            results[0].expiry = datetime.utcnow()
+            manager.auth.refresh_credentials = MagicMock(side_effect=lambda c: c)
+            manager.get_credentials(db_session, test_user)
+            manager.auth.refresh_credentials.assert_called_once()
+            mock_update.assert_called_once()
+
+
+    async def test_google_credentials_async_refresh_keeps_loop_responsive(self, db_session, test_user):
+        """비동기 조회 시 토큰 갱신이 이벤트 루프를 막지 않고 1회만 실행되는지 테스트"""
+        import asyncio
+        import time
+        from app import crud
+        from app.services.auth.google_auth import GoogleAuthService
+        from app.services.auth.google_credentials_manager import GoogleCredentialsManager
+
+        crud.update_user_google_tokens(
+            db_session, test_user.user_id, "expired_token", "refresh_token",
+            datetime.utcnow() - timedelta(minutes=1),
+        )
+
+        def slow_refresh(credentials):
+            time.sleep(0.3)
+            credentials.token = "fresh_token"
+            credentials.expiry = datetime.utcnow() + timedelta(hours=1)
+            return credentials
+
+        manager = GoogleCredentialsManager()
+        manager.auth = MagicMock()
+        manager.auth.create_credentials = GoogleAuthService().create_credentials
+        manager.auth.refresh_credentials = MagicMock(side_effect=slow_refresh)
+
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        with patch("app.services.auth.google_credentials_manager.update_user_google_tokens"):
+            ticker = asyncio.create_task(heartbeat())
+            results = await asyncio.gather(*[
+                manager.get_credentials_async(db_session, test_user) for _ in range(3)
+            ])
+            ticker.cancel()
+
+        assert {credentials.token for credentials in results} == {"fresh_token"}
+        manager.auth.refresh_credentials.assert_called_once()
+        assert ticks >= 10
+
+        # 유효한 캐시는 스레드 전환 없이 그대로 반환
+        assert await manager.get_credentials_async(db_session, test_user) is results[0]
+
 
 class TestErrorHandling:
     """에러 핸들링 테스트"""
@@ -241,7 +443,7 @@ class TestErrorHandling:
             mock_response = MagicMock()
             mock_response.status_code = 500
             mock_response.text = "Internal Server Error"
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 return_value=mock_response
             )
 
@@ -258,7 +460,7 @@ class TestErrorHandling:
 
         # 네트워크 오류 모킹
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 side_effect=httpx.RequestError("Connection failed")
             )
 
@@ -277,7 +479,7 @@ class TestErrorHandling:
             mock_response = MagicMock()
             mock_response.status_code = 401
             mock_response.json.return_value = {"error": "invalid_token"}
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -321,7 +523,7 @@ class TestErrorHandling:
 
         # 타임아웃 모킹
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 side_effect=asyncio.TimeoutError()
             )
 
@@ -7,7 +7,7 @@ import pytest
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
-from app.services.scheduler import SchedulerService
+from app.services.scheduler import BackgroundEventLoop, SchedulerService
 
 
 class TestSchedulerService:
@@ -21,6 +21,7 @@ class TestSchedulerService:
 
         service = SchedulerService.__new__(SchedulerService)
         service.scheduler = BackgroundScheduler()
+        service.event_loop = BackgroundEventLoop()
         service._running = False
         return service
 
@@ -273,6 +274,32 @@ class TestSchedulerService:
         scheduler.shutdown()
 
 
+    def test_run_coroutine_reuses_shared_loop(self, scheduler):
+        """공유 이벤트 루프에서 코루틴 실행 테스트"""
+        import asyncio
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        scheduler.start()
+        try:
+            first = scheduler.run_coroutine(current_loop())
+            second = scheduler.run_coroutine(current_loop())
+        finally:
+            scheduler.shutdown()
+
+        assert first is second
+        assert scheduler.event_loop.is_running() is False
+
+    def test_run_coroutine_without_shared_loop(self, scheduler):
+        """공유 루프 미실행 시 asyncio.run 대체 실행 테스트"""
+
+        async def add(a, b):
+            return a + b
+
+        assert scheduler.run_coroutine(add(1, 2)) == 3
+
+
 class TestSchedulerServiceSingleton:
     """싱글톤 인스턴스 테스트"""
 